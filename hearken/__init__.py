@@ -15,13 +15,30 @@ from .types import (
     VADResult,
     DetectorConfig,
     DetectorState,
+    MergeConfig,
+    WatchdogConfig,
+    VADSwitch,
 )
 
 # Interfaces
-from .interfaces import AudioSource, Transcriber, VAD
+from .interfaces import AudioSource, Transcriber, TranscriptionStream, VAD
+
+# Audio sources
+from .sources.callback import CallbackAudioSource
+from .sources.file import FileAudioSource
+from .sources.pipe import PipeAudioSource
+from .sources.replay import ReplayAudioSource
+
+# Capture recording
+from .recording import CaptureRecorder
+
+# Process-pool detection
+from .detector_pool import DetectorPool
 
 # VAD implementations
 from .vad.energy import EnergyVAD
+from .vad.spectral import SpectralVAD
+from .vad.smoothed import SmoothedVAD
 
 try:
     from .vad.webrtc import WebRTCVAD
@@ -46,12 +63,27 @@ __all__ = [
     "VADResult",
     "DetectorConfig",
     "DetectorState",
+    "MergeConfig",
+    "WatchdogConfig",
+    "VADSwitch",
     # Interfaces
     "AudioSource",
     "Transcriber",
+    "TranscriptionStream",
     "VAD",
+    # Audio sources
+    "CallbackAudioSource",
+    "FileAudioSource",
+    "PipeAudioSource",
+    "ReplayAudioSource",
+    # Capture recording
+    "CaptureRecorder",
+    # Process-pool detection
+    "DetectorPool",
     # VAD implementations
     "EnergyVAD",
+    "SpectralVAD",
+    "SmoothedVAD",
 ]
 
 if _webrtc_available:
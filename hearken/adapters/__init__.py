@@ -1,8 +1,12 @@
 """Adapters for third-party libraries."""
 
+from .http import HTTPTranscriber
+
+__all__ = ['HTTPTranscriber']
+
 # Speech recognition adapters (optional dependency)
 try:
     from .sr import SpeechRecognitionSource, SRTranscriber
-    __all__ = ['SpeechRecognitionSource', 'SRTranscriber']
+    __all__ += ['SpeechRecognitionSource', 'SRTranscriber']
 except ImportError:
-    __all__ = []
+    pass
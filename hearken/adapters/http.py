@@ -0,0 +1,314 @@
+"""
+Generic HTTP transcriber for REST speech-to-text APIs.
+
+Uses only the standard library, so it's always available.
+"""
+
+import base64
+import http.client
+import json
+import logging
+import queue
+import urllib.parse
+from typing import Any, Callable, Iterator, Optional
+
+from ..encoding import get_payload
+from ..interfaces import Transcriber, TranscriptionStream
+from ..types import SpeechSegment
+
+logger = logging.getLogger("hearken")
+
+# Errors raised when the server has closed an idle keep-alive connection
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+_CONTENT_TYPES = {
+    "wav": "audio/wav",
+    "flac": "audio/flac",
+}
+
+
+class HTTPTranscriber(Transcriber):
+    """
+    Transcribes segments by POSTing audio to an HTTP endpoint.
+
+    Keeps a pool of persistent (keep-alive) connections, so segments after
+    the first skip TCP and TLS setup. Size `pool_size` to the Listener's
+    `transcribe_workers` so every worker holds its own connection.
+
+    The request body is either the encoded audio itself or a JSON object
+    with the audio base64-encoded in `json_field`. The transcript is read
+    from the JSON response at the dotted `response_field` path, or by a
+    custom `parse_response`.
+
+    With `audio_format="pcm"` and no `json_field`, utterances can also be
+    uploaded while they are spoken (`Listener(stream_uploads=True)`) using
+    chunked transfer encoding.
+
+    Example:
+        transcriber = HTTPTranscriber(
+            "https://stt.example.com/v1/recognize",
+            headers={"Authorization": f"Bearer {token}"},
+            audio_format="flac",
+            response_field="results.0.transcript",
+            pool_size=2,
+        )
+
+        listener = Listener(source=..., transcriber=transcriber, transcribe_workers=2)
+    """
+
+    def __init__(
+        self,
+        url: str,
+        method: str = "POST",
+        headers: Optional[dict[str, str]] = None,
+        audio_format: str = "wav",
+        json_field: Optional[str] = None,
+        json_body: Optional[dict[str, Any]] = None,
+        response_field: Optional[str] = "text",
+        parse_response: Optional[Callable[[bytes], str]] = None,
+        pool_size: int = 1,
+        timeout: float = 30.0,
+        stream: bool = False,
+        chunk_size: int = 16384,
+    ):
+        """
+        Args:
+            url: Endpoint URL (http or https)
+            method: HTTP method
+            headers: Extra request headers (e.g. authorization)
+            audio_format: "pcm" for raw samples, or a format registered in
+                hearken.encoding.ENCODERS ("wav", "flac")
+            json_field: Send a JSON body with base64 audio in this field
+                (None = send the audio as the raw body)
+            json_body: Extra fields for the JSON body (e.g. language, model)
+            response_field: Dotted path to the transcript in the JSON response
+                (None = use the whole response body as text)
+            parse_response: Custom response parser, overrides response_field
+            pool_size: Number of persistent connections
+            timeout: Socket timeout in seconds
+            stream: Send the body with chunked transfer encoding
+            chunk_size: Bytes per chunk when streaming
+
+        Raises:
+            ValueError: If the URL scheme, host or pool size is invalid
+        """
+        parsed = urllib.parse.urlsplit(url)
+        if parsed.scheme not in ("http", "https"):
+            raise ValueError(f"URL scheme must be http or https, got {parsed.scheme!r}")
+
+        if not parsed.hostname:
+            raise ValueError(f"URL has no host: {url!r}")
+
+        if pool_size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {pool_size}")
+
+        if chunk_size < 1:
+            raise ValueError(f"Chunk size must be at least 1, got {chunk_size}")
+
+        self.url = url
+        self.method = method
+        self.headers = dict(headers or {})
+        self.audio_format = audio_format
+        self.json_field = json_field
+        self.json_body = dict(json_body or {})
+        self.response_field = response_field
+        self.parse_response = parse_response
+        self.timeout = timeout
+        self.stream = stream
+        self.chunk_size = chunk_size
+
+        self._scheme = parsed.scheme
+        self._host = parsed.hostname
+        self._port = parsed.port
+        self._path = parsed.path or "/"
+        if parsed.query:
+            self._path += f"?{parsed.query}"
+
+        # Connections don't open until first use; get() blocks when all are busy
+        self._pool: queue.LifoQueue[http.client.HTTPConnection] = queue.LifoQueue()
+        for _ in range(pool_size):
+            self._pool.put(self._new_connection())
+
+    def transcribe(self, segment: SpeechSegment) -> str:
+        """
+        Transcribe a segment over a pooled connection.
+
+        Args:
+            segment: Speech segment to transcribe
+
+        Returns:
+            Transcribed text
+
+        Raises:
+            RuntimeError: If the server responds with a non-2xx status
+            OSError: If the connection fails
+        """
+        body, content_type = self._build_body(segment)
+        headers = {"Content-Type": content_type, **self.headers}
+        return self._parse(self._send(body, headers))
+
+    def open_stream(self, sample_rate: int, sample_width: int) -> TranscriptionStream:
+        """
+        Start a chunked upload for an utterance in progress.
+
+        Raises:
+            ValueError: If the request format can't be streamed
+        """
+        if not self.supports_streaming:
+            raise ValueError("Streaming requires audio_format='pcm' and no json_field")
+
+        content_type = f"audio/L{8 * sample_width}; rate={sample_rate}"
+        headers = {"Content-Type": content_type, **self.headers}
+        return _HTTPStream(self, headers)
+
+    @property
+    def supports_streaming(self) -> bool:
+        return self.audio_format == "pcm" and self.json_field is None
+
+    def close(self) -> None:
+        """Close all idle pooled connections."""
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        if self._scheme == "https":
+            return http.client.HTTPSConnection(self._host, self._port, timeout=self.timeout)
+        return http.client.HTTPConnection(self._host, self._port, timeout=self.timeout)
+
+    def _send(self, body: bytes, headers: dict[str, str]) -> bytes:
+        """Send a request on a pooled connection and return the response body."""
+        conn = self._pool.get()
+        try:
+            try:
+                return self._request(conn, body, headers)
+            except _STALE_CONNECTION_ERRORS as e:
+                # The server dropped an idle keep-alive connection; retry once fresh
+                logger.debug(f"Reconnecting after stale connection: {e!r}")
+                conn.close()
+                return self._request(conn, body, headers)
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            raise
+        finally:
+            self._pool.put(conn)
+
+    def _request(
+        self, conn: http.client.HTTPConnection, body: bytes, headers: dict[str, str]
+    ) -> bytes:
+        if self.stream:
+            conn.request(
+                self.method,
+                self._path,
+                body=self._chunks(body),
+                headers=headers,
+                encode_chunked=True,
+            )
+        else:
+            conn.request(self.method, self._path, body=body, headers=headers)
+
+        response = conn.getresponse()
+        data = response.read()  # Drain fully so the connection can be reused
+
+        if not 200 <= response.status < 300:
+            raise RuntimeError(f"HTTP {response.status} {response.reason}: {data[:200]!r}")
+
+        return data
+
+    def _chunks(self, body: bytes) -> Iterator[memoryview]:
+        view = memoryview(body)
+        for start in range(0, len(view), self.chunk_size):
+            yield view[start : start + self.chunk_size]
+
+    def _build_body(self, segment: SpeechSegment) -> tuple[bytes, str]:
+        """Return the request body and its content type."""
+        if self.audio_format == "pcm":
+            audio = segment.audio_data
+            content_type = f"audio/L{8 * segment.sample_width}; rate={segment.sample_rate}"
+        else:
+            audio = get_payload(segment, self.audio_format)
+            content_type = _CONTENT_TYPES.get(self.audio_format, "application/octet-stream")
+
+        if self.json_field is None:
+            return audio, content_type
+
+        payload = {**self.json_body, self.json_field: base64.b64encode(audio).decode("ascii")}
+        return json.dumps(payload).encode("utf-8"), "application/json"
+
+    def _parse(self, data: bytes) -> str:
+        if self.parse_response is not None:
+            return self.parse_response(data)
+
+        if self.response_field is None:
+            return data.decode("utf-8")
+
+        value: Any = json.loads(data)
+        for key in self.response_field.split("."):
+            if isinstance(value, list):
+                value = value[int(key)]
+            else:
+                value = value[key]
+        return str(value)
+
+
+class _HTTPStream(TranscriptionStream):
+    """Chunked upload of one utterance over a pooled connection."""
+
+    def __init__(self, transcriber: HTTPTranscriber, headers: dict[str, str]):
+        self._transcriber = transcriber
+        self._conn: Optional[http.client.HTTPConnection] = transcriber._pool.get()
+        try:
+            self._conn.putrequest(transcriber.method, transcriber._path)
+            for name, value in headers.items():
+                self._conn.putheader(name, value)
+            self._conn.putheader("Transfer-Encoding", "chunked")
+            self._conn.endheaders()
+        except BaseException:
+            self.abort()
+            raise
+
+    def write(self, data: bytes) -> None:
+        if data:
+            self._open_conn().send(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+
+    def finish(self, segment: SpeechSegment) -> str:
+        conn = self._open_conn()
+        try:
+            conn.send(b"0\r\n\r\n")
+            response = conn.getresponse()
+            data = response.read()
+        except _STALE_CONNECTION_ERRORS as e:
+            # The pooled connection was dropped while idle; send the segment whole
+            logger.debug(f"Stream connection was stale, sending segment in one shot: {e!r}")
+            self.abort()
+            return self._transcriber.transcribe(segment)
+        except BaseException:
+            self.abort()
+            raise
+
+        self._release()
+        if not 200 <= response.status < 300:
+            raise RuntimeError(f"HTTP {response.status} {response.reason}: {data[:200]!r}")
+        return self._transcriber._parse(data)
+
+    def abort(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._release()
+
+    def _open_conn(self) -> http.client.HTTPConnection:
+        if self._conn is None:
+            raise RuntimeError("HTTP stream is already finished")
+        return self._conn
+
+    def _release(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            self._transcriber._pool.put(conn)
@@ -26,10 +26,42 @@ except ImportError:
             pass
 
 
+from typing import Optional
+
 from ..interfaces import AudioSource, Transcriber
 from ..types import SpeechSegment
 
 
+class _PreEncodedAudioData(sr.AudioData):
+    """AudioData that serves payloads already encoded by hearken.encoding."""
+
+    def __init__(self, segment: SpeechSegment):
+        super().__init__(segment.audio_data, segment.sample_rate, segment.sample_width)
+        self._payloads = segment.payloads
+
+    def _native(self, convert_rate: Optional[int], convert_width: Optional[int]) -> bool:
+        return convert_rate in (None, self.sample_rate) and convert_width in (
+            None,
+            self.sample_width,
+        )
+
+    def get_flac_data(
+        self, convert_rate: Optional[int] = None, convert_width: Optional[int] = None
+    ) -> bytes:
+        if "flac" in self._payloads and self._native(convert_rate, convert_width):
+            return self._payloads["flac"]
+        data: bytes = super().get_flac_data(convert_rate, convert_width)
+        return data
+
+    def get_wav_data(
+        self, convert_rate: Optional[int] = None, convert_width: Optional[int] = None
+    ) -> bytes:
+        if "wav" in self._payloads and self._native(convert_rate, convert_width):
+            return self._payloads["wav"]
+        data: bytes = super().get_wav_data(convert_rate, convert_width)
+        return data
+
+
 class SpeechRecognitionSource(AudioSource):
     """
     Adapter for speech_recognition.Microphone.
@@ -141,8 +173,11 @@ class SRTranscriber(Transcriber):
         Raises:
             Exception: If transcription fails (network error, etc.)
         """
-        # Convert SpeechSegment to sr.AudioData
-        audio_data = sr.AudioData(segment.audio_data, segment.sample_rate, segment.sample_width)
+        # Convert SpeechSegment to sr.AudioData, reusing pre-encoded payloads
+        if segment.payloads:
+            audio_data = _PreEncodedAudioData(segment)
+        else:
+            audio_data = sr.AudioData(segment.audio_data, segment.sample_rate, segment.sample_width)
 
         # Call recognition method
         # Note: recognize_* methods raise sr.UnknownValueError if no speech detected
@@ -0,0 +1,25 @@
+"""
+Performance benchmarks for VADs, the speech detector and the Listener pipeline.
+
+Run the suite and save machine-readable results for comparison between
+versions:
+
+    python -m hearken.benchmark --seconds 30 --output results.json
+"""
+
+from .audio import synthetic_speech
+from .frames import FrameResult, bench_detector, bench_vad, split_frames
+from .pipeline import PipelineResult, bench_pipeline
+from .suite import available_vads, run_suite
+
+__all__ = [
+    "FrameResult",
+    "PipelineResult",
+    "available_vads",
+    "bench_detector",
+    "bench_pipeline",
+    "bench_vad",
+    "run_suite",
+    "split_frames",
+    "synthetic_speech",
+]
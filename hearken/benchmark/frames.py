@@ -0,0 +1,225 @@
+"""Per-frame cost of VADs and the speech detector."""
+
+import dataclasses
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from ..detector import SpeechDetector
+from ..interfaces import VAD
+from ..types import AudioChunk, DetectorConfig
+
+
+@dataclasses.dataclass
+class FrameResult:
+    """Cost of processing audio one frame at a time."""
+
+    name: str
+    frames: int
+    frame_ms: float
+    p50_us: float
+    p90_us: float
+    p99_us: float
+    max_us: float
+    cpu_seconds: float
+    memory_per_stream: int
+
+    @property
+    def frames_per_second(self) -> float:
+        """Frames one fully busy core could process per second."""
+        return self.frames / self.cpu_seconds if self.cpu_seconds else 0.0
+
+    @property
+    def realtime_factor(self) -> float:
+        """Processing time per second of audio (below 1.0 keeps up with real time)."""
+        audio_seconds = self.frames * self.frame_ms / 1000
+        return self.cpu_seconds / audio_seconds if audio_seconds else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            **dataclasses.asdict(self),
+            "frames_per_second": self.frames_per_second,
+            "realtime_factor": self.realtime_factor,
+        }
+
+
+def split_frames(
+    audio: bytes, sample_rate: int, frame_ms: float, sample_width: int = 2
+) -> list[AudioChunk]:
+    """Cut PCM audio into whole frames with sample-accurate timestamps."""
+    frame_samples = int(sample_rate * frame_ms / 1000)
+    frame_bytes = frame_samples * sample_width
+    return [
+        AudioChunk(
+            data=audio[offset : offset + frame_bytes],
+            timestamp=offset / sample_width / sample_rate,
+            sample_rate=sample_rate,
+            sample_width=sample_width,
+        )
+        for offset in range(0, len(audio) - frame_bytes + 1, frame_bytes)
+    ]
+
+
+def _frame_ms(vad_factory: Callable[[], VAD], frame_ms: float) -> float:
+    return vad_factory().required_frame_duration_ms or frame_ms
+
+
+def _measure(
+    name: str,
+    make: Callable[[], Callable[[AudioChunk], object]],
+    frames: list[AudioChunk],
+    frame_ms: float,
+    memory_streams: int,
+    warmup: int,
+) -> FrameResult:
+    if not frames:
+        raise ValueError("Audio is shorter than one frame")
+
+    process = make()
+    for chunk in frames[:warmup]:
+        process(chunk)
+
+    process = make()
+    timings = np.empty(len(frames), dtype=np.int64)
+    cpu_start = time.thread_time()
+    for i, chunk in enumerate(frames):
+        start = time.perf_counter_ns()
+        process(chunk)
+        timings[i] = time.perf_counter_ns() - start
+    cpu_seconds = time.thread_time() - cpu_start
+
+    p50, p90, p99 = np.percentile(timings, [50, 90, 99]) / 1000
+    return FrameResult(
+        name=name,
+        frames=len(frames),
+        frame_ms=frame_ms,
+        p50_us=float(p50),
+        p90_us=float(p90),
+        p99_us=float(p99),
+        max_us=float(timings.max() / 1000),
+        cpu_seconds=cpu_seconds,
+        memory_per_stream=_memory_per_stream(make, frames, memory_streams),
+    )
+
+
+def _memory_per_stream(
+    make: Callable[[], Callable[[AudioChunk], object]],
+    frames: list[AudioChunk],
+    streams: int,
+) -> int:
+    """
+    Python heap retained per stream after it has processed the audio.
+
+    Measured with tracemalloc, so memory held natively (e.g. an ONNX
+    session) is not included.
+    """
+    if streams < 1:
+        return 0
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        processors = [make() for _ in range(streams)]
+        for process in processors:
+            for chunk in frames:
+                process(chunk)
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+    del processors
+    return max(retained // streams, 0)
+
+
+def bench_vad(
+    vad_factory: Callable[[], VAD],
+    audio: bytes,
+    sample_rate: int = 16000,
+    frame_ms: float = 30,
+    name: Optional[str] = None,
+    memory_streams: int = 10,
+    warmup: int = 50,
+) -> FrameResult:
+    """
+    Time VAD.process() on every frame of the audio.
+
+    Args:
+        vad_factory: Creates the VAD under test
+        audio: 16-bit mono PCM
+        sample_rate: Sample rate of the audio in Hz
+        frame_ms: Frame duration, unless the VAD requires its own
+        name: Label in the results (defaults to the factory's name)
+        memory_streams: VAD instances created to measure memory per stream
+        warmup: Frames processed by a throwaway instance before timing
+
+    Raises:
+        ValueError: If the audio is shorter than one frame
+    """
+    frame_ms = _frame_ms(vad_factory, frame_ms)
+    frames = split_frames(audio, sample_rate, frame_ms)
+
+    def make() -> Callable[[AudioChunk], object]:
+        return vad_factory().process
+
+    return _measure(
+        name or str(getattr(vad_factory, "__name__", "vad")),
+        make,
+        frames,
+        frame_ms,
+        memory_streams,
+        warmup,
+    )
+
+
+def bench_detector(
+    vad_factory: Callable[[], VAD],
+    audio: bytes,
+    sample_rate: int = 16000,
+    frame_ms: float = 30,
+    config: Optional[DetectorConfig] = None,
+    name: Optional[str] = None,
+    memory_streams: int = 10,
+    warmup: int = 50,
+) -> FrameResult:
+    """
+    Time SpeechDetector.process() (VAD plus state machine) on every frame.
+
+    Segments are emitted to a no-op callback, so the figures include
+    segment assembly but no downstream work. Memory per stream covers a
+    detector with its VAD, buffers and padding.
+
+    Args:
+        vad_factory: Creates the detector's VAD
+        audio: 16-bit mono PCM
+        sample_rate: Sample rate of the audio in Hz
+        frame_ms: Frame duration, unless the VAD or config sets one
+        config: Detection parameters (defaults if None)
+        name: Label in the results (defaults to the factory's name)
+        memory_streams: Detectors created to measure memory per stream
+        warmup: Frames processed by a throwaway detector before timing
+
+    Raises:
+        ValueError: If the audio is shorter than one frame
+    """
+    if config is not None:
+        frame_ms = config.frame_duration_ms
+    frame_ms = _frame_ms(vad_factory, frame_ms)
+    config = config or DetectorConfig(frame_duration_ms=int(frame_ms))
+    frames = split_frames(audio, sample_rate, frame_ms)
+
+    def make() -> Callable[[AudioChunk], object]:
+        return SpeechDetector(vad_factory(), config, on_segment=lambda segment: None).process
+
+    return _measure(
+        name or str(getattr(vad_factory, "__name__", "vad")),
+        make,
+        frames,
+        frame_ms,
+        memory_streams,
+        warmup,
+    )
@@ -0,0 +1,148 @@
+"""End-to-end segment latency through a Listener."""
+
+import dataclasses
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from ..interfaces import Transcriber, VAD
+from ..listener import Listener
+from ..sources.file import FileAudioSource
+from ..types import DetectorConfig, SpeechSegment
+from ..vad.energy import EnergyVAD
+
+logger = logging.getLogger("hearken")
+
+
+class _SleepTranscriber(Transcriber):
+    """Stands in for a backend with a fixed response time."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def transcribe(self, segment: SpeechSegment) -> str:
+        if self.delay:
+            time.sleep(self.delay)
+        return ""
+
+
+@dataclasses.dataclass
+class PipelineResult:
+    """
+    Segment latency through a Listener.
+
+    Latencies run from the capture time of the frame that closed a segment
+    (segment.end_time) to its on_speech or on_transcript callback: the
+    queueing and processing the pipeline adds after the silence timeout
+    and, for transcripts, the transcriber delay.
+    """
+
+    audio_seconds: float
+    wall_seconds: float
+    segments: int
+    transcripts: int
+    chunks_dropped: int
+    segment_latency_ms: dict[str, float]
+    transcript_latency_ms: dict[str, float]
+
+    def to_dict(self) -> dict[str, Any]:
+        return dataclasses.asdict(self)
+
+
+def _percentiles(latencies: list[float]) -> dict[str, float]:
+    if not latencies:
+        return {}
+    ms = np.array(latencies) * 1000
+    p50, p90, p99 = np.percentile(ms, [50, 90, 99])
+    return {"p50": float(p50), "p90": float(p90), "p99": float(p99), "max": float(ms.max())}
+
+
+def bench_pipeline(
+    audio: bytes,
+    sample_rate: int = 16000,
+    vad_factory: Callable[[], VAD] = EnergyVAD,
+    detector_config: Optional[DetectorConfig] = None,
+    transcribe_delay: float = 0.0,
+    timeout: float = 5.0,
+) -> PipelineResult:
+    """
+    Play audio through a Listener and time every segment's callbacks.
+
+    The audio is served in real time by a FileAudioSource (capture stamps
+    are wall-clock, so faster playback would shorten the utterances the
+    detector sees) and transcribed by a fake transcriber that sleeps for
+    `transcribe_delay` seconds. The audio is followed by silence, so the
+    last utterance closes on the silence timeout like the others instead of
+    being flushed at the end of input.
+
+    Args:
+        audio: 16-bit mono PCM
+        sample_rate: Sample rate of the audio in Hz
+        vad_factory: Creates the Listener's VAD
+        detector_config: Detection parameters (defaults to a 0.3s silence
+            timeout, which splits the synthetic audio's 400ms pauses)
+        transcribe_delay: Seconds the fake transcriber takes per segment
+        timeout: Seconds to wait past the audio's length for it to finish
+            playing, then for outstanding transcripts
+    """
+    lock = threading.Lock()
+    segment_latencies: list[float] = []
+    transcript_latencies: list[float] = []
+
+    def on_speech(segment: SpeechSegment) -> None:
+        with lock:
+            segment_latencies.append(time.monotonic() - segment.end_time)
+
+    def on_transcript(text: str, segment: SpeechSegment) -> None:
+        with lock:
+            transcript_latencies.append(time.monotonic() - segment.end_time)
+
+    detector_config = detector_config or DetectorConfig(silence_timeout=0.3)
+    padding = int((detector_config.silence_timeout + 0.1) * sample_rate) * b"\x00\x00"
+
+    fd, path = tempfile.mkstemp(suffix=".pcm")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(audio)
+            f.write(padding)
+
+        listener = Listener(
+            source=FileAudioSource(path, sample_rate=sample_rate),
+            transcriber=_SleepTranscriber(transcribe_delay),
+            vad=vad_factory(),
+            detector_config=detector_config,
+            on_speech=on_speech,
+            on_transcript=on_transcript,
+        )
+
+        start = time.monotonic()
+        listener.start()
+        audio_seconds = (len(audio) + len(padding)) / 2 / sample_rate
+        if not listener.wait_for_end(timeout=audio_seconds + timeout):
+            logger.warning("Pipeline benchmark audio did not finish playing")
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with lock:
+                if len(transcript_latencies) >= len(segment_latencies):
+                    break
+            time.sleep(0.01)
+        wall_seconds = time.monotonic() - start
+        listener.stop()
+    finally:
+        os.unlink(path)
+
+    return PipelineResult(
+        audio_seconds=len(audio) / 2 / sample_rate,
+        wall_seconds=wall_seconds,
+        segments=len(segment_latencies),
+        transcripts=len(transcript_latencies),
+        chunks_dropped=listener.chunks_dropped,
+        segment_latency_ms=_percentiles(segment_latencies),
+        transcript_latency_ms=_percentiles(transcript_latencies),
+    )
@@ -0,0 +1,173 @@
+"""Benchmark suite runner and command line."""
+
+import argparse
+import datetime
+import json
+import logging
+import platform
+import sys
+from typing import Any, Callable, Optional, Sequence
+
+from .. import __version__
+from ..interfaces import VAD
+from ..sources.file import FileAudioSource
+from ..vad.energy import EnergyVAD
+from ..vad.spectral import SpectralVAD
+from .audio import synthetic_speech
+from .frames import bench_detector, bench_vad
+from .pipeline import bench_pipeline
+
+logger = logging.getLogger("hearken")
+
+
+def available_vads() -> dict[str, Callable[[], VAD]]:
+    """VAD factories by name, for the VADs whose dependencies are installed."""
+    vads: dict[str, Callable[[], VAD]] = {"energy": EnergyVAD, "spectral": SpectralVAD}
+
+    try:
+        from ..vad.webrtc import WebRTCVAD
+
+        vads["webrtc"] = WebRTCVAD
+    except ImportError:
+        pass
+
+    try:
+        from ..vad.silero import SileroVAD
+
+        vads["silero"] = SileroVAD
+    except ImportError:
+        pass
+
+    return vads
+
+
+def load_audio(path: str, sample_rate: Optional[int] = None) -> tuple[bytes, int]:
+    """
+    Read a mono 16-bit WAV or raw PCM file.
+
+    Returns:
+        (audio, sample_rate)
+
+    Raises:
+        ValueError: If the audio isn't 16-bit
+    """
+    source = FileAudioSource(path, sample_rate=sample_rate, speed=None)
+    if source.sample_width != 2:
+        raise ValueError(f"Benchmarks need 16-bit audio, got {source.sample_width * 8}-bit")
+
+    source.open()
+    chunks = []
+    try:
+        while True:
+            chunks.append(bytes(source.read(source.sample_rate)))
+    except EOFError:
+        pass
+    finally:
+        source.close()
+    return b"".join(chunks), source.sample_rate
+
+
+def run_suite(
+    audio: bytes,
+    sample_rate: int = 16000,
+    vads: Optional[Sequence[str]] = None,
+    pipeline: bool = True,
+    transcribe_delay: float = 0.0,
+    memory_streams: int = 10,
+) -> dict[str, Any]:
+    """
+    Benchmark each VAD alone and inside a SpeechDetector, then the pipeline.
+
+    VADs that are unknown, not installed or fail to load are reported under
+    "skipped" with the reason instead of failing the run.
+
+    Args:
+        audio: 16-bit mono PCM
+        sample_rate: Sample rate of the audio in Hz
+        vads: VAD names to run (all available if None)
+        pipeline: Also measure end-to-end latency through a Listener (runs
+            in real time)
+        transcribe_delay: Seconds the pipeline's fake transcriber takes
+        memory_streams: Instances created to measure memory per stream
+
+    Returns:
+        JSON-serializable results with environment details
+    """
+    factories = available_vads()
+    names = list(vads) if vads is not None else list(factories)
+
+    results: dict[str, Any] = {
+        "hearken_version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "sample_rate": sample_rate,
+        "audio_seconds": len(audio) / 2 / sample_rate,
+        "vad": [],
+        "detector": [],
+        "pipeline": None,
+        "skipped": {},
+    }
+
+    for name in names:
+        if name not in factories:
+            results["skipped"][name] = "not installed"
+            continue
+
+        logger.info(f"Benchmarking {name}")
+        try:
+            vad = bench_vad(
+                factories[name], audio, sample_rate, name=name, memory_streams=memory_streams
+            )
+            detector = bench_detector(
+                factories[name], audio, sample_rate, name=name, memory_streams=memory_streams
+            )
+        except Exception as e:
+            reason = str(e).splitlines()[0] if str(e) else type(e).__name__
+            logger.warning(f"Skipping {name}: {reason}")
+            results["skipped"][name] = reason
+            continue
+        results["vad"].append(vad.to_dict())
+        results["detector"].append(detector.to_dict())
+
+    if pipeline:
+        pipeline_result = bench_pipeline(audio, sample_rate, transcribe_delay=transcribe_delay)
+        results["pipeline"] = pipeline_result.to_dict()
+
+    return results
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark VADs, detector and pipeline")
+    parser.add_argument("--audio", help="Mono 16-bit WAV or raw PCM (default: synthetic)")
+    parser.add_argument("--sample-rate", type=int, default=None, help="Rate of raw PCM input")
+    parser.add_argument("--seconds", type=float, default=10.0, help="Synthetic audio length")
+    parser.add_argument("--vad", action="append", dest="vads", help="VAD to run (repeatable)")
+    parser.add_argument("--no-pipeline", action="store_true", help="Skip the Listener run")
+    parser.add_argument("--transcribe-delay", type=float, default=0.0)
+    parser.add_argument("--memory-streams", type=int, default=10)
+    parser.add_argument("--output", help="Write JSON results here (default: stdout)")
+    args = parser.parse_args(argv)
+
+    if args.audio:
+        audio, sample_rate = load_audio(args.audio, args.sample_rate)
+    else:
+        sample_rate = args.sample_rate or 16000
+        audio = synthetic_speech(args.seconds, sample_rate)
+
+    results = run_suite(
+        audio,
+        sample_rate,
+        vads=args.vads,
+        pipeline=not args.no_pipeline,
+        transcribe_delay=args.transcribe_delay,
+        memory_streams=args.memory_streams,
+    )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
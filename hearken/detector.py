@@ -2,6 +2,8 @@
 
 import logging
 import collections
+import dataclasses
+import numpy as np
 from typing import Optional, Callable
 
 from .types import AudioChunk, SpeechSegment, DetectorState, DetectorConfig, VADResult
@@ -9,6 +11,9 @@ from .interfaces import VAD
 
 logger = logging.getLogger('hearken.detector')
 
+# Placeholder result for frames the VAD never saw (duty-cycled idle frames)
+_SKIPPED = VADResult(is_speech=False, confidence=0.0)
+
 
 class SpeechDetector:
     """
@@ -19,6 +24,10 @@ class SpeechDetector:
     - SPEECH_STARTING: Speech detected, confirming it's not transient noise
     - SPEAKING: Confirmed speech, accumulating audio
     - TRAILING_SILENCE: Speech may have ended, waiting to confirm
+
+    Optionally duty-cycles the VAD while IDLE (see DetectorConfig). Skipped
+    frames still go into the padding buffer, and once a probe frame detects
+    speech they are replayed through the VAD so the onset isn't clipped.
     """
 
     def __init__(
@@ -26,16 +35,25 @@ class SpeechDetector:
         vad: VAD,
         config: Optional[DetectorConfig] = None,
         on_segment: Optional[Callable[[SpeechSegment], None]] = None,
+        on_audio: Optional[Callable[[list[AudioChunk]], None]] = None,
     ):
         """
         Args:
             vad: Voice activity detector instance
             config: Detection configuration (uses defaults if None)
             on_segment: Callback when complete segment detected
+            on_audio: Callback with audio of the current segment as it is
+                confirmed (for uploads while speech is in progress). Receives
+                the accumulated chunks on entering SPEAKING, then each chunk
+                until the segment is emitted. Audio is not compacted. With
+                `split_lookback`, the last `split_lookback` seconds are held
+                back, so audio after a forced split's cut is never streamed
+                to the utterance before it.
         """
         self.vad = vad
         self.config = config or DetectorConfig()
         self.on_segment = on_segment
+        self.on_audio = on_audio
 
         # FSM state
         self.state = DetectorState.IDLE
@@ -47,12 +65,34 @@ class SpeechDetector:
         self.padding_buffer: collections.deque[AudioChunk] = collections.deque(
             maxlen=max(1, padding_frames)
         )
+        # VAD result of each padding frame (silence for frames the VAD skipped)
+        self._padding_results: collections.deque[VADResult] = collections.deque(
+            maxlen=self.padding_buffer.maxlen
+        )
 
-        # Current segment accumulator
+        # Current segment accumulator, with the VAD result of each frame
         self.segment_chunks: list[AudioChunk] = []
+        self.segment_results: list[VADResult] = []
+        self._streamed = 0  # Leading segment chunks already passed to on_audio
         self.speech_start_time: Optional[float] = None
         self.last_speech_time: Optional[float] = None
 
+        # Idle duty cycling: frames not yet seen by the VAD since the last probe
+        self._duty_cycled = (
+            self.config.idle_vad_interval > 1 or self.config.idle_energy_floor is not None
+        )
+        self._skipped_chunks: collections.deque[AudioChunk] = collections.deque(
+            maxlen=max(1, padding_frames, self.config.idle_vad_interval)
+        )
+        self._idle_frames = 0
+
+        # Sample clock: origin timestamp and samples seen since then
+        self._clock_origin: Optional[float] = None
+        self._clock_samples = 0
+
+        # Timestamp of the last chunk processed, on the clock segments are stamped with
+        self.stream_time: Optional[float] = None
+
     def process(self, chunk: AudioChunk) -> None:
         """
         Process an audio chunk through the FSM.
@@ -60,6 +100,74 @@ class SpeechDetector:
         Args:
             chunk: Audio chunk to process
         """
+        if self.config.sample_clock:
+            chunk = self._restamp(chunk)
+        self.stream_time = chunk.timestamp
+
+        if self._duty_cycled and self.state == DetectorState.IDLE:
+            self._process_idle_duty_cycled(chunk)
+        else:
+            self._step(chunk)
+
+    def _restamp(self, chunk: AudioChunk) -> AudioChunk:
+        """Replace a chunk's timestamp with the sample-clock time of its first sample."""
+        if self._clock_origin is None:
+            self._clock_origin = chunk.timestamp
+
+        timestamp = self._clock_origin + self._clock_samples / chunk.sample_rate
+        self._clock_samples += len(chunk.data) // chunk.sample_width
+        return dataclasses.replace(chunk, timestamp=timestamp)
+
+    def _process_idle_duty_cycled(self, chunk: AudioChunk) -> None:
+        """IDLE with duty cycling: probe the VAD only on selected frames."""
+        if not self._should_probe(chunk):
+            self.padding_buffer.append(chunk)
+            self._padding_results.append(_SKIPPED)
+            self._skipped_chunks.append(chunk)
+            return
+
+        self._step(chunk)
+
+        if self.state == DetectorState.IDLE or not self._skipped_chunks:
+            self._skipped_chunks.clear()
+            return
+
+        # Probe found speech: replay skipped frames in order so the FSM sees
+        # the real onset, then the probe frame itself
+        logger.debug(f"Back-filling {len(self._skipped_chunks)} skipped frames")
+        replay = list(self._skipped_chunks) + [chunk]
+        self._skipped_chunks.clear()
+
+        self.state = DetectorState.IDLE
+        self.segment_chunks = []
+        self.segment_results = []
+        for _ in range(min(len(replay), len(self.padding_buffer))):
+            self.padding_buffer.pop()
+            self._padding_results.pop()
+        self.vad.reset()
+
+        for frame in replay:
+            self._step(frame)
+
+    def _should_probe(self, chunk: AudioChunk) -> bool:
+        """Decide whether to run the VAD on an IDLE frame."""
+        self._idle_frames += 1
+        interval = self.config.idle_vad_interval
+        if interval > 1 and self._idle_frames >= interval:
+            self._idle_frames = 0
+            return True
+
+        floor = self.config.idle_energy_floor
+        if floor is not None:
+            samples = np.frombuffer(chunk.data, dtype=np.int16).astype(np.float32)
+            if samples.size and np.sqrt(np.mean(samples**2)) >= floor:
+                self._idle_frames = 0
+                return True
+
+        return False
+
+    def _step(self, chunk: AudioChunk) -> None:
+        """Run the VAD on a chunk and advance the FSM."""
         # Run VAD
         try:
             vad_result = self.vad.process(chunk)
@@ -70,6 +178,15 @@ class SpeechDetector:
         is_speech = vad_result.is_speech
         now = chunk.timestamp
 
+        if self.state == DetectorState.IDLE:
+            self.padding_buffer.append(chunk)
+            self._padding_results.append(vad_result)
+        else:
+            self.segment_chunks.append(chunk)
+            self.segment_results.append(vad_result)
+            if self.state != DetectorState.SPEECH_STARTING:
+                self._stream_confirmed()
+
         # FSM transitions
         if self.state == DetectorState.IDLE:
             self._handle_idle(chunk, is_speech, now)
@@ -82,8 +199,6 @@ class SpeechDetector:
 
     def _handle_idle(self, chunk: AudioChunk, is_speech: bool, now: float) -> None:
         """IDLE state: waiting for speech."""
-        self.padding_buffer.append(chunk)
-
         if is_speech:
             logger.debug("Speech detected, transitioning to SPEECH_STARTING")
             self.state = DetectorState.SPEECH_STARTING
@@ -91,10 +206,10 @@ class SpeechDetector:
             self.last_speech_time = now
             # Include padding buffer
             self.segment_chunks = list(self.padding_buffer)
+            self.segment_results = list(self._padding_results)
 
     def _handle_speech_starting(self, chunk: AudioChunk, is_speech: bool, now: float) -> None:
         """SPEECH_STARTING: confirming speech isn't transient noise."""
-        self.segment_chunks.append(chunk)
 
         if is_speech:
             self.last_speech_time = now
@@ -104,20 +219,18 @@ class SpeechDetector:
             if speech_duration >= self.config.min_speech_duration:
                 logger.debug(f"Speech confirmed after {speech_duration:.2f}s, transitioning to SPEAKING")
                 self.state = DetectorState.SPEAKING
+                self._stream_confirmed()
         else:
             # Check if silence has exceeded timeout (false start)
             silence_duration = now - self.last_speech_time
             if silence_duration >= self.config.silence_timeout:
                 logger.debug(f"False start detected, returning to IDLE")
                 self.state = DetectorState.IDLE
-                self.segment_chunks = []
-                self.padding_buffer.clear()
+                self._clear_segment()
                 self.vad.reset()
 
     def _handle_speaking(self, chunk: AudioChunk, is_speech: bool, now: float) -> None:
         """SPEAKING: confirmed speech, accumulating audio."""
-        self.segment_chunks.append(chunk)
-
         if is_speech:
             self.last_speech_time = now
 
@@ -125,16 +238,17 @@ class SpeechDetector:
         speech_duration = now - self.speech_start_time
         if speech_duration >= self.config.max_speech_duration:
             logger.debug(f"Max duration ({self.config.max_speech_duration}s) reached, emitting segment")
-            self._emit_segment(now)
-            self.state = DetectorState.IDLE
+            if self.config.split_lookback > 0:
+                self._split_segment(now)
+            else:
+                self._emit_segment(now)
+                self.state = DetectorState.IDLE
         elif not is_speech:
             logger.debug("Silence detected, transitioning to TRAILING_SILENCE")
             self.state = DetectorState.TRAILING_SILENCE
 
     def _handle_trailing_silence(self, chunk: AudioChunk, is_speech: bool, now: float) -> None:
         """TRAILING_SILENCE: speech may have ended, waiting to confirm."""
-        self.segment_chunks.append(chunk)
-
         if is_speech:
             logger.debug("Speech resumed, returning to SPEAKING")
             self.last_speech_time = now
@@ -147,41 +261,225 @@ class SpeechDetector:
                 self._emit_segment(now)
                 self.state = DetectorState.IDLE
 
-    def _emit_segment(self, end_time: float) -> None:
-        """Emit a complete speech segment."""
-        if not self.segment_chunks:
-            return
+    def _split_segment(self, now: float) -> None:
+        """
+        Force a split at the quietest recent frame and keep SPEAKING.
+
+        Searches the last `split_lookback` seconds for the frame with the
+        lowest VAD confidence (ties broken by lowest RMS energy), emits the
+        audio up to and including it, and carries `split_overlap` seconds
+        before the cut into the next segment.
+        """
+        chunks = self.segment_chunks
+        frame_duration = self._chunk_duration(chunks[-1])
+
+        first = max(1, len(chunks) - self._lookback_frames(frame_duration))
+        cut = min(
+            range(first, len(chunks)),
+            key=lambda i: (self.segment_results[i].confidence, self._rms(chunks[i])),
+        )
+
+        split = cut + 1
+        end_time = chunks[split].timestamp if split < len(chunks) else now
+        overlap = round(self.config.split_overlap / frame_duration)
+        keep_from = max(1, split - overlap)
+
+        kept_chunks = chunks[keep_from:]
+        kept_results = self.segment_results[keep_from:]
+        self.segment_chunks = chunks[:split]
+        self.segment_results = self.segment_results[:split]
 
-        # Combine chunks into single audio blob
-        audio_data = b''.join(c.data for c in self.segment_chunks)
+        logger.debug(f"Splitting at {end_time:.2f}s with {len(kept_chunks)} frames carried over")
+        segment = self._build_segment(end_time)
+        self._stream(chunks[self._streamed : split])
+
+        self.segment_chunks = kept_chunks
+        self.segment_results = kept_results
+        self._streamed = 0
+        self.speech_start_time = kept_chunks[0].timestamp if kept_chunks else now
+
+        self._deliver(segment)
+        self._stream_confirmed()
+
+    def _lookback_frames(self, frame_duration: float) -> int:
+        """Frames searched for a forced split's cut (0 if splits aren't searched)."""
+        if self.config.split_lookback <= 0:
+            return 0
+        return max(1, round(self.config.split_lookback / frame_duration))
+
+    @staticmethod
+    def _chunk_duration(chunk: AudioChunk) -> float:
+        """Duration of a chunk in seconds."""
+        return len(chunk.data) / chunk.sample_width / chunk.sample_rate
+
+    @staticmethod
+    def _rms(chunk: AudioChunk) -> float:
+        """RMS energy of a 16-bit chunk."""
+        samples = np.frombuffer(chunk.data, dtype=np.int16).astype(np.float32)
+        return float(np.sqrt(np.mean(samples**2))) if samples.size else 0.0
+
+    def _build_segment(self, end_time: float) -> SpeechSegment:
+        """Combine the accumulated chunks into a speech segment."""
+        chunks = self.segment_chunks
+        runs = self._compact_runs()
+
+        if runs is None:
+            # Combine chunks into single audio blob
+            audio_data = b''.join(c.data for c in chunks)
+            time_map = None
+        else:
+            audio_data = b''.join(c.data for start, stop in runs for c in chunks[start:stop])
+            time_map = []
+            offset = 0.0
+            for start, stop in runs:
+                time_map.append((offset, chunks[start].timestamp))
+                offset += sum(self._chunk_duration(c) for c in chunks[start:stop])
+
+            last = chunks[runs[-1][1] - 1]
+            end_time = min(end_time, last.timestamp + self._chunk_duration(last))
+            logger.debug(
+                f"Compacted segment to {len(audio_data)} of "
+                f"{sum(len(c.data) for c in chunks)} bytes"
+            )
 
         segment = SpeechSegment(
             audio_data=audio_data,
-            sample_rate=self.segment_chunks[0].sample_rate,
-            sample_width=self.segment_chunks[0].sample_width,
+            sample_rate=chunks[0].sample_rate,
+            sample_width=chunks[0].sample_width,
             start_time=self.speech_start_time,
             end_time=end_time,
+            time_map=time_map,
         )
 
         logger.info(f"Speech segment detected: {segment.duration:.2f}s")
+        return segment
 
-        # Reset for next segment
+    def _compact_runs(self) -> Optional[list[tuple[int, int]]]:
+        """
+        Pick the frame ranges to keep when compacting silence.
+
+        Uses the per-frame VAD decisions already recorded for the segment.
+        Trailing non-speech is cut to `trailing_silence_margin`; internal
+        pauses longer than `max_internal_pause` keep half that length on each
+        side. Pre-roll padding is left alone.
+
+        Returns:
+            List of (start, stop) index ranges, or None if nothing is removed
+        """
+        margin = self.config.trailing_silence_margin
+        max_pause = self.config.max_internal_pause
+        if margin is None and max_pause is None:
+            return None
+
+        speech = [i for i, r in enumerate(self.segment_results) if r.is_speech]
+        if not speech:
+            return None
+
+        frame_duration = self._chunk_duration(self.segment_chunks[-1])
+        stop = len(self.segment_chunks)
+        if margin is not None:
+            stop = min(stop, speech[-1] + 1 + round(margin / frame_duration))
+
+        runs = []
+        start = 0
+        if max_pause is not None:
+            head = round(max_pause / frame_duration / 2)
+            tail = round(max_pause / frame_duration) - head
+            for prev, nxt in zip(speech, speech[1:]):
+                if nxt - prev - 1 > head + tail:
+                    runs.append((start, prev + 1 + head))
+                    start = nxt - tail
+        runs.append((start, stop))
+
+        if runs == [(0, len(self.segment_chunks))]:
+            return None
+        return runs
+
+    def recent_noise(self) -> list[AudioChunk]:
+        """
+        Recent frames the VAD judged to be non-speech.
+
+        While idle these are the latest frames; during a segment, the
+        pre-roll before its onset. Frames skipped by duty cycling are left out.
+        """
+        return [
+            chunk
+            for chunk, result in zip(self.padding_buffer, self._padding_results)
+            if result is not _SKIPPED and not result.is_speech
+        ]
+
+    def _clear_segment(self) -> None:
+        """Drop the accumulated segment and padding."""
         self.segment_chunks = []
+        self.segment_results = []
+        self._streamed = 0
         self.padding_buffer.clear()
+        self._padding_results.clear()
+
+    def _emit_segment(self, end_time: float) -> None:
+        """Emit a complete speech segment."""
+        if not self.segment_chunks:
+            return
+
+        segment = self._build_segment(end_time)
+        self._stream(self.segment_chunks[self._streamed :])
+
+        # Reset for next segment
+        self._clear_segment()
         self.vad.reset()
 
-        # Invoke callback
+        self._deliver(segment)
+
+    def _stream_confirmed(self) -> None:
+        """Stream segment audio that a forced split can no longer cut off."""
+        if not self.on_audio or not self.segment_chunks:
+            return
+        frame_duration = self._chunk_duration(self.segment_chunks[-1])
+        stop = len(self.segment_chunks) - self._lookback_frames(frame_duration)
+        if stop > self._streamed:
+            self._stream(self.segment_chunks[self._streamed : stop])
+            self._streamed = stop
+
+    def _stream(self, chunks: list[AudioChunk]) -> None:
+        """Invoke the audio callback with newly confirmed segment audio."""
+        if self.on_audio and chunks:
+            try:
+                self.on_audio(list(chunks))
+            except Exception as e:
+                logger.error(f"Audio callback failed: {e}")
+
+    def _deliver(self, segment: SpeechSegment) -> None:
+        """Invoke the segment callback."""
         if self.on_segment:
             try:
                 self.on_segment(segment)
             except Exception as e:
                 logger.error(f"Segment callback failed: {e}")
 
+    def flush(self) -> None:
+        """
+        Emit the segment in progress, e.g. when the audio stream ends.
+
+        Unconfirmed speech (SPEECH_STARTING) is dropped, as on a false start.
+        """
+        if self.state in (DetectorState.SPEAKING, DetectorState.TRAILING_SILENCE):
+            last = self.segment_chunks[-1]
+            logger.debug("Flushing segment in progress")
+            self._emit_segment(last.timestamp + self._chunk_duration(last))
+        elif self.state == DetectorState.SPEECH_STARTING:
+            self._clear_segment()
+            self.vad.reset()
+        self.state = DetectorState.IDLE
+
     def reset(self) -> None:
         """Reset detector to initial state."""
         self.state = DetectorState.IDLE
-        self.segment_chunks = []
-        self.padding_buffer.clear()
+        self._clear_segment()
         self.speech_start_time = None
         self.last_speech_time = None
+        self._skipped_chunks.clear()
+        self._idle_frames = 0
+        self._clock_origin = None
+        self._clock_samples = 0
+        self.stream_time = None
         self.vad.reset()
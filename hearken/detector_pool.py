@@ -0,0 +1,604 @@
+"""Speech detection in worker processes, fed through shared memory."""
+
+import itertools
+import logging
+import multiprocessing
+import multiprocessing.connection
+import os
+import pickle
+import struct
+import sys
+import threading
+from contextlib import AbstractContextManager
+from multiprocessing import resource_tracker, shared_memory
+from multiprocessing.connection import Connection
+from multiprocessing.synchronize import Semaphore
+from typing import Any, Callable, Optional
+
+from .detector import SpeechDetector
+from .interfaces import VAD
+from .types import AudioChunk, DetectorConfig, SpeechSegment
+
+logger = logging.getLogger("hearken")
+
+# Ring header: write position, read position (running byte counts), capacity
+_POSITIONS = struct.Struct("<QQQ")
+_WRITE = 0
+_READ = 8
+_DATA_OFFSET = 64
+
+# Every record: timestamp, payload length, then the payload
+_RECORD = struct.Struct("<dI")
+
+
+class SharedRing:
+    """
+    Single-producer, single-consumer ring of timestamped records in shared memory.
+
+    The producer only advances the write position and the consumer only the
+    read position. Records are copied in and out without holding a lock; a
+    record that doesn't fit is refused instead of blocking.
+
+    Positions are read and published under `lock`, which both sides must
+    share. Its acquire and release are memory barriers, so a published
+    position is never seen before the record it covers, even on weakly
+    ordered CPUs such as ARM where plain stores to shared memory can become
+    visible out of order.
+    """
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        name: Optional[str] = None,
+        lock: Optional[AbstractContextManager[Any]] = None,
+    ):
+        """
+        Args:
+            size: Data capacity in bytes, to create a new ring
+            name: Shared memory name, to attach to an existing ring
+            lock: Lock shared with the other side, e.g. a multiprocessing.Lock
+                inherited by the worker (a private lock if None, which only
+                works when both sides are in this process)
+
+        Raises:
+            ValueError: If neither or both of size and name are given
+        """
+        if size is not None and name is None:
+            self._shm = shared_memory.SharedMemory(create=True, size=_DATA_OFFSET + size)
+            self._owner = True
+        elif name is not None and size is None:
+            self._shm = _attach(name)
+            self._owner = False
+        else:
+            raise ValueError("Pass either size (to create) or name (to attach)")
+
+        # Only None once the memory is closed
+        assert self._shm.buf is not None
+        self._buf = self._shm.buf
+        if self._owner:
+            _POSITIONS.pack_into(self._buf, 0, 0, 0, size)
+
+        self._lock = lock if lock is not None else threading.Lock()
+        self.capacity: int = _POSITIONS.unpack_from(self._buf)[2]
+        self._data = self._buf[_DATA_OFFSET : _DATA_OFFSET + self.capacity]
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def put(self, timestamp: float, data: bytes) -> bool:
+        """Append a record (producer side); returns False if it doesn't fit."""
+        with self._lock:
+            write, read, _ = _POSITIONS.unpack_from(self._buf)
+        needed = _RECORD.size + len(data)
+        if needed > self.capacity - (write - read):
+            return False
+
+        self._copy_in(write, _RECORD.pack(timestamp, len(data)))
+        self._copy_in(write + _RECORD.size, data)
+        # Publish only once the record is complete
+        with self._lock:
+            struct.pack_into("<Q", self._buf, _WRITE, write + needed)
+        return True
+
+    def get(self) -> Optional[tuple[float, bytes]]:
+        """Take the oldest record (consumer side), or None if empty."""
+        with self._lock:
+            write, read, _ = _POSITIONS.unpack_from(self._buf)
+        if write == read:
+            return None
+
+        timestamp, length = _RECORD.unpack(self._copy_out(read, _RECORD.size))
+        data = self._copy_out(read + _RECORD.size, length)
+        # Free the space only once the record has been copied out
+        with self._lock:
+            struct.pack_into("<Q", self._buf, _READ, read + _RECORD.size + length)
+        return timestamp, data
+
+    def close(self) -> None:
+        """Detach, and free the memory if this side created it."""
+        self._data.release()
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+    def _copy_in(self, position: int, data: bytes) -> None:
+        offset = position % self.capacity
+        first = min(len(data), self.capacity - offset)
+        self._data[offset : offset + first] = data[:first]
+        if first < len(data):
+            self._data[: len(data) - first] = data[first:]
+
+    def _copy_out(self, position: int, length: int) -> bytes:
+        offset = position % self.capacity
+        first = min(length, self.capacity - offset)
+        if first == length:
+            return bytes(self._data[offset : offset + length])
+        return bytes(self._data[offset:]) + bytes(self._data[: length - first])
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to memory owned by another process without taking over its cleanup."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # Before Python 3.13 attaching registers the memory again; workers
+    # share the pool's resource tracker, so that is a no-op
+    return shared_memory.SharedMemory(name=name)
+
+
+class _WorkerStream:
+    """Detection state of one stream inside a worker process."""
+
+    def __init__(
+        self,
+        send: Callable[[tuple[Any, ...]], None],
+        ring_lock: AbstractContextManager[Any],
+        stream_id: int,
+        input_name: str,
+        output_name: str,
+        vad_factory: Callable[[], VAD],
+        config: DetectorConfig,
+        sample_rate: int,
+        sample_width: int,
+    ):
+        self.stream_id = stream_id
+        self.sample_rate = sample_rate
+        self.sample_width = sample_width
+        self._send = send
+        self.detector = SpeechDetector(vad_factory(), config, on_segment=self._send_segment)
+        self.input = SharedRing(name=input_name, lock=ring_lock)
+        self.output = SharedRing(name=output_name, lock=ring_lock)
+
+    def drain(self) -> None:
+        while (record := self.input.get()) is not None:
+            timestamp, data = record
+            chunk = AudioChunk(
+                data=data,
+                timestamp=timestamp,
+                sample_rate=self.sample_rate,
+                sample_width=self.sample_width,
+            )
+            try:
+                self.detector.process(chunk)
+            except Exception as e:
+                self._send(("error", self.stream_id, f"Detection failed: {e}"))
+
+    def close(self) -> None:
+        self.input.close()
+        self.output.close()
+
+    def _send_segment(self, segment: SpeechSegment) -> None:
+        meta = {
+            "sample_rate": segment.sample_rate,
+            "sample_width": segment.sample_width,
+            "start_time": segment.start_time,
+            "end_time": segment.end_time,
+            "time_map": segment.time_map,
+            "parts": segment.parts,
+        }
+        # Audio goes through shared memory; only a segment too big for the
+        # free space is sent inline
+        inline = None
+        if not self.output.put(segment.start_time, segment.audio_data):
+            inline = segment.audio_data
+        self._send(("segment", self.stream_id, inline, meta))
+
+
+def _worker_main(
+    control: Connection,
+    results: Connection,
+    wakeup: Semaphore,
+    ring_lock: AbstractContextManager[Any],
+) -> None:
+    """Worker process: run the detectors of the streams assigned to it."""
+    streams: dict[int, _WorkerStream] = {}
+    stream: Optional[_WorkerStream]
+
+    while True:
+        wakeup.acquire(timeout=0.1)
+        # One pass drains every ring, so collapse the pending wakeups
+        while wakeup.acquire(False):
+            pass
+
+        while control.poll():
+            message = control.recv()
+            if message is None:
+                for stream in streams.values():
+                    stream.close()
+                return
+
+            kind, stream_id, *args = message
+            if kind == "open":
+                try:
+                    stream = _WorkerStream(results.send, ring_lock, stream_id, *args)
+                except Exception as e:
+                    results.send(("error", stream_id, f"Failed to start detector: {e}"))
+                    continue
+                streams[stream_id] = stream
+                frame_duration_ms = stream.detector.vad.required_frame_duration_ms
+                results.send(("ready", stream_id, frame_duration_ms))
+            elif kind == "flush":
+                stream = streams.get(stream_id)
+                if stream is not None:
+                    stream.drain()
+                    stream.detector.flush()
+                results.send(("flushed", stream_id))
+            elif kind == "close":
+                stream = streams.pop(stream_id, None)
+                if stream is not None:
+                    stream.close()
+                results.send(("closed", stream_id))
+
+        for stream in streams.values():
+            stream.drain()
+
+
+class _Worker:
+    """Parent-side handle of a worker process."""
+
+    def __init__(self, context: Any, index: int):
+        control_recv, self.control = context.Pipe(duplex=False)
+        self.results, results_send = context.Pipe(duplex=False)
+        self.wakeup = context.Semaphore(0)
+        # Guards the ring positions of every stream on this worker
+        self.ring_lock = context.Lock()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(control_recv, results_send, self.wakeup, self.ring_lock),
+            name=f"hearken-detector-{index}",
+            daemon=True,
+        )
+        self.process.start()
+        control_recv.close()
+        results_send.close()
+
+        self.streams = 0
+        self._lock = threading.Lock()
+
+    def send(self, message: Optional[tuple[Any, ...]]) -> None:
+        with self._lock:
+            self.control.send(message)
+        self.wakeup.release()
+
+
+class DetectorStream:
+    """
+    One audio stream detected by a DetectorPool worker.
+
+    Created by `DetectorPool.open_stream()`. `write()` is called by the
+    capture side and never blocks on the worker; segments are delivered on
+    the pool's dispatcher thread. `write()` may race with `close()` from
+    another thread: once close has started, writes are refused.
+    """
+
+    def __init__(
+        self,
+        pool: "DetectorPool",
+        stream_id: int,
+        worker: _Worker,
+        input_ring: SharedRing,
+        output_ring: SharedRing,
+        on_segment: Callable[[SpeechSegment], None],
+        on_error: Optional[Callable[[Exception], None]],
+    ):
+        self.stream_id = stream_id
+        self.on_segment = on_segment
+        self.on_error = on_error
+        self._pool = pool
+        self._worker = worker
+        self._input = input_ring
+        self._output = output_ring
+        self._closed = threading.Event()
+        self._ready = threading.Event()
+        self._flushed = threading.Event()
+        self._start_error: Optional[Exception] = None
+        self._frame_duration_ms: Optional[float] = None
+        self._open = True
+        self._lock = threading.Lock()  # Keeps close() from freeing a ring mid-write
+
+    @property
+    def frame_duration_ms(self) -> Optional[float]:
+        """Frame duration the worker's VAD requires, or None if flexible (once ready)."""
+        return self._frame_duration_ms
+
+    def wait_ready(self, timeout: float = 10.0) -> None:
+        """
+        Wait until the worker has built the stream's VAD.
+
+        Raises:
+            RuntimeError: If the VAD failed to build or the worker didn't answer in time
+        """
+        if not self._ready.wait(timeout):
+            raise RuntimeError(f"Detector worker did not start stream {self.stream_id}")
+        if self._start_error is not None:
+            raise self._start_error
+
+    def write(self, chunk: AudioChunk) -> bool:
+        """
+        Hand a captured chunk to the worker.
+
+        Returns:
+            False if the stream's ring is full (the worker is behind) or closed
+        """
+        with self._lock:
+            if not self._open or not self._input.put(chunk.timestamp, chunk.data):
+                return False
+        self._worker.wakeup.release()
+        return True
+
+    def flush(self, timeout: float = 2.0) -> None:
+        """
+        End of input: the worker emits the segment in progress after the queued frames.
+
+        Blocks until the worker has done so, so every segment has been
+        delivered when this returns.
+        """
+        with self._lock:
+            if not self._open:
+                return
+            self._flushed.clear()
+            self._worker.send(("flush", self.stream_id))
+        if not self._flushed.wait(timeout):
+            logger.warning(f"Detector worker did not flush stream {self.stream_id}")
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Stop detection and free the shared memory. Unfinished segments are dropped."""
+        with self._lock:
+            if not self._open:
+                return
+            self._open = False
+
+        try:
+            self._worker.send(("close", self.stream_id))
+            if not self._closed.wait(timeout):
+                logger.warning(f"Detector worker did not release stream {self.stream_id}")
+        except OSError as e:
+            logger.warning(f"Detector worker unavailable: {e}")
+
+        self._pool._remove(self)
+        self._input.close()
+        self._output.close()
+
+    def _deliver(self, message: tuple[Any, ...]) -> None:
+        """Handle a worker message (dispatcher thread)."""
+        kind = message[0]
+        if kind == "ready":
+            self._frame_duration_ms = message[2]
+            self._ready.set()
+        elif kind == "flushed":
+            self._flushed.set()
+        elif kind == "closed":
+            self._closed.set()
+        elif kind == "error":
+            error = RuntimeError(message[2])
+            if not self._ready.is_set():
+                self._start_error = error
+                self._ready.set()
+            logger.error(str(error))
+            if self.on_error:
+                self.on_error(error)
+        elif kind == "segment":
+            _, _, audio, meta = message
+            if audio is None:
+                record = self._output.get()
+                if record is None:
+                    raise RuntimeError(f"Segment audio of stream {self.stream_id} is missing")
+                audio = record[1]
+            self.on_segment(SpeechSegment(audio_data=audio, **meta))
+
+
+class DetectorPool:
+    """
+    Runs SpeechDetector + VAD in worker processes instead of threads.
+
+    With many listeners in one process, per-listener detect threads contend
+    for the GIL (NumPy and ONNX only partly release it). A pool moves
+    detection into `processes` worker processes, each serving several
+    streams, so detection scales across cores.
+
+    Audio is handed over through per-stream shared-memory rings: capture
+    copies a frame in and posts a semaphore, with no pickling or pipe
+    writes per frame. Segment audio comes back through a second ring and
+    only its metadata is pickled.
+
+    Share one pool between listeners via `Listener(detector_pool=...)`. VADs
+    are created in the workers, so they're given as picklable factories
+    (a class, a module-level function or a functools.partial).
+
+    Example:
+        with DetectorPool(processes=4) as pool:
+            listeners = [
+                Listener(source, vad_factory=SileroVAD, detector_pool=pool,
+                         on_speech=handle)
+                for source in sources
+            ]
+    """
+
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        buffer_seconds: float = 2.0,
+        segment_buffer_seconds: float = 32.0,
+        start_method: str = "spawn",
+    ):
+        """
+        Args:
+            processes: Worker processes (defaults to the CPU count)
+            buffer_seconds: Audio each stream's input ring holds before
+                frames are dropped
+            segment_buffer_seconds: Segment audio each stream's output ring
+                holds (larger segments are sent inline)
+            start_method: multiprocessing start method for the workers
+
+        Raises:
+            ValueError: If processes or buffer sizes are not positive
+        """
+        processes = processes or os.cpu_count() or 1
+        if processes < 1:
+            raise ValueError(f"processes must be at least 1, got {processes}")
+        if buffer_seconds <= 0 or segment_buffer_seconds <= 0:
+            raise ValueError(
+                f"Buffer sizes must be positive, got {buffer_seconds} and {segment_buffer_seconds}"
+            )
+
+        self.buffer_seconds = buffer_seconds
+        self.segment_buffer_seconds = segment_buffer_seconds
+
+        # Workers inherit a running tracker instead of starting their own,
+        # which would unlink the rings when a worker exits
+        resource_tracker.ensure_running()
+        context = multiprocessing.get_context(start_method)
+        self._workers = [_Worker(context, i) for i in range(processes)]
+        self._streams: dict[int, DetectorStream] = {}
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        self._running = True
+
+        self._dispatcher = threading.Thread(
+            target=self._dispatch_loop, name="hearken-detector-pool", daemon=True
+        )
+        self._dispatcher.start()
+
+    def open_stream(
+        self,
+        vad_factory: Callable[[], VAD],
+        config: DetectorConfig,
+        sample_rate: int,
+        sample_width: int,
+        on_segment: Callable[[SpeechSegment], None],
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> DetectorStream:
+        """
+        Start detecting a new stream on the least loaded worker.
+
+        Args:
+            vad_factory: Picklable callable creating the stream's VAD
+            config: Detection parameters
+            sample_rate: Sample rate of the stream in Hz
+            sample_width: Bytes per sample of the stream
+            on_segment: Called with each detected segment
+            on_error: Called with worker-side failures
+
+        Raises:
+            RuntimeError: If the pool is closed
+            ValueError: If vad_factory or config can't be pickled
+        """
+        if not self._running:
+            raise RuntimeError("Detector pool is closed")
+
+        bytes_per_second = sample_rate * sample_width
+
+        with self._lock:
+            stream_id = next(self._ids)
+            worker = min(self._workers, key=lambda w: w.streams)
+            input_ring = SharedRing(
+                size=int(self.buffer_seconds * bytes_per_second), lock=worker.ring_lock
+            )
+            output_ring = SharedRing(
+                size=int(self.segment_buffer_seconds * bytes_per_second), lock=worker.ring_lock
+            )
+            worker.streams += 1
+            stream = DetectorStream(
+                self, stream_id, worker, input_ring, output_ring, on_segment, on_error
+            )
+            self._streams[stream_id] = stream
+
+        message = (
+            "open",
+            stream_id,
+            input_ring.name,
+            output_ring.name,
+            vad_factory,
+            config,
+            sample_rate,
+            sample_width,
+        )
+        try:
+            worker.send(message)
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            self._remove(stream)
+            input_ring.close()
+            output_ring.close()
+            raise ValueError(
+                f"vad_factory must be picklable (a class or module-level function): {e}"
+            ) from e
+
+        return stream
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Close all streams and stop the workers."""
+        if not self._running:
+            return
+
+        for stream in list(self._streams.values()):
+            stream.close(timeout=timeout)
+
+        self._running = False
+        for worker in self._workers:
+            try:
+                worker.send(None)
+            except OSError:
+                pass
+        for worker in self._workers:
+            worker.process.join(timeout=timeout)
+            if worker.process.is_alive():
+                worker.process.terminate()
+                worker.process.join()
+            worker.control.close()
+        self._dispatcher.join(timeout=timeout)
+        for worker in self._workers:
+            worker.results.close()
+
+    def __enter__(self) -> "DetectorPool":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def _remove(self, stream: DetectorStream) -> None:
+        with self._lock:
+            if self._streams.pop(stream.stream_id, None) is not None:
+                stream._worker.streams -= 1
+
+    def _dispatch_loop(self) -> None:
+        """Route worker messages to their streams."""
+        workers = list(self._workers)
+
+        while self._running and workers:
+            ready = multiprocessing.connection.wait([w.results for w in workers], timeout=0.1)
+            for worker in [w for w in workers if w.results in ready]:
+                try:
+                    message = worker.results.recv()
+                except (EOFError, OSError):
+                    workers.remove(worker)
+                    if self._running:
+                        logger.error(f"Detector worker {worker.process.name} exited")
+                    continue
+
+                stream = self._streams.get(message[1])
+                if stream is None:
+                    continue
+                try:
+                    stream._deliver(message)
+                except Exception as e:
+                    logger.error(f"Segment delivery failed: {e}", exc_info=True)
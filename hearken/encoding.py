@@ -0,0 +1,172 @@
+"""Segment encoding stage for network transcribers."""
+
+import concurrent.futures
+import io
+import logging
+import shutil
+import subprocess
+import threading
+import wave
+from typing import Callable, Optional, Sequence
+
+from .types import SpeechSegment
+
+logger = logging.getLogger("hearken.encoding")
+
+
+def encode_wav(segment: SpeechSegment) -> bytes:
+    """Wrap a segment's PCM audio in a WAV container."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(segment.sample_width)
+        wav.setframerate(segment.sample_rate)
+        wav.writeframes(segment.audio_data)
+    return buffer.getvalue()
+
+
+def encode_flac(segment: SpeechSegment) -> bytes:
+    """
+    Compress a segment to FLAC.
+
+    Uses speech_recognition's bundled FLAC encoder when installed, otherwise
+    a `flac` binary on PATH.
+
+    Raises:
+        RuntimeError: If no FLAC encoder is available
+    """
+    try:
+        import speech_recognition as sr
+    except ImportError:
+        sr = None
+
+    if sr is not None:
+        audio = sr.AudioData(segment.audio_data, segment.sample_rate, segment.sample_width)
+        data: bytes = audio.get_flac_data()
+        return data
+
+    flac = shutil.which("flac")
+    if flac is None:
+        raise RuntimeError(
+            "FLAC encoding requires the flac command-line tool or SpeechRecognition. "
+            "Install with: pip install hearken[sr]"
+        )
+
+    result = subprocess.run(
+        [flac, "--stdout", "--totally-silent", "--best", "-"],
+        input=encode_wav(segment),
+        capture_output=True,
+        check=True,
+    )
+    return result.stdout
+
+
+# Encoders by format name; add entries to support more formats
+ENCODERS: dict[str, Callable[[SpeechSegment], bytes]] = {
+    "wav": encode_wav,
+    "flac": encode_flac,
+}
+
+
+def get_payload(segment: SpeechSegment, fmt: str) -> bytes:
+    """
+    Return a segment's encoded payload, encoding and caching it if needed.
+
+    Args:
+        segment: Speech segment
+        fmt: Format name registered in ENCODERS
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    payload = segment.payloads.get(fmt)
+    if payload is None:
+        if fmt not in ENCODERS:
+            raise ValueError(f"Unknown encoding format {fmt!r}, expected one of {list(ENCODERS)}")
+        payload = ENCODERS[fmt](segment)
+        segment.payloads[fmt] = payload
+    return payload
+
+
+class SegmentEncoder:
+    """
+    Encodes segments on a worker pool right after detection.
+
+    Each segment is encoded to the configured formats off the detection and
+    transcription threads, with the results cached in
+    `SpeechSegment.payloads`, then handed to `on_segment`. Segments are
+    delivered in the order they were submitted: one that finishes encoding
+    early waits for those ahead of it.
+    """
+
+    def __init__(
+        self,
+        formats: Sequence[str],
+        on_segment: Optional[Callable[[SpeechSegment], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        workers: int = 2,
+    ):
+        """
+        Args:
+            formats: Format names registered in ENCODERS
+            on_segment: Callback for encoded segments
+            on_error: Callback for encoding failures (segment is still delivered)
+            workers: Encoding threads
+
+        Raises:
+            ValueError: If a format is unknown
+        """
+        unknown = [f for f in formats if f not in ENCODERS]
+        if unknown:
+            raise ValueError(
+                f"Unknown encoding formats {unknown}, expected any of {list(ENCODERS)}"
+            )
+
+        self.formats = list(formats)
+        self.on_segment = on_segment
+        self.on_error = on_error
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="hearken-encode"
+        )
+
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._released = 0
+        self._encoded: dict[int, SpeechSegment] = {}
+
+    def submit(self, segment: SpeechSegment) -> concurrent.futures.Future[None]:
+        """Queue a segment for encoding."""
+        with self._lock:
+            seq = self._submitted
+            self._submitted += 1
+        return self._pool.submit(self._encode, seq, segment)
+
+    def close(self, wait: bool = True) -> None:
+        """Stop the worker pool, finishing queued segments if wait is True."""
+        self._pool.shutdown(wait=wait)
+
+    def _encode(self, seq: int, segment: SpeechSegment) -> None:
+        """Encode to every format, then deliver the segment once its turn comes."""
+        for fmt in self.formats:
+            try:
+                get_payload(segment, fmt)
+            except Exception as e:
+                # Transcribers can still fall back to encoding themselves
+                logger.error(f"Encoding segment as {fmt} failed: {e}")
+                if self.on_error:
+                    self.on_error(e)
+
+        # Held while delivering, so segments reach on_segment one at a time, in order
+        with self._lock:
+            self._encoded[seq] = segment
+            while self._released in self._encoded:
+                ready = self._encoded.pop(self._released)
+                self._released += 1
+                self._deliver(ready)
+
+    def _deliver(self, segment: SpeechSegment) -> None:
+        if self.on_segment:
+            try:
+                self.on_segment(segment)
+            except Exception as e:
+                logger.error(f"Segment callback failed: {e}")
@@ -37,6 +37,16 @@ class AudioSource(ABC):
         """Bytes per sample (e.g., 2 for 16-bit)."""
         ...
 
+    @property
+    def supports_backpressure(self) -> bool:
+        """Whether reads can be delayed without losing audio.
+
+        Live devices return False, so a Listener drops chunks when detection
+        falls behind. Files, pipes and replays return True, and capture waits
+        for room instead.
+        """
+        return False
+
     def __enter__(self):
         self.open()
         return self
@@ -53,6 +63,51 @@ class Transcriber(ABC):
         """Transcribe audio to text. May raise exceptions for API errors."""
         ...
 
+    def transcribe_batch(self, segments: list["SpeechSegment"]) -> list[str]:
+        """Transcribe several segments at once, returning texts in order.
+
+        Defaults to one transcribe() call per segment. Batch-capable backends
+        should override this and return True from supports_batch.
+        """
+        return [self.transcribe(segment) for segment in segments]
+
+    @property
+    def supports_batch(self) -> bool:
+        """Whether transcribe_batch is cheaper than separate calls."""
+        return False
+
+    def open_stream(self, sample_rate: int, sample_width: int) -> "TranscriptionStream":
+        """Start uploading an utterance that is still being spoken.
+
+        Streaming-capable backends should override this and return True from
+        supports_streaming.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support streaming")
+
+    @property
+    def supports_streaming(self) -> bool:
+        """Whether open_stream is available."""
+        return False
+
+
+class TranscriptionStream(ABC):
+    """Upload of a single utterance, fed while speech is in progress."""
+
+    @abstractmethod
+    def write(self, data: bytes) -> None:
+        """Send more raw PCM audio."""
+        ...
+
+    @abstractmethod
+    def finish(self, segment: "SpeechSegment") -> str:
+        """Close the upload once the segment has ended and return its transcript."""
+        ...
+
+    @abstractmethod
+    def abort(self) -> None:
+        """Abandon the upload and release its resources."""
+        ...
+
 
 class VAD(ABC):
     """Voice Activity Detection interface."""
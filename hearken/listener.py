@@ -4,15 +4,35 @@ import logging
 import threading
 import queue
 import time
-from typing import Optional, Callable
+from typing import Optional, Callable, Sequence
 
 from .interfaces import AudioSource, Transcriber, VAD
-from .types import AudioChunk, SpeechSegment, DetectorConfig
+from .types import (
+    AudioChunk,
+    SpeechSegment,
+    DetectorConfig,
+    DetectorState,
+    MergeConfig,
+    VADSwitch,
+    WatchdogConfig,
+)
 from .detector import SpeechDetector
+from .merger import SegmentMerger
+from .scheduling import SegmentQueue, SchedulingPolicy
+from .encoding import SegmentEncoder
+from .streaming import StreamingUploader
+from .sources.callback import CallbackAudioSource
+from .recording import CaptureRecorder
+from .watchdog import RealtimeWatchdog
+from .detector_pool import DetectorPool, DetectorStream
 from .vad.energy import EnergyVAD
 
 logger = logging.getLogger("hearken")
 
+# Queued after the last chunk of a finite source, so detection flushes
+# (recognized by identity, never processed)
+_END_OF_STREAM = AudioChunk(data=b"", timestamp=0.0, sample_rate=0, sample_width=0)
+
 
 class Listener:
     """
@@ -33,43 +53,134 @@ class Listener:
         on_error: Optional[Callable[[Exception], None]] = None,
         capture_queue_size: int = 100,
         segment_queue_size: int = 10,
+        merge_config: Optional[MergeConfig] = None,
+        batch_size: int = 1,
+        batch_wait: float = 0.05,
+        scheduling: SchedulingPolicy = "fifo",
+        scheduling_aging: float = 1.0,
+        transcribe_workers: int = 1,
+        encode_formats: Optional[Sequence[str]] = None,
+        encode_workers: int = 2,
+        stream_uploads: bool = False,
+        recorder: Optional[CaptureRecorder] = None,
+        fallback_vads: Optional[Sequence[VAD]] = None,
+        watchdog_config: Optional[WatchdogConfig] = None,
+        on_vad_switch: Optional[Callable[[VADSwitch], None]] = None,
+        detector_pool: Optional[DetectorPool] = None,
+        vad_factory: Optional[Callable[[], VAD]] = None,
     ):
         """
         Args:
             source: Audio input source
             transcriber: Transcription engine (required if on_transcript provided)
-            vad: Voice activity detector (defaults to EnergyVAD)
+            vad: Voice activity detector (defaults to vad_factory() or EnergyVAD;
+                not built with detector_pool)
             detector_config: Detection parameters (uses defaults if None)
             on_speech: Callback for raw speech segments (passive mode)
             on_transcript: Callback for transcribed segments (passive mode)
             on_error: Error callback (defaults to logging.error)
             capture_queue_size: Max chunks in capture queue
             segment_queue_size: Max segments in segment queue
+            merge_config: Coalesce short adjacent segments before queueing
+                (disabled if None)
+            batch_size: Max segments per transcribe_batch() call, used when the
+                transcriber supports batching
+            batch_wait: Max seconds to wait for a batch to fill
+            scheduling: Segment queue order: "fifo", "sjf" (shortest first
+                with aging), or a priority function (lower = sooner)
+            scheduling_aging: Rank improvement per second waited, for "sjf"
+            transcribe_workers: Number of transcription threads
+            encode_formats: Pre-encode segments to these formats (e.g. ["flac"])
+                on a worker pool before queueing (disabled if None)
+            encode_workers: Number of encoding threads
+            stream_uploads: Upload each utterance while it is still being
+                spoken, via the transcriber's open_stream() (passive mode)
+            recorder: Record captured frames and drops for replay (optional)
+            fallback_vads: Cheaper VADs, most expensive first, that a watchdog
+                switches to while detection can't keep up with real time
+                (disabled if None). Each must accept the primary VAD's frame
+                size and the source's sample rate.
+            watchdog_config: Watchdog thresholds (uses defaults if None)
+            on_vad_switch: Callback for each watchdog switch between VADs
+            detector_pool: Run detection in this pool's worker processes
+                instead of a detect thread (optional)
+            vad_factory: Picklable callable creating the VAD, required with
+                detector_pool (each worker builds its own)
         """
         self.source = source
         self.transcriber = transcriber
-        self.vad = vad or EnergyVAD()
+        if vad is None and not detector_pool:
+            vad = vad_factory() if vad_factory else EnergyVAD()
+        # With a pool, VADs are only built in the workers
+        self.vad = vad
         self.detector_config = detector_config or DetectorConfig()
         self.on_speech = on_speech
         self.on_transcript = on_transcript
         self.on_error = on_error or self._default_error_handler
+        self.merge_config = merge_config
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self.transcribe_workers = transcribe_workers
+        self.encode_formats = encode_formats
+        self.encode_workers = encode_workers
+        self.stream_uploads = stream_uploads
+        self.recorder = recorder
+        self.fallback_vads = list(fallback_vads) if fallback_vads else []
+        self.watchdog_config = watchdog_config
+        self.on_vad_switch = on_vad_switch
+        self.detector_pool = detector_pool
+        self.vad_factory = vad_factory or (None if vad else EnergyVAD)
+        self._detector_stream: Optional[DetectorStream] = None
+        self._encoder: Optional[SegmentEncoder] = None
+        self._uploader: Optional[StreamingUploader] = None
 
         # Validate configuration
         if on_transcript and not transcriber:
             raise ValueError("transcriber required when on_transcript is provided")
 
+        if stream_uploads:
+            if not on_transcript:
+                raise ValueError("on_transcript required when stream_uploads is enabled")
+            if transcriber is None or not transcriber.supports_streaming:
+                raise ValueError(f"{type(transcriber).__name__} does not support streaming")
+            if merge_config:
+                raise ValueError("stream_uploads can't be combined with merge_config")
+
+        if detector_pool:
+            if self.vad_factory is None:
+                raise ValueError("detector_pool requires vad_factory (VADs are built in workers)")
+            if stream_uploads or merge_config or fallback_vads:
+                raise ValueError(
+                    "detector_pool can't be combined with stream_uploads, merge_config "
+                    "or fallback_vads"
+                )
+
+        # Every fallback must accept the chunks sized for the primary VAD
+        frame_duration_ms = self.vad.required_frame_duration_ms if self.vad else None
+        for fallback in self.fallback_vads:
+            required = fallback.required_frame_duration_ms
+            if required is not None and required != frame_duration_ms:
+                raise ValueError(
+                    f"Fallback {type(fallback).__name__} requires {required}ms frames, "
+                    f"but the primary VAD uses "
+                    f"{frame_duration_ms or self.detector_config.frame_duration_ms}ms"
+                )
+
         # Queues
         self._capture_queue: queue.Queue[Optional[AudioChunk]] = queue.Queue(
             maxsize=capture_queue_size
         )
-        self._segment_queue: queue.Queue[Optional[SpeechSegment]] = queue.Queue(
-            maxsize=segment_queue_size
+        self._segment_queue: queue.Queue[Optional[SpeechSegment]] = SegmentQueue(
+            maxsize=segment_queue_size, policy=scheduling, aging=scheduling_aging
         )
 
         # Control
         self._running = False
+        self._chunks_captured = 0
+        self._chunks_dropped = 0
         self._threads: list[threading.Thread] = []
         self._stop_event = threading.Event()
+        self._input_done = threading.Event()
 
     def start(self) -> None:
         """Start all pipeline threads."""
@@ -79,29 +190,95 @@ class Listener:
         logger.info("Starting listener")
         self._running = True
         self._stop_event.clear()
+        self._input_done.clear()
+
+        self._chunks_captured = 0
+        self._chunks_dropped = 0
+
+        # Push-style sources deliver chunks from their own callback. With a
+        # pool, the chunk size is known once a worker has built the VAD.
+        pushed = self.source if isinstance(self.source, CallbackAudioSource) else None
+        if pushed is not None and not self.detector_pool:
+            pushed.set_consumer(self._enqueue_chunk, self._chunk_samples())
 
         # Open audio source
         try:
             self.source.open()
         except Exception as e:
             self._running = False
+            if pushed is not None:
+                pushed.set_consumer(None)
             logger.error(f"Failed to open audio source: {e}")
             raise
 
-        # Start threads
-        self._threads = [
-            threading.Thread(target=self._capture_loop, name="hearken-capture", daemon=True),
-            threading.Thread(target=self._detect_loop, name="hearken-detect", daemon=True),
-        ]
+        recording: Optional[CaptureRecorder] = None
+        try:
+            for fallback in self.fallback_vads:
+                required = fallback.required_sample_rate
+                if required is not None and required != self.source.sample_rate:
+                    raise ValueError(
+                        f"Fallback {type(fallback).__name__} requires {required} Hz audio, "
+                        f"but the source delivers {self.source.sample_rate} Hz"
+                    )
+
+            if self.recorder:
+                self.recorder.open(self.source.sample_rate, self.source.sample_width)
+                recording = self.recorder
+
+            if self.detector_pool:
+                assert self.vad_factory is not None  # Checked in __init__
+                self._detector_stream = self.detector_pool.open_stream(
+                    self.vad_factory,
+                    self.detector_config,
+                    self.source.sample_rate,
+                    self.source.sample_width,
+                    on_segment=self._handle_segment,
+                    on_error=self.on_error,
+                )
+                self._detector_stream.wait_ready()
+                if pushed is not None:
+                    pushed.set_consumer(self._enqueue_chunk, self._chunk_samples())
+        except Exception as e:
+            self._running = False
+            if pushed is not None:
+                pushed.set_consumer(None)
+            if self._detector_stream:
+                self._detector_stream.close()
+                self._detector_stream = None
+            if recording is not None:
+                recording.close()
+            self.source.close()
+            logger.error(f"Failed to start listener: {e}")
+            raise
+
+        if self.encode_formats:
+            self._encoder = SegmentEncoder(
+                self.encode_formats,
+                on_segment=self._queue_segment,
+                on_error=self.on_error,
+                workers=self.encode_workers,
+            )
 
-        # Only start transcribe thread if needed for passive mode
-        if self.on_transcript:
+        # Start threads (detection runs in the pool's workers, if given)
+        self._threads = []
+        if not self._detector_stream:
             self._threads.append(
-                threading.Thread(
-                    target=self._transcribe_loop, name="hearken-transcribe", daemon=True
-                )
+                threading.Thread(target=self._detect_loop, name="hearken-detect", daemon=True)
+            )
+        if pushed is None:
+            self._threads.insert(
+                0,
+                threading.Thread(target=self._capture_loop, name="hearken-capture", daemon=True),
             )
 
+        # Only start transcribe threads if needed for passive mode
+        if self.on_transcript:
+            for i in range(self.transcribe_workers):
+                name = "hearken-transcribe" if i == 0 else f"hearken-transcribe-{i}"
+                self._threads.append(
+                    threading.Thread(target=self._transcribe_loop, name=name, daemon=True)
+                )
+
         for t in self._threads:
             t.start()
 
@@ -116,16 +293,21 @@ class Listener:
         self._running = False
         self._stop_event.set()
 
+        # Detach first, so pushed audio stops reaching the recorder and detector stream
+        if isinstance(self.source, CallbackAudioSource):
+            self.source.set_consumer(None)
+
         # Send poison pills
         try:
             self._capture_queue.put_nowait(None)
         except queue.Full:
             pass
 
-        try:
-            self._segment_queue.put_nowait(None)
-        except queue.Full:
-            pass
+        for _ in range(max(1, self.transcribe_workers)):
+            try:
+                self._segment_queue.put_nowait(None)
+            except queue.Full:
+                break
 
         # Wait for threads
         for t in self._threads:
@@ -133,6 +315,21 @@ class Listener:
 
         self._threads.clear()
 
+        if self.recorder:
+            self.recorder.close()
+
+        if self._detector_stream:
+            self._detector_stream.close(timeout=timeout)
+            self._detector_stream = None
+
+        if self._uploader:
+            self._uploader.join(timeout=timeout)
+            self._uploader = None
+
+        if self._encoder:
+            self._encoder.close(wait=False)
+            self._encoder = None
+
         # Close audio source
         try:
             self.source.close()
@@ -143,9 +340,35 @@ class Listener:
 
     def wait(self) -> None:
         """Block until stop() is called or threads exit."""
-        while self._running and any(t.is_alive() for t in self._threads):
+        # A push source with pooled detection may run no threads at all
+        while self._running and (not self._threads or any(t.is_alive() for t in self._threads)):
             time.sleep(0.1)
 
+    def wait_for_end(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until a finite source (file, pipe, replay) is exhausted.
+
+        Returns once detection has emitted the last segment to on_speech or
+        the segment queue; transcription of it may still be in progress.
+
+        Args:
+            timeout: Optional timeout in seconds (None = wait indefinitely)
+
+        Returns:
+            True if the end of input was reached, False on timeout
+        """
+        return self._input_done.wait(timeout)
+
+    @property
+    def chunks_captured(self) -> int:
+        """Chunks handed to detection since start()."""
+        return self._chunks_captured
+
+    @property
+    def chunks_dropped(self) -> int:
+        """Chunks dropped since start() because detection fell behind."""
+        return self._chunks_dropped
+
     def wait_for_speech(self, timeout: Optional[float] = None) -> Optional[SpeechSegment]:
         """
         Block until a speech segment is detected (active mode).
@@ -168,19 +391,64 @@ class Listener:
         except queue.Empty:
             return None
 
+    def _chunk_samples(self) -> int:
+        """Samples per captured chunk."""
+        if self._detector_stream:
+            required = self._detector_stream.frame_duration_ms
+        else:
+            required = self.vad.required_frame_duration_ms if self.vad else None
+        frame_duration_ms = required or self.detector_config.frame_duration_ms
+        return int(self.source.sample_rate * frame_duration_ms / 1000)
+
+    def _enqueue_chunk(self, chunk: AudioChunk, wait: bool = False) -> None:
+        """Put a captured chunk on the capture queue, dropping it if full unless wait."""
+        if self.recorder:
+            self.recorder.record_frame(chunk)
+
+        if self._offer_chunk(chunk, wait):
+            self._chunks_captured += 1
+        else:
+            if self.recorder:
+                self.recorder.record_drop(chunk)
+            self._chunks_dropped += 1
+            if self._chunks_dropped % 100 == 0:
+                total = self._chunks_captured + self._chunks_dropped
+                drop_rate = self._chunks_dropped / total * 100
+                logger.warning(
+                    f"Capture queue full, dropped {self._chunks_dropped} chunks ({drop_rate:.1f}%)"
+                )
+
+    def _offer_chunk(self, chunk: AudioChunk, wait: bool = False) -> bool:
+        """Hand a chunk to detection; returns False if it was dropped."""
+        if self._detector_stream:
+            while not self._detector_stream.write(chunk):
+                if not wait or not self._running:
+                    return False
+                time.sleep(0.005)
+            return True
+
+        if not wait:
+            try:
+                self._capture_queue.put_nowait(chunk)
+                return True
+            except queue.Full:
+                return False
+
+        while self._running:
+            try:
+                self._capture_queue.put(chunk, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
     def _capture_loop(self) -> None:
         """Capture thread: reads audio chunks at fixed intervals."""
-        frame_duration_ms = (
-            self.vad.required_frame_duration_ms or self.detector_config.frame_duration_ms
-        )
-        chunk_samples = int(self.source.sample_rate * frame_duration_ms / 1000)
-
-        logger.debug(
-            f"Capture thread started (frame_duration={frame_duration_ms}ms, samples={chunk_samples})"
-        )
+        chunk_samples = self._chunk_samples()
+        # Files and pipes wait for detection rather than losing audio
+        wait = self.source.supports_backpressure
 
-        chunks_captured = 0
-        chunks_dropped = 0
+        logger.debug(f"Capture thread started (samples={chunk_samples}, wait={wait})")
 
         while self._running:
             try:
@@ -194,18 +462,14 @@ class Listener:
                     sample_width=self.source.sample_width,
                 )
 
-                # Non-blocking put
-                try:
-                    self._capture_queue.put_nowait(chunk)
-                    chunks_captured += 1
-                except queue.Full:
-                    chunks_dropped += 1
-                    if chunks_dropped % 100 == 0:
-                        drop_rate = chunks_dropped / (chunks_captured + chunks_dropped) * 100
-                        logger.warning(
-                            f"Capture queue full, dropped {chunks_dropped} chunks ({drop_rate:.1f}%)"
-                        )
+                # Non-blocking put for live sources
+                self._enqueue_chunk(chunk, wait)
 
+            except EOFError:
+                # Finite sources (files, pipes) end the capture cleanly
+                logger.info("Audio source exhausted")
+                self._end_of_input()
+                break
             except Exception as e:
                 if self._running:
                     logger.error(f"Capture error: {e}")
@@ -213,19 +477,59 @@ class Listener:
                 break
 
         logger.debug(
-            f"Capture thread stopped (captured={chunks_captured}, dropped={chunks_dropped})"
+            f"Capture thread stopped "
+            f"(captured={self._chunks_captured}, dropped={self._chunks_dropped})"
         )
 
+    def _end_of_input(self) -> None:
+        """Have detection emit the segment in progress once the source is exhausted."""
+        if self._detector_stream:
+            self._detector_stream.flush()
+            self._input_done.set()
+            return
+
+        # Unlike chunks, the marker must not be dropped on a full queue
+        while self._running:
+            try:
+                self._capture_queue.put(_END_OF_STREAM, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
     def _detect_loop(self) -> None:
         """Detection thread: runs VAD and FSM to segment audio."""
+        # Only None with a detector pool, which has no detect thread
+        assert self.vad is not None
+
+        merger = None
+        if self.merge_config:
+            merger = SegmentMerger(self.merge_config, on_segment=self._handle_segment)
+
+        if self.stream_uploads:
+            # Checked in __init__
+            assert self.transcriber is not None and self.on_transcript is not None
+            self._uploader = StreamingUploader(
+                self.transcriber, self.on_transcript, on_error=self.on_error
+            )
+
+        watchdog = None
+        if self.fallback_vads:
+            watchdog = RealtimeWatchdog(
+                [self.vad, *self.fallback_vads],
+                self.watchdog_config,
+                on_switch=self._handle_vad_switch,
+            )
+
         detector = SpeechDetector(
             vad=self.vad,
             config=self.detector_config,
-            on_segment=self._handle_segment,
+            on_segment=merger.add if merger else self._handle_segment,
+            on_audio=self._uploader.write if self._uploader else None,
         )
 
         logger.debug("Detection thread started")
 
+        ended = False
         while self._running:
             try:
                 chunk = self._capture_queue.get(timeout=0.1)
@@ -235,7 +539,42 @@ class Listener:
             if chunk is None:  # Poison pill
                 break
 
-            detector.process(chunk)
+            if chunk is _END_OF_STREAM:
+                detector.flush()
+                ended = True
+                break
+
+            if watchdog:
+                start = time.perf_counter()
+                detector.process(chunk)
+                vad = watchdog.observe(
+                    time.perf_counter() - start,
+                    len(chunk.data) / chunk.sample_width / chunk.sample_rate,
+                    self._capture_fill(),
+                )
+                if vad is not None:
+                    vad.reset()
+                    if isinstance(vad, EnergyVAD):
+                        # Calibrate on what the previous VAD heard as noise,
+                        # not on the speech that may be in progress
+                        vad.calibrate(detector.recent_noise())
+                    detector.vad = vad
+            else:
+                detector.process(chunk)
+
+            if merger and detector.stream_time is not None:
+                # Same clock as the segment times (the sample clock, if enabled)
+                merger.poll(detector.stream_time, idle=detector.state == DetectorState.IDLE)
+
+        if merger:
+            merger.flush()
+
+        if self._uploader:
+            # Utterance cut off by stop() never completes
+            self._uploader.abort()
+
+        if ended:
+            self._input_done.set()
 
         logger.debug("Detection thread stopped")
 
@@ -251,7 +590,28 @@ class Listener:
             )
             t.start()
 
-        # Queue for active mode or transcription
+        # Already being uploaded as it was spoken
+        if self._uploader and self._uploader.finish(segment):
+            return
+
+        # Queue for active mode or transcription, encoding first if configured
+        if self._encoder:
+            self._encoder.submit(segment)
+        else:
+            self._queue_segment(segment)
+
+    def _capture_fill(self) -> float:
+        """Capture queue fill from 0.0 to 1.0 (0.0 if unbounded)."""
+        maxsize = self._capture_queue.maxsize
+        return self._capture_queue.qsize() / maxsize if maxsize > 0 else 0.0
+
+    def _handle_vad_switch(self, event: VADSwitch) -> None:
+        """Report a watchdog switch between VADs."""
+        if self.on_vad_switch:
+            self._safe_callback(self.on_vad_switch, event)
+
+    def _queue_segment(self, segment: SpeechSegment) -> None:
+        """Put a segment on the segment queue without blocking."""
         try:
             self._segment_queue.put_nowait(segment)
         except queue.Full:
@@ -269,6 +629,12 @@ class Listener:
         """Transcription thread: transcribes segments and invokes callback."""
         logger.debug("Transcription thread started")
 
+        # Transcribe threads only run with on_transcript, which requires a transcriber
+        transcriber = self.transcriber
+        assert transcriber is not None
+
+        batching = self.batch_size > 1 and transcriber.supports_batch
+
         while self._running:
             try:
                 segment = self._segment_queue.get(timeout=0.1)
@@ -278,18 +644,17 @@ class Listener:
             if segment is None:  # Poison pill
                 break
 
+            if batching:
+                batch, stopped = self._collect_batch(segment)
+                self._transcribe_batch(transcriber, batch)
+                if stopped:
+                    break
+                continue
+
             try:
                 # Transcribe - may release GIL during network I/O
-                text = self.transcriber.transcribe(segment)
-
-                # Fire callback asynchronously (don't block transcription)
-                if self.on_transcript:
-                    threading.Thread(
-                        target=self._safe_callback,
-                        args=(self.on_transcript, text, segment),
-                        daemon=False,
-                        name="hearken-callback",
-                    ).start()
+                text = transcriber.transcribe(segment)
+                self._deliver_transcript(text, segment)
 
             except Exception as e:
                 logger.error(f"Transcription failed: {e}")
@@ -297,6 +662,57 @@ class Listener:
 
         logger.debug("Transcription thread stopped")
 
+    def _collect_batch(self, first: SpeechSegment) -> tuple[list[SpeechSegment], bool]:
+        """Drain up to batch_size segments, waiting at most batch_wait.
+
+        Returns:
+            The batch, and whether the poison pill was reached
+        """
+        batch = [first]
+        deadline = time.monotonic() + self.batch_wait
+
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    segment = self._segment_queue.get(timeout=remaining)
+                else:
+                    segment = self._segment_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if segment is None:  # Poison pill
+                return batch, True
+            batch.append(segment)
+
+        return batch, False
+
+    def _transcribe_batch(self, transcriber: Transcriber, batch: list[SpeechSegment]) -> None:
+        """Transcribe a batch in one call and deliver each result."""
+        try:
+            texts = transcriber.transcribe_batch(batch)
+            if len(texts) != len(batch):
+                raise RuntimeError(
+                    f"transcribe_batch returned {len(texts)} results for {len(batch)} segments"
+                )
+        except Exception as e:
+            logger.error(f"Batch transcription failed: {e}")
+            self.on_error(e)
+            return
+
+        for text, segment in zip(texts, batch):
+            self._deliver_transcript(text, segment)
+
+    def _deliver_transcript(self, text: str, segment: SpeechSegment) -> None:
+        """Fire on_transcript asynchronously (don't block transcription)."""
+        if self.on_transcript:
+            threading.Thread(
+                target=self._safe_callback,
+                args=(self.on_transcript, text, segment),
+                daemon=False,
+                name="hearken-callback",
+            ).start()
+
     def _default_error_handler(self, error: Exception) -> None:
         """Default error handler - just logs."""
         logger.error(f"Pipeline error: {error}", exc_info=True)
@@ -0,0 +1,137 @@
+"""Coalescing of short adjacent speech segments."""
+
+import logging
+from typing import Optional, Callable
+
+from .types import SpeechSegment, MergeConfig
+
+logger = logging.getLogger("hearken.merger")
+
+
+class SegmentMerger:
+    """
+    Coalesces short adjacent speech segments into one.
+
+    Rapid back-and-forth speech produces many sub-second segments, each a
+    separate transcription round trip. The merger holds a segment back
+    briefly and appends following segments that start within `max_gap`
+    of it, up to the duration/size caps. The merged segment records each
+    part's boundaries in `SpeechSegment.parts`.
+
+    All times are stream times on the detector's clock (see
+    `SpeechDetector.stream_time`), not wall-clock times.
+    """
+
+    def __init__(
+        self,
+        config: Optional[MergeConfig] = None,
+        on_segment: Optional[Callable[[SpeechSegment], None]] = None,
+    ):
+        """
+        Args:
+            config: Merge configuration (uses defaults if None)
+            on_segment: Callback for merged (or passed-through) segments
+        """
+        self.config = config or MergeConfig()
+        self.on_segment = on_segment
+
+        self._pending: list[SpeechSegment] = []
+        self._pending_bytes = 0
+        self._pending_seconds = 0.0
+
+    def add(self, segment: SpeechSegment) -> None:
+        """
+        Add a newly detected segment.
+
+        Args:
+            segment: Segment emitted by the detector
+        """
+        if self._pending and not self._can_merge(segment):
+            self.flush()
+
+        self._pending.append(segment)
+        self._pending_bytes += len(segment.audio_data)
+        self._pending_seconds += segment.audio_duration
+
+        if not self._has_room():
+            self.flush()
+
+    def poll(self, now: float, idle: bool = True) -> None:
+        """
+        Release the held segment once no neighbour can arrive in time.
+
+        Args:
+            now: Current stream time, on the clock segments are stamped with
+            idle: Whether the detector is idle (no segment in progress)
+        """
+        if not self._pending:
+            return
+
+        held = now - self._pending[0].end_time
+        gap = now - self._pending[-1].end_time
+        if held >= self.config.max_hold or (idle and gap > self.config.max_gap):
+            self.flush()
+
+    def flush(self) -> None:
+        """Emit the held segments, merged into one."""
+        if not self._pending:
+            return
+
+        parts = self._pending
+        self._pending = []
+        self._pending_bytes = 0
+        self._pending_seconds = 0.0
+
+        segment = parts[0] if len(parts) == 1 else self._merge(parts)
+
+        if self.on_segment:
+            try:
+                self.on_segment(segment)
+            except Exception as e:
+                logger.error(f"Segment callback failed: {e}")
+
+    def _can_merge(self, segment: SpeechSegment) -> bool:
+        """Check whether a segment can join the held ones."""
+        last = self._pending[-1]
+        return (
+            segment.start_time - last.end_time <= self.config.max_gap
+            and self._pending_seconds + segment.audio_duration <= self.config.max_duration
+            and (
+                self.config.max_bytes is None
+                or self._pending_bytes + len(segment.audio_data) <= self.config.max_bytes
+            )
+        )
+
+    def _has_room(self) -> bool:
+        """Check whether the held segments can still take another part."""
+        if self._pending_seconds >= self.config.max_duration:
+            return False
+        return self.config.max_bytes is None or self._pending_bytes < self.config.max_bytes
+
+    @staticmethod
+    def _merge(parts: list[SpeechSegment]) -> SpeechSegment:
+        """Concatenate segments, recording where each part starts."""
+        first = parts[0]
+        bytes_per_second = first.sample_rate * first.sample_width
+
+        boundaries = []
+        time_map: list[tuple[float, float]] = []
+        offset = 0.0
+        for part in parts:
+            boundaries.append((offset, part.start_time, part.end_time))
+            # An uncompacted part is one contiguous run from its start time
+            part_map = part.time_map or [(0.0, part.start_time)]
+            time_map.extend((offset + o, t) for o, t in part_map)
+            offset += len(part.audio_data) / bytes_per_second
+
+        logger.info(f"Merged {len(parts)} segments into {offset:.2f}s of audio")
+
+        return SpeechSegment(
+            audio_data=b"".join(p.audio_data for p in parts),
+            sample_rate=first.sample_rate,
+            sample_width=first.sample_width,
+            start_time=first.start_time,
+            end_time=parts[-1].end_time,
+            time_map=time_map,
+            parts=boundaries,
+        )
@@ -0,0 +1,174 @@
+"""Recording of captured audio for deterministic replay."""
+
+import dataclasses
+import logging
+import os
+import queue
+import struct
+import threading
+from typing import BinaryIO, Generator, Optional
+
+from .types import AudioChunk
+
+logger = logging.getLogger("hearken")
+
+# File layout: header, then records appended in capture order
+_MAGIC = b"HKRC"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBIB")  # magic, version, sample rate, sample width
+_RECORD = struct.Struct("<BdI")  # kind, capture timestamp, payload length
+
+_FRAME = 1
+_DROP = 2
+
+# Records for the writer thread: (kind, timestamp, payload), or None to flush and exit
+_WriteQueue = queue.SimpleQueue[Optional[tuple[int, float, bytes]]]
+
+
+@dataclasses.dataclass
+class RecordedFrame:
+    """A captured frame read back from a recording."""
+
+    data: bytes
+    timestamp: float
+    dropped: bool = False
+
+
+def _read_header(f: BinaryIO) -> tuple[int, int]:
+    raw = f.read(_HEADER.size)
+    if len(raw) < _HEADER.size:
+        raise ValueError("Recording is truncated")
+    magic, version, sample_rate, sample_width = _HEADER.unpack(raw)
+    if magic != _MAGIC:
+        raise ValueError("Not a hearken capture recording")
+    if version != _VERSION:
+        raise ValueError(f"Unsupported recording version {version}")
+    return sample_rate, sample_width
+
+
+def recording_format(path: str) -> tuple[int, int]:
+    """
+    Read the audio format of a recording.
+
+    Returns:
+        (sample_rate, sample_width)
+
+    Raises:
+        ValueError: If the file isn't a capture recording
+    """
+    with open(path, "rb") as f:
+        return _read_header(f)
+
+
+def read_recording(path: str) -> Generator[RecordedFrame, None, None]:
+    """
+    Iterate over the frames of a recording.
+
+    A frame the capture queue dropped is returned with dropped=True. A
+    record cut short by a crash ends the iteration.
+
+    Raises:
+        ValueError: If the file isn't a capture recording
+    """
+    with open(path, "rb") as f:
+        _read_header(f)
+        pending: Optional[RecordedFrame] = None
+        while True:
+            raw = f.read(_RECORD.size)
+            if len(raw) < _RECORD.size:
+                break
+            kind, timestamp, length = _RECORD.unpack(raw)
+            payload = f.read(length)
+            if len(payload) < length:
+                break
+
+            if kind == _DROP:
+                # Marks the frame recorded just before it
+                if pending is not None:
+                    pending.dropped = True
+                continue
+
+            if pending is not None:
+                yield pending
+            pending = RecordedFrame(data=payload, timestamp=timestamp)
+
+        if pending is not None:
+            yield pending
+
+
+class CaptureRecorder:
+    """
+    Records captured frames, their timestamps and queue drops to a file.
+
+    Pass to `Listener(recorder=...)`. The capture path only puts references
+    on an in-memory queue; a background thread does the buffered writes.
+    The file is append-only, so a crash loses at most the unflushed tail.
+    Replay with ReplayAudioSource.
+    """
+
+    def __init__(self, path: str, buffer_size: int = 1 << 16):
+        """
+        Args:
+            path: Recording file (appended to if it already exists)
+            buffer_size: Write buffer size in bytes
+        """
+        self.path = path
+        self.buffer_size = buffer_size
+        self._queue = _WriteQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._file: Optional[BinaryIO] = None
+
+    def open(self, sample_rate: int, sample_width: int) -> None:
+        """
+        Open the file and start the writer thread.
+
+        Raises:
+            ValueError: If appending to a recording with a different format
+        """
+        exists = os.path.exists(self.path) and os.path.getsize(self.path) > 0
+        if exists:
+            with open(self.path, "rb") as f:
+                if _read_header(f) != (sample_rate, sample_width):
+                    raise ValueError(f"{self.path} was recorded with a different audio format")
+
+        self._file = open(self.path, "ab", buffering=self.buffer_size)
+        if not exists:
+            self._file.write(_HEADER.pack(_MAGIC, _VERSION, sample_rate, sample_width))
+
+        self._thread = threading.Thread(
+            target=self._write_loop, args=(self._file,), name="hearken-recorder", daemon=True
+        )
+        self._thread.start()
+
+    def record_frame(self, chunk: AudioChunk) -> None:
+        """Queue a captured frame for writing."""
+        self._queue.put((_FRAME, chunk.timestamp, chunk.data))
+
+    def record_drop(self, chunk: AudioChunk) -> None:
+        """Mark the last recorded frame as dropped by the capture queue."""
+        self._queue.put((_DROP, chunk.timestamp, b""))
+
+    def close(self) -> None:
+        """Write everything queued so far and close the file."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        file, self._file = self._file, None
+        if file is not None:
+            file.close()
+
+    def _write_loop(self, file: BinaryIO) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                file.flush()
+                return
+
+            kind, timestamp, data = item
+            try:
+                file.write(_RECORD.pack(kind, timestamp, len(data)))
+                file.write(data)
+            except OSError as e:
+                logger.error(f"Capture recording failed: {e}")
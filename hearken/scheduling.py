@@ -0,0 +1,75 @@
+"""Scheduling policies for the segment queue."""
+
+import heapq
+import itertools
+import queue
+import time
+from typing import Callable, Optional, Union
+
+from .types import SpeechSegment
+
+SchedulingPolicy = Union[str, Callable[[SpeechSegment], float]]
+
+
+class SegmentQueue(queue.Queue[Optional[SpeechSegment]]):
+    """
+    Thread-safe segment queue with a pluggable scheduling policy.
+
+    Policies:
+    - "fifo": first in, first out (default)
+    - "sjf": shortest segment first, with aging so long segments aren't
+      starved. A segment's rank improves by `aging` seconds for every
+      second it waits, so a 30s dictation waits at most ~30s/aging
+      behind a stream of short commands.
+    - callable: caller-supplied priority function of the segment; lower
+      values are served first, ties in arrival order.
+
+    The poison pill (None) is always served after every queued segment.
+    """
+
+    POLICIES = ["fifo", "sjf"]
+
+    def __init__(self, maxsize: int = 0, policy: SchedulingPolicy = "fifo", aging: float = 1.0):
+        """
+        Args:
+            maxsize: Max queued items (0 = unbounded)
+            policy: "fifo", "sjf", or a priority function
+            aging: Rank improvement per second waited, for "sjf"
+
+        Raises:
+            ValueError: If policy is an unknown name
+        """
+        if not callable(policy) and policy not in self.POLICIES:
+            raise ValueError(f"Policy must be one of {self.POLICIES} or a callable, got {policy!r}")
+
+        self.policy = policy
+        self.aging = aging
+        super().__init__(maxsize)
+
+    # queue.Queue extension hooks, called with the queue's lock held
+
+    def _init(self, maxsize: int) -> None:
+        self._heap: list[tuple[float, int, Optional[SpeechSegment]]] = []
+        self._counter = itertools.count()
+
+    def _qsize(self) -> int:
+        return len(self._heap)
+
+    def _put(self, item: Optional[SpeechSegment]) -> None:
+        heapq.heappush(self._heap, (self._rank(item), next(self._counter), item))
+
+    def _get(self) -> Optional[SpeechSegment]:
+        return heapq.heappop(self._heap)[2]
+
+    def _rank(self, item: Optional[SpeechSegment]) -> float:
+        """Heap key for an item; lower is served sooner."""
+        if item is None:
+            return float("inf")
+        if callable(self.policy):
+            return float(self.policy(item))
+        if self.policy == "sjf":
+            # duration - aging * (now - enqueued) orders the same as
+            # duration + aging * enqueued, which never changes once queued.
+            # Transcription cost follows the audio sent, not the span it covers.
+            return item.audio_duration + self.aging * time.monotonic()
+        return 0.0
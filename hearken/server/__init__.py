@@ -0,0 +1,6 @@
+"""Network ingestion of remote audio streams."""
+
+from .ingest import IngestServer, VADPool
+from .websocket import WebSocket
+
+__all__ = ["IngestServer", "VADPool", "WebSocket"]
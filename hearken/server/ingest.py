@@ -0,0 +1,371 @@
+"""asyncio ingestion server for remote PCM streams."""
+
+import asyncio
+import base64
+import concurrent.futures
+import json
+import logging
+import os
+import struct
+import threading
+from typing import Any, Awaitable, Callable, Optional
+
+from ..detector import SpeechDetector
+from ..interfaces import Transcriber, VAD
+from ..types import AudioChunk, DetectorConfig, SpeechSegment
+from ..vad.energy import EnergyVAD
+from .websocket import WebSocket
+
+logger = logging.getLogger("hearken")
+
+# Raw TCP framing: every message is a 4-byte big-endian length plus payload
+_LENGTH = struct.Struct("!I")
+
+
+class VADPool:
+    """
+    Recycles VAD instances across streams.
+
+    Streams check a VAD out for their lifetime and return it when they end,
+    so expensive models (e.g. Silero's ONNX session) are built once per
+    concurrent stream rather than once per connection. Returned VADs are
+    reset before reuse. Safe to release from detection threads.
+    """
+
+    def __init__(self, factory: Callable[[], VAD], max_idle: int = 64):
+        """
+        Args:
+            factory: Creates a new VAD when none is idle
+            max_idle: Most idle VADs kept for reuse
+        """
+        self.factory = factory
+        self.max_idle = max_idle
+        self._idle: list[VAD] = []
+        self._lock = threading.Lock()
+        self.created = 0
+
+    def acquire(self) -> VAD:
+        """Take an idle VAD, or create one."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+            self.created += 1
+        return self.factory()
+
+    def release(self, vad: VAD) -> None:
+        """Return a VAD for reuse by a later stream."""
+        with self._lock:
+            if len(self._idle) >= self.max_idle:
+                return
+        vad.reset()
+        with self._lock:
+            self._idle.append(vad)
+
+
+class _Stream:
+    """Detection state of one connection."""
+
+    def __init__(self, vad: VAD, config: DetectorConfig, sample_rate: int, sample_width: int):
+        self.vad = vad
+        self._segments: list[SpeechSegment] = []
+        self.detector = SpeechDetector(vad, config, on_segment=self._segments.append)
+
+        frame_duration_ms = vad.required_frame_duration_ms or config.frame_duration_ms
+        self._sample_rate = sample_rate
+        self._sample_width = sample_width
+        self._frame_samples = int(sample_rate * frame_duration_ms / 1000)
+        self._frame_bytes = self._frame_samples * sample_width
+        self._buffer = bytearray()
+        self._samples = 0
+
+    def feed(self, data: bytes) -> list[SpeechSegment]:
+        """Run received audio through the detector; returns finished segments."""
+        self._buffer += data
+        offset = 0
+        while len(self._buffer) - offset >= self._frame_bytes:
+            frame = bytes(self._buffer[offset : offset + self._frame_bytes])
+            offset += self._frame_bytes
+            self.detector.process(
+                AudioChunk(
+                    data=frame,
+                    timestamp=self._samples / self._sample_rate,
+                    sample_rate=self._sample_rate,
+                    sample_width=self._sample_width,
+                )
+            )
+            self._samples += self._frame_samples
+        del self._buffer[:offset]
+        return self._take()
+
+    def finish(self) -> list[SpeechSegment]:
+        """End of stream: emit any segment in progress."""
+        self.detector.flush()
+        return self._take()
+
+    def _take(self) -> list[SpeechSegment]:
+        segments = list(self._segments)
+        self._segments.clear()
+        return segments
+
+
+class IngestServer:
+    """
+    Accepts many concurrent PCM streams and segments each one.
+
+    Every connection gets its own SpeechDetector (with a VAD from a shared
+    VADPool); detection runs on a shared thread pool so the event loop only
+    moves bytes. Results go back over the same connection as JSON messages:
+    {"type": "segment", ...} or, with a transcriber, {"type": "transcript",
+    "text": ...}, followed by {"type": "end"} once the stream is done.
+
+    Protocols (all audio is raw PCM at the server's sample rate and width):
+    - Raw TCP: length-prefixed messages (4-byte big-endian length). A
+      zero-length message ends the stream; replies use the same framing.
+    - WebSocket: binary messages carry audio, a text message "end" (or
+      closing the socket) ends the stream; replies are text messages.
+
+    Example:
+        server = IngestServer(vad_factory=lambda: WebRTCVAD(aggressiveness=2))
+        await server.start_tcp("0.0.0.0", 9000)
+        await server.start_websocket("0.0.0.0", 9001)
+        await server.serve_forever()
+    """
+
+    def __init__(
+        self,
+        vad_factory: Callable[[], VAD] = EnergyVAD,
+        detector_config: Optional[DetectorConfig] = None,
+        transcriber: Optional[Transcriber] = None,
+        sample_rate: int = 16000,
+        sample_width: int = 2,
+        workers: Optional[int] = None,
+        transcribe_workers: int = 4,
+        include_audio: bool = False,
+        max_message_bytes: int = 1 << 20,
+    ):
+        """
+        Args:
+            vad_factory: Creates VADs for the shared pool
+            detector_config: Detection parameters for every stream
+            transcriber: Transcribe segments and reply with text (optional)
+            sample_rate: Sample rate of incoming audio in Hz
+            sample_width: Bytes per sample of incoming audio
+            workers: Detection threads (defaults to the CPU count)
+            transcribe_workers: Transcription threads
+            include_audio: Add base64 segment audio to segment messages
+            max_message_bytes: Largest accepted audio message
+
+        Raises:
+            ValueError: If sample format or worker counts are invalid
+        """
+        if sample_rate <= 0 or sample_width <= 0:
+            raise ValueError(f"Invalid sample format: rate={sample_rate}, width={sample_width}")
+
+        workers = workers or os.cpu_count() or 1
+        if workers < 1 or transcribe_workers < 1:
+            raise ValueError(
+                f"Worker counts must be at least 1, got {workers} and {transcribe_workers}"
+            )
+
+        self.detector_config = detector_config or DetectorConfig()
+        self.transcriber = transcriber
+        self.sample_rate = sample_rate
+        self.sample_width = sample_width
+        self.include_audio = include_audio
+        self.max_message_bytes = max_message_bytes
+
+        self.vad_pool = VADPool(vad_factory)
+        self._detect_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="hearken-ingest"
+        )
+        self._transcribe_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=transcribe_workers, thread_name_prefix="hearken-ingest-transcribe"
+        )
+
+        self._servers: list[asyncio.Server] = []
+        self._writers: set[asyncio.StreamWriter] = set()
+        self.active_streams = 0
+        self.total_streams = 0
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.Server:
+        """Listen for raw TCP streams; returns the asyncio server."""
+        server = await asyncio.start_server(self._handle_tcp, host, port)
+        self._servers.append(server)
+        logger.info(f"Ingest TCP server listening on {server.sockets[0].getsockname()}")
+        return server
+
+    async def start_websocket(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.Server:
+        """Listen for WebSocket streams; returns the asyncio server."""
+        server = await asyncio.start_server(self._handle_websocket, host, port)
+        self._servers.append(server)
+        logger.info(f"Ingest WebSocket server listening on {server.sockets[0].getsockname()}")
+        return server
+
+    async def serve_forever(self) -> None:
+        """Serve until cancelled."""
+        await asyncio.gather(*(server.serve_forever() for server in self._servers))
+
+    async def close(self) -> None:
+        """Stop listening, drop open connections and shut down worker pools."""
+        for server in self._servers:
+            server.close()
+        for writer in list(self._writers):
+            writer.close()
+        for server in self._servers:
+            await server.wait_closed()
+        self._servers.clear()
+
+        self._detect_pool.shutdown(wait=False)
+        self._transcribe_pool.shutdown(wait=False)
+
+    async def _handle_tcp(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        async def receive() -> Optional[bytes]:
+            try:
+                (length,) = _LENGTH.unpack(await reader.readexactly(_LENGTH.size))
+                if length > self.max_message_bytes:
+                    raise ValueError(f"Message of {length} bytes exceeds limit")
+                # A zero-length message ends the stream
+                return await reader.readexactly(length) if length else None
+            except asyncio.IncompleteReadError:
+                return None
+
+        async def send(message: bytes) -> None:
+            writer.write(_LENGTH.pack(len(message)) + message)
+            await writer.drain()
+
+        await self._run_connection(writer, receive, send)
+
+    async def _handle_websocket(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            ws = await WebSocket.accept(reader, writer, max_size=self.max_message_bytes)
+        except ConnectionError as e:
+            logger.debug(f"Rejected connection: {e}")
+            return
+
+        async def receive() -> Optional[bytes]:
+            message = await ws.recv()
+            if isinstance(message, str):
+                # "end" closes the stream; other text messages are ignored
+                return None if message.strip() == "end" else b""
+            return message
+
+        async def send(message: bytes) -> None:
+            await ws.send(message.decode("utf-8"))
+
+        await self._run_connection(writer, receive, send)
+        await ws.close()
+
+    async def _run_connection(
+        self,
+        writer: asyncio.StreamWriter,
+        receive: Callable[[], Awaitable[Optional[bytes]]],
+        send: Callable[[bytes], Awaitable[None]],
+    ) -> None:
+        """
+        Drive one stream: receive audio, detect, reply, until the stream ends.
+
+        `receive` returns None at the end of the stream.
+        """
+        lock = asyncio.Lock()
+        pending: set[asyncio.Task[None]] = set()
+        # Last detection job; cancelling the await doesn't stop its thread
+        detecting: Optional[concurrent.futures.Future[list[SpeechSegment]]] = None
+
+        async def detect(
+            call: Callable[..., list[SpeechSegment]], *args: Any
+        ) -> list[SpeechSegment]:
+            nonlocal detecting
+            detecting = self._detect_pool.submit(call, *args)
+            return await asyncio.wrap_future(detecting)
+
+        async def reply(message: dict[str, Any]) -> None:
+            async with lock:
+                await send(json.dumps(message).encode("utf-8"))
+
+        stream = _Stream(
+            self.vad_pool.acquire(), self.detector_config, self.sample_rate, self.sample_width
+        )
+        self._writers.add(writer)
+        self.active_streams += 1
+        self.total_streams += 1
+
+        try:
+            while True:
+                data = await receive()
+                if data is None:
+                    break
+                if not data:
+                    continue
+
+                # Awaited per message, so each stream's frames stay in order
+                segments = await detect(stream.feed, data)
+                for segment in segments:
+                    await self._dispatch(segment, reply, pending)
+
+            for segment in await detect(stream.finish):
+                await self._dispatch(segment, reply, pending)
+
+            if pending:
+                await asyncio.gather(*pending)
+            await reply({"type": "end"})
+        except (ConnectionError, ValueError) as e:
+            logger.warning(f"Ingest stream failed: {e}")
+        finally:
+            for task in pending:
+                task.cancel()
+            if detecting is not None and not detecting.done():
+                # Cancelled mid-detection: the VAD is in use until the job ends
+                detecting.add_done_callback(lambda _: self.vad_pool.release(stream.vad))
+            else:
+                self.vad_pool.release(stream.vad)
+            self.active_streams -= 1
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _dispatch(
+        self,
+        segment: SpeechSegment,
+        reply: Callable[[dict[str, Any]], Awaitable[None]],
+        pending: set[asyncio.Task[None]],
+    ) -> None:
+        """Reply with a segment, or start transcribing it."""
+        if self.transcriber is None:
+            await reply(self._segment_message(segment))
+            return
+
+        task = asyncio.create_task(self._transcribe(self.transcriber, segment, reply))
+        pending.add(task)
+        task.add_done_callback(pending.discard)
+
+    async def _transcribe(
+        self,
+        transcriber: Transcriber,
+        segment: SpeechSegment,
+        reply: Callable[[dict[str, Any]], Awaitable[None]],
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            text = await loop.run_in_executor(
+                self._transcribe_pool, transcriber.transcribe, segment
+            )
+        except Exception as e:
+            logger.error(f"Transcription failed: {e}")
+            await reply({"type": "error", "message": str(e), **self._times(segment)})
+            return
+        await reply({"type": "transcript", "text": text, **self._times(segment)})
+
+    def _segment_message(self, segment: SpeechSegment) -> dict[str, Any]:
+        message = {"type": "segment", **self._times(segment)}
+        if self.include_audio:
+            message["audio"] = base64.b64encode(segment.audio_data).decode("ascii")
+        return message
+
+    @staticmethod
+    def _times(segment: SpeechSegment) -> dict[str, float]:
+        return {
+            "start": segment.start_time,
+            "end": segment.end_time,
+            "duration": segment.duration,
+        }
@@ -0,0 +1,207 @@
+"""
+Load generator for IngestServer.
+
+Streams synthetic speech from many concurrent clients and reports how much
+audio the server segmented per second of CPU time, i.e. how many real-time
+streams one core can sustain.
+
+Usage:
+    python -m hearken.server.loadgen --streams 50 --seconds 10 --protocol tcp
+"""
+
+import argparse
+import asyncio
+import dataclasses
+import json
+import struct
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+from ..benchmark.audio import synthetic_speech
+from .ingest import IngestServer
+from .websocket import WebSocket
+
+_LENGTH = struct.Struct("!I")
+
+
+@dataclasses.dataclass
+class LoadResult:
+    """Outcome of a load run."""
+
+    streams: int
+    protocol: str
+    audio_seconds: float
+    wall_seconds: float
+    cpu_seconds: float
+    segments: int
+
+    @property
+    def realtime_factor(self) -> float:
+        """Audio seconds processed per wall-clock second."""
+        return self.audio_seconds / self.wall_seconds if self.wall_seconds else 0.0
+
+    @property
+    def streams_per_core(self) -> float:
+        """Real-time streams one fully busy core could sustain."""
+        return self.audio_seconds / self.cpu_seconds if self.cpu_seconds else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            **dataclasses.asdict(self),
+            "realtime_factor": self.realtime_factor,
+            "streams_per_core": self.streams_per_core,
+        }
+
+
+async def _send_paced(
+    send: Callable[[bytes], Awaitable[None]],
+    audio: bytes,
+    frame_bytes: int,
+    frame_seconds: float,
+    realtime: bool,
+) -> None:
+    start = time.monotonic()
+    for i, offset in enumerate(range(0, len(audio), frame_bytes)):
+        await send(audio[offset : offset + frame_bytes])
+        if realtime:
+            delay = start + (i + 1) * frame_seconds - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+
+async def _tcp_client(
+    host: str, port: int, audio: bytes, frame_bytes: int, frame_seconds: float, realtime: bool
+) -> int:
+    reader, writer = await asyncio.open_connection(host, port)
+
+    async def send(data: bytes) -> None:
+        writer.write(_LENGTH.pack(len(data)) + data)
+        await writer.drain()
+
+    async def collect() -> int:
+        segments = 0
+        while True:
+            (length,) = _LENGTH.unpack(await reader.readexactly(_LENGTH.size))
+            message = json.loads(await reader.readexactly(length))
+            if message["type"] == "end":
+                return segments
+            segments += 1
+
+    collector = asyncio.create_task(collect())
+    await _send_paced(send, audio, frame_bytes, frame_seconds, realtime)
+    await send(b"")
+    segments = await collector
+    writer.close()
+    return segments
+
+
+async def _websocket_client(
+    host: str, port: int, audio: bytes, frame_bytes: int, frame_seconds: float, realtime: bool
+) -> int:
+    ws = await WebSocket.connect(host, port)
+
+    async def collect() -> int:
+        segments = 0
+        while True:
+            message = await ws.recv()
+            if message is None or json.loads(message)["type"] == "end":
+                return segments
+            segments += 1
+
+    collector = asyncio.create_task(collect())
+    await _send_paced(ws.send, audio, frame_bytes, frame_seconds, realtime)
+    await ws.send("end")
+    segments = await collector
+    await ws.close()
+    return segments
+
+
+async def run_load(
+    host: str,
+    port: int,
+    streams: int = 10,
+    seconds: float = 5.0,
+    protocol: str = "tcp",
+    realtime: bool = False,
+    frame_ms: int = 20,
+    sample_rate: int = 16000,
+) -> LoadResult:
+    """
+    Run concurrent client streams against a server.
+
+    CPU time is measured for the whole process, so with an in-process
+    server it includes the clients and streams_per_core is conservative.
+
+    Args:
+        host: Server host
+        port: Server port
+        streams: Concurrent client streams
+        seconds: Audio per stream
+        protocol: "tcp" or "websocket"
+        realtime: Pace each stream at real time (otherwise send unthrottled)
+        frame_ms: Audio per client message
+        sample_rate: Sample rate of the generated audio
+
+    Raises:
+        ValueError: If the protocol is unknown
+    """
+    clients = {"tcp": _tcp_client, "websocket": _websocket_client}
+    if protocol not in clients:
+        raise ValueError(f"Protocol must be one of {list(clients)}, got {protocol!r}")
+
+    audio = synthetic_speech(seconds, sample_rate)
+    frame_bytes = sample_rate * frame_ms // 1000 * 2
+    client = clients[protocol]
+
+    wall_start = time.monotonic()
+    cpu_start = time.process_time()
+    counts = await asyncio.gather(
+        *(client(host, port, audio, frame_bytes, frame_ms / 1000, realtime) for _ in range(streams))
+    )
+
+    return LoadResult(
+        streams=streams,
+        protocol=protocol,
+        audio_seconds=streams * seconds,
+        wall_seconds=time.monotonic() - wall_start,
+        cpu_seconds=time.process_time() - cpu_start,
+        segments=sum(counts),
+    )
+
+
+async def _benchmark(args: argparse.Namespace) -> LoadResult:
+    server = IngestServer(workers=args.workers)
+    if args.protocol == "tcp":
+        listening = await server.start_tcp()
+    else:
+        listening = await server.start_websocket()
+    host, port = listening.sockets[0].getsockname()[:2]
+
+    try:
+        return await run_load(
+            host,
+            port,
+            streams=args.streams,
+            seconds=args.seconds,
+            protocol=args.protocol,
+            realtime=args.realtime,
+        )
+    finally:
+        await server.close()
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark IngestServer with synthetic streams")
+    parser.add_argument("--streams", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--protocol", choices=["tcp", "websocket"], default="tcp")
+    parser.add_argument("--realtime", action="store_true", help="Pace streams at real time")
+    parser.add_argument("--workers", type=int, default=None, help="Detection threads")
+    args = parser.parse_args(argv)
+
+    result = asyncio.run(_benchmark(args))
+    print(json.dumps(result.to_dict(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+"""Minimal asyncio WebSocket (RFC 6455) endpoint, without extensions."""
+
+import asyncio
+import base64
+import hashlib
+import os
+import struct
+from typing import Optional, Union
+
+import numpy as np
+
+_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+OP_CONTINUATION = 0x0
+OP_TEXT = 0x1
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+
+def _accept_key(key: str) -> str:
+    digest = hashlib.sha1((key + _GUID).encode("ascii")).digest()
+    return base64.b64encode(digest).decode("ascii")
+
+
+def _apply_mask(payload: bytes, mask: bytes) -> bytes:
+    """XOR a payload with a 4-byte mask, vectorized."""
+    data = np.frombuffer(payload, dtype=np.uint8)
+    key = np.resize(np.frombuffer(mask, dtype=np.uint8), len(data))
+    return (data ^ key).tobytes()
+
+
+async def _read_headers(reader: asyncio.StreamReader) -> tuple[str, dict[str, str]]:
+    """Read an HTTP start line and headers (names lowercased)."""
+    start_line = (await reader.readline()).decode("latin-1").strip()
+    headers: dict[str, str] = {}
+    while True:
+        line = (await reader.readline()).decode("latin-1").strip()
+        if not line:
+            return start_line, headers
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+
+class WebSocket:
+    """
+    Message-level WebSocket connection over asyncio streams.
+
+    Answers pings, reassembles fragmented messages and completes the
+    closing handshake. Servers send unmasked frames; clients mask them.
+    """
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        client: bool = False,
+        max_size: int = 1 << 20,
+    ):
+        """
+        Args:
+            reader: Stream reader of an upgraded connection
+            writer: Stream writer of an upgraded connection
+            client: Mask outgoing frames (client side of the connection)
+            max_size: Largest accepted message in bytes
+        """
+        self.reader = reader
+        self.writer = writer
+        self.client = client
+        self.max_size = max_size
+        self.path = "/"
+        self._closed = False
+
+    @classmethod
+    async def accept(
+        cls, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, max_size: int = 1 << 20
+    ) -> "WebSocket":
+        """
+        Complete the server side of the opening handshake.
+
+        Raises:
+            ConnectionError: If the request isn't a valid WebSocket upgrade
+        """
+        start_line, headers = await _read_headers(reader)
+        parts = start_line.split()
+        key = headers.get("sec-websocket-key")
+
+        upgrade = headers.get("upgrade", "").lower() == "websocket"
+        if len(parts) < 2 or parts[0] != "GET" or key is None or not upgrade:
+            writer.write(b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\n\r\n")
+            await writer.drain()
+            writer.close()
+            raise ConnectionError(f"Not a WebSocket upgrade request: {start_line!r}")
+
+        writer.write(
+            (
+                "HTTP/1.1 101 Switching Protocols\r\n"
+                "Upgrade: websocket\r\n"
+                "Connection: Upgrade\r\n"
+                f"Sec-WebSocket-Accept: {_accept_key(key)}\r\n\r\n"
+            ).encode("ascii")
+        )
+        await writer.drain()
+
+        ws = cls(reader, writer, max_size=max_size)
+        ws.path = parts[1]
+        return ws
+
+    @classmethod
+    async def connect(
+        cls, host: str, port: int, path: str = "/", max_size: int = 1 << 20
+    ) -> "WebSocket":
+        """
+        Open a client connection.
+
+        Raises:
+            ConnectionError: If the server refuses the upgrade
+        """
+        reader, writer = await asyncio.open_connection(host, port)
+        key = base64.b64encode(os.urandom(16)).decode("ascii")
+        writer.write(
+            (
+                f"GET {path} HTTP/1.1\r\n"
+                f"Host: {host}:{port}\r\n"
+                "Upgrade: websocket\r\n"
+                "Connection: Upgrade\r\n"
+                f"Sec-WebSocket-Key: {key}\r\n"
+                "Sec-WebSocket-Version: 13\r\n\r\n"
+            ).encode("ascii")
+        )
+        await writer.drain()
+
+        status_line, headers = await _read_headers(reader)
+        accepted = headers.get("sec-websocket-accept") == _accept_key(key)
+        if status_line.split()[1:2] != ["101"] or not accepted:
+            writer.close()
+            raise ConnectionError(f"WebSocket upgrade refused: {status_line!r}")
+
+        ws = cls(reader, writer, client=True, max_size=max_size)
+        ws.path = path
+        return ws
+
+    async def recv(self) -> Optional[Union[bytes, str]]:
+        """
+        Receive the next message.
+
+        Returns:
+            bytes for binary messages, str for text, None once closed
+
+        Raises:
+            ValueError: If a message exceeds max_size
+        """
+        message = bytearray()
+        message_opcode = None
+
+        while not self._closed:
+            try:
+                fin, opcode, payload = await self._read_frame()
+            except (asyncio.IncompleteReadError, ConnectionError):
+                self._closed = True
+                return None
+
+            if opcode == OP_PING:
+                await self._write_frame(OP_PONG, payload)
+                continue
+            if opcode == OP_PONG:
+                continue
+            if opcode == OP_CLOSE:
+                await self.close()
+                return None
+
+            if opcode != OP_CONTINUATION:
+                message_opcode = opcode
+            message += payload
+            if len(message) > self.max_size:
+                raise ValueError(f"Message exceeds {self.max_size} bytes")
+
+            if fin:
+                if message_opcode == OP_TEXT:
+                    return message.decode("utf-8")
+                return bytes(message)
+
+        return None
+
+    async def send(self, data: Union[bytes, str]) -> None:
+        """Send a text (str) or binary (bytes) message."""
+        if isinstance(data, str):
+            await self._write_frame(OP_TEXT, data.encode("utf-8"))
+        else:
+            await self._write_frame(OP_BINARY, data)
+
+    async def close(self, code: int = 1000) -> None:
+        """Send a close frame (once) and close the connection."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            await self._write_frame(OP_CLOSE, struct.pack("!H", code))
+        except ConnectionError:
+            pass
+        self.writer.close()
+
+    async def _read_frame(self) -> tuple[bool, int, bytes]:
+        head = await self.reader.readexactly(2)
+        fin = bool(head[0] & 0x80)
+        opcode = head[0] & 0x0F
+        masked = bool(head[1] & 0x80)
+        length = head[1] & 0x7F
+
+        if length == 126:
+            (length,) = struct.unpack("!H", await self.reader.readexactly(2))
+        elif length == 127:
+            (length,) = struct.unpack("!Q", await self.reader.readexactly(8))
+
+        if length > self.max_size:
+            raise ValueError(f"Frame exceeds {self.max_size} bytes")
+
+        mask = await self.reader.readexactly(4) if masked else None
+        payload = await self.reader.readexactly(length)
+        if mask is not None:
+            payload = _apply_mask(payload, mask)
+        return fin, opcode, payload
+
+    async def _write_frame(self, opcode: int, payload: bytes) -> None:
+        head = bytearray([0x80 | opcode])
+        mask_bit = 0x80 if self.client else 0
+        length = len(payload)
+
+        if length < 126:
+            head.append(mask_bit | length)
+        elif length < 1 << 16:
+            head.append(mask_bit | 126)
+            head += struct.pack("!H", length)
+        else:
+            head.append(mask_bit | 127)
+            head += struct.pack("!Q", length)
+
+        if self.client:
+            mask = os.urandom(4)
+            head += mask
+            payload = _apply_mask(payload, mask)
+
+        self.writer.write(bytes(head) + payload)
+        await self.writer.drain()
@@ -0,0 +1,14 @@
+"""Audio sources."""
+
+from .callback import CallbackAudioSource, RingBuffer
+from .file import FileAudioSource
+from .pipe import PipeAudioSource
+from .replay import ReplayAudioSource
+
+__all__ = [
+    "CallbackAudioSource",
+    "FileAudioSource",
+    "PipeAudioSource",
+    "ReplayAudioSource",
+    "RingBuffer",
+]
@@ -0,0 +1,236 @@
+"""Push-style audio source fed from a device or network callback."""
+
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+from ..interfaces import AudioSource
+from ..types import AudioChunk
+
+logger = logging.getLogger("hearken")
+
+
+class RingBuffer:
+    """
+    Fixed-capacity byte ring buffer, allocated once.
+
+    Writes never grow the buffer: when full, the oldest bytes are
+    overwritten and counted as dropped. Not thread-safe on its own.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Args:
+            capacity: Buffer size in bytes
+
+        Raises:
+            ValueError: If capacity is not positive
+        """
+        if capacity <= 0:
+            raise ValueError(f"Capacity must be positive, got {capacity}")
+
+        self._buffer = bytearray(capacity)
+        self._view = memoryview(self._buffer)
+        self._capacity = capacity
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def write(self, data: bytes) -> int:
+        """
+        Append bytes, overwriting the oldest data if full.
+
+        Returns:
+            Number of bytes dropped to make room
+        """
+        view = memoryview(data).cast("B")
+        dropped = 0
+
+        if len(view) > self._capacity:
+            dropped += len(view) - self._capacity
+            view = view[-self._capacity :]
+
+        overflow = self._size + len(view) - self._capacity
+        if overflow > 0:
+            self._start = (self._start + overflow) % self._capacity
+            self._size -= overflow
+            dropped += overflow
+
+        end = (self._start + self._size) % self._capacity
+        first = min(len(view), self._capacity - end)
+        self._view[end : end + first] = view[:first]
+        self._view[: len(view) - first] = view[first:]
+        self._size += len(view)
+
+        return dropped
+
+    def read(self, n: int) -> bytes:
+        """Remove and return up to n bytes from the front."""
+        n = min(n, self._size)
+        first = min(n, self._capacity - self._start)
+        data = bytes(self._view[self._start : self._start + first])
+        if first < n:
+            data += bytes(self._view[: n - first])
+
+        self._start = (self._start + n) % self._capacity
+        self._size -= n
+        return data
+
+    def clear(self) -> None:
+        self._start = 0
+        self._size = 0
+
+
+class CallbackAudioSource(AudioSource):
+    """
+    Audio source that is pushed to, rather than read from.
+
+    Device or network callbacks hand buffers of any size to `push()`, which
+    copies them into a preallocated ring buffer. A Listener registers itself
+    as consumer and receives fixed-size AudioChunks straight from `push()`,
+    so no capture thread sits blocked in a device read. Without a consumer,
+    `read()` works as a blocking pull for other callers.
+
+    Use directly by calling `push()` from your own callback, or subclass and
+    start the device in `open()`.
+
+    Example:
+        source = CallbackAudioSource(sample_rate=16000)
+
+        def on_audio(in_data, frame_count, time_info, status):
+            source.push(in_data)
+            return (None, pyaudio.paContinue)
+    """
+
+    def __init__(
+        self, sample_rate: int = 16000, sample_width: int = 2, buffer_seconds: float = 2.0
+    ):
+        """
+        Args:
+            sample_rate: Sample rate of pushed audio in Hz
+            sample_width: Bytes per sample of pushed audio
+            buffer_seconds: Ring buffer capacity in seconds of audio
+
+        Raises:
+            ValueError: If buffer_seconds is not positive
+        """
+        if buffer_seconds <= 0:
+            raise ValueError(f"Buffer seconds must be positive, got {buffer_seconds}")
+
+        self._sample_rate = sample_rate
+        self._sample_width = sample_width
+        self._bytes_per_second = sample_rate * sample_width
+
+        capacity = int(buffer_seconds * sample_rate) * sample_width
+        self._ring = RingBuffer(capacity)
+        self._cond = threading.Condition()
+
+        self._consumer: Optional[Callable[[AudioChunk], None]] = None
+        self._frame_bytes = 0
+        self._is_open = False
+
+        self.dropped_bytes = 0
+
+    def set_consumer(
+        self, consumer: Optional[Callable[[AudioChunk], None]], frame_samples: int = 0
+    ) -> None:
+        """
+        Deliver fixed-size chunks to a callback as audio is pushed.
+
+        Args:
+            consumer: Called from the pushing thread with each complete frame
+                (None to switch back to pull mode)
+            frame_samples: Samples per delivered chunk
+
+        Raises:
+            ValueError: If a consumer is given without a positive frame size
+        """
+        if consumer is not None and frame_samples <= 0:
+            raise ValueError(f"Frame samples must be positive, got {frame_samples}")
+
+        with self._cond:
+            self._consumer = consumer
+            self._frame_bytes = frame_samples * self._sample_width
+
+    def open(self) -> None:
+        """Start accepting pushed audio."""
+        with self._cond:
+            self._ring.clear()
+            self._is_open = True
+
+    def close(self) -> None:
+        """Stop accepting audio and wake blocked readers."""
+        with self._cond:
+            self._is_open = False
+            self._ring.clear()
+            self._cond.notify_all()
+
+    def push(self, data: bytes) -> None:
+        """
+        Hand captured audio to the source. Call from the device callback.
+
+        Audio pushed while closed is ignored. If the ring buffer is full, the
+        oldest audio is dropped and counted in `dropped_bytes`.
+        """
+        now = time.monotonic()
+        frames = []
+
+        with self._cond:
+            if not self._is_open:
+                return
+
+            dropped = self._ring.write(data)
+            if dropped:
+                self.dropped_bytes += dropped
+                logger.warning(f"Audio ring buffer full, dropped {dropped} bytes")
+
+            consumer = self._consumer
+            if consumer is not None:
+                # The newest sample arrived now; date each frame from its backlog
+                while len(self._ring) >= self._frame_bytes:
+                    backlog = len(self._ring) / self._bytes_per_second
+                    frames.append((self._ring.read(self._frame_bytes), now - backlog))
+            else:
+                self._cond.notify_all()
+                return
+
+        # Deliver outside the lock so consumers can't stall other pushes
+        for frame, timestamp in frames:
+            consumer(
+                AudioChunk(
+                    data=frame,
+                    timestamp=timestamp,
+                    sample_rate=self._sample_rate,
+                    sample_width=self._sample_width,
+                )
+            )
+
+    def read(self, num_samples: int) -> bytes:
+        """
+        Block until num_samples are buffered and return them (pull mode).
+
+        Raises:
+            RuntimeError: If the source is closed while waiting
+        """
+        num_bytes = num_samples * self._sample_width
+        with self._cond:
+            while len(self._ring) < num_bytes:
+                if not self._is_open:
+                    raise RuntimeError("Audio source closed")
+                self._cond.wait()
+            return self._ring.read(num_bytes)
+
+    @property
+    def sample_rate(self) -> int:
+        return self._sample_rate
+
+    @property
+    def sample_width(self) -> int:
+        return self._sample_width
@@ -0,0 +1,246 @@
+"""Audio source reading raw PCM from a pipe or a decoder subprocess."""
+
+import collections
+import io
+import logging
+import subprocess
+import sys
+import threading
+import time
+from typing import BinaryIO, Optional, Sequence, Union
+
+from ..interfaces import AudioSource
+
+logger = logging.getLogger("hearken")
+
+
+class PipeAudioSource(AudioSource):
+    """
+    Reads raw PCM from a pipe, file descriptor or decoder subprocess.
+
+    Fills a preallocated buffer with large `readinto` calls, so a 20ms frame
+    doesn't cost a syscall; short reads are retried until a full frame is
+    available. At end of input, the remaining whole samples are returned
+    once and the next read raises EOFError.
+
+    Given a command, the source spawns it (e.g. ffmpeg decoding RTP, Opus or
+    MP3 to s16le on stdout), keeps the tail of its stderr for diagnostics,
+    and optionally restarts it if it exits.
+
+    Example:
+        source = PipeAudioSource(
+            command=["ffmpeg", "-loglevel", "error", "-i", "rtp://0.0.0.0:5004",
+                     "-f", "s16le", "-ac", "1", "-ar", "16000", "-"],
+            restart=True,
+        )
+    """
+
+    def __init__(
+        self,
+        pipe: Optional[Union[BinaryIO, int]] = None,
+        command: Optional[Sequence[str]] = None,
+        sample_rate: int = 16000,
+        sample_width: int = 2,
+        buffer_size: int = 65536,
+        restart: bool = False,
+        max_restarts: int = 3,
+        restart_delay: float = 0.5,
+        stderr_lines: int = 20,
+    ):
+        """
+        Args:
+            pipe: Binary file object or file descriptor to read (stdin if
+                neither pipe nor command is given)
+            command: Decoder command line writing raw PCM to stdout
+            sample_rate: Sample rate of the PCM stream in Hz
+            sample_width: Bytes per sample of the PCM stream
+            buffer_size: Read buffer size in bytes
+            restart: Restart the command when it exits
+            max_restarts: Most restarts before giving up
+            restart_delay: Seconds to wait before restarting
+            stderr_lines: Lines of decoder stderr kept for error messages
+
+        Raises:
+            ValueError: If both pipe and command are given, or buffer_size
+                is smaller than one sample
+        """
+        if pipe is not None and command is not None:
+            raise ValueError("Pass either pipe or command, not both")
+
+        if buffer_size < sample_width:
+            raise ValueError(f"Buffer size must hold at least one sample, got {buffer_size}")
+
+        self.pipe = pipe
+        self.command = list(command) if command is not None else None
+        self.restart = restart
+        self.max_restarts = max_restarts
+        self.restart_delay = restart_delay
+
+        self._sample_rate = sample_rate
+        self._sample_width = sample_width
+
+        self._buffer = bytearray(buffer_size)
+        self._view = memoryview(self._buffer)
+        self._start = 0
+        self._end = 0
+
+        self._reader: Optional[io.RawIOBase] = None
+        self._process: Optional[subprocess.Popen[bytes]] = None
+        self._stderr_thread: Optional[threading.Thread] = None
+        self._stderr: collections.deque[str] = collections.deque(maxlen=stderr_lines)
+        self._eof = False
+        self.restarts = 0
+
+    def open(self) -> None:
+        """Open the pipe or start the decoder."""
+        self._start = self._end = 0
+        self._eof = False
+        self.restarts = 0
+
+        if self.command is not None:
+            self._spawn(self.command)
+        else:
+            pipe = sys.stdin.buffer if self.pipe is None else self.pipe
+            fd = pipe if isinstance(pipe, int) else pipe.fileno()
+            # Unbuffered: readinto goes straight into our buffer
+            self._reader = io.FileIO(fd, "rb", closefd=False)
+
+    def close(self) -> None:
+        """Close the pipe and stop the decoder, if any."""
+        # Stopping the decoder first unblocks a read waiting on its stdout
+        reader, self._reader = self._reader, None
+        self._stop_process()
+        if reader is not None:
+            reader.close()
+
+    def read(self, num_samples: int) -> bytes:
+        """
+        Read exactly num_samples, except for the last read before EOF.
+
+        Raises:
+            EOFError: If the input has ended
+            RuntimeError: If the decoder failed (exited non-zero) or the
+                source is not open
+        """
+        num_bytes = num_samples * self._sample_width
+        if num_bytes > len(self._buffer):
+            logger.debug(f"Growing pipe buffer to {num_bytes} bytes")
+            self._resize(num_bytes)
+
+        while self._end - self._start < num_bytes and not self._eof:
+            self._fill()
+
+        available = min(num_bytes, self._end - self._start)
+        available -= available % self._sample_width
+        if available == 0:
+            raise EOFError("End of audio input")
+
+        data = bytes(self._view[self._start : self._start + available])
+        self._start += available
+        return data
+
+    def _fill(self) -> None:
+        """One large readinto after the buffered data; handles decoder exit."""
+        if self._reader is None:
+            raise RuntimeError("Audio source not open")
+
+        # Move leftover bytes to the front so the read gets the whole tail
+        if self._start:
+            leftover = self._end - self._start
+            self._view[:leftover] = self._view[self._start : self._end]
+            self._start, self._end = 0, leftover
+
+        count = self._reader.readinto(self._view[self._end :])
+        if count:
+            self._end += count
+        elif count == 0:
+            self._handle_eof()
+
+    def _handle_eof(self) -> None:
+        if self._process is None:
+            self._eof = True
+            return
+
+        code = self._process.wait()
+        reader, self._reader = self._reader, None
+        self._stop_process()
+        if reader is not None:
+            reader.close()
+        stderr = "\n".join(self._stderr)
+
+        if self.restart and self.command is not None and self.restarts < self.max_restarts:
+            self.restarts += 1
+            logger.warning(
+                f"Decoder exited with code {code}, restarting "
+                f"({self.restarts}/{self.max_restarts})"
+            )
+            time.sleep(self.restart_delay)
+            self._spawn(self.command)
+            return
+
+        self._eof = True
+        if code != 0:
+            raise RuntimeError(f"Decoder exited with code {code}: {stderr}")
+
+    def _spawn(self, command: list[str]) -> None:
+        self._stderr.clear()
+        process = subprocess.Popen(
+            command, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        assert process.stdout is not None and process.stderr is not None
+        self._process = process
+        self._reader = io.FileIO(process.stdout.fileno(), "rb", closefd=False)
+        self._stderr_thread = threading.Thread(
+            target=self._drain_stderr,
+            args=(process.stderr,),
+            name="hearken-decoder-stderr",
+            daemon=True,
+        )
+        self._stderr_thread.start()
+        logger.debug(f"Started decoder (pid {process.pid}): {command}")
+
+    def _drain_stderr(self, stream: BinaryIO) -> None:
+        """Keep the decoder's stderr flowing so it can't block, remembering the tail."""
+        for line in stream:
+            self._stderr.append(line.decode("utf-8", "replace").rstrip())
+
+    def _stop_process(self) -> None:
+        process, self._process = self._process, None
+        if process is None:
+            return
+
+        if process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout=2.0)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+
+        # stderr reaches EOF once the process is gone
+        if self._stderr_thread is not None:
+            self._stderr_thread.join(timeout=1.0)
+            self._stderr_thread = None
+        for stream in (process.stdout, process.stderr):
+            if stream is not None:
+                stream.close()
+
+    def _resize(self, size: int) -> None:
+        data = bytes(self._view[self._start : self._end])
+        self._view.release()
+        self._buffer = bytearray(size)
+        self._view = memoryview(self._buffer)
+        self._view[: len(data)] = data
+        self._start, self._end = 0, len(data)
+
+    @property
+    def sample_rate(self) -> int:
+        return self._sample_rate
+
+    @property
+    def sample_width(self) -> int:
+        return self._sample_width
+
+    @property
+    def supports_backpressure(self) -> bool:
+        return True
@@ -0,0 +1,109 @@
+"""Audio source replaying a capture recording."""
+
+import logging
+import time
+from typing import Generator, Optional
+
+from ..interfaces import AudioSource
+from ..recording import RecordedFrame, read_recording, recording_format
+
+logger = logging.getLogger("hearken")
+
+
+class ReplayAudioSource(AudioSource):
+    """
+    Feeds a CaptureRecorder file back with its original timing.
+
+    Each `read()` returns the next recorded frame, released at its original
+    capture time relative to the first frame (scaled by `speed`, or as fast
+    as possible with speed=None). Frames are replayed as recorded, whatever
+    num_samples asks for, so use the same frame duration as the recording.
+
+    With `skip_dropped`, frames the capture queue dropped are left out, so
+    the detector sees exactly what it saw in production. Combine with
+    DetectorConfig(sample_clock=True) for timing that doesn't depend on the
+    replay machine, e.g. to A/B VAD and detector changes.
+    """
+
+    def __init__(self, path: str, speed: Optional[float] = 1.0, skip_dropped: bool = True):
+        """
+        Args:
+            path: Recording written by CaptureRecorder
+            speed: Replay speed relative to the original (None = unthrottled)
+            skip_dropped: Leave out frames that were dropped in the recording
+
+        Raises:
+            ValueError: If speed is not positive or the file isn't a recording
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError(f"Speed must be positive or None, got {speed}")
+
+        self.path = path
+        self.speed = speed
+        self.skip_dropped = skip_dropped
+
+        # Read the header now so the format is known before open()
+        self._sample_rate, self._sample_width = recording_format(path)
+
+        self._frames: Optional[Generator[RecordedFrame, None, None]] = None
+        self._first_timestamp: Optional[float] = None
+        self._clock_start = 0.0
+        self.frames_replayed = 0
+
+    def open(self) -> None:
+        """Start replaying from the first frame."""
+        self._frames = read_recording(self.path)
+        self._first_timestamp = None
+        self.frames_replayed = 0
+
+    def close(self) -> None:
+        if self._frames is not None:
+            self._frames.close()
+            self._frames = None
+
+    def read(self, num_samples: int) -> bytes:
+        """
+        Return the next recorded frame at its original time.
+
+        Raises:
+            EOFError: If the recording is exhausted
+            RuntimeError: If the source is not open
+        """
+        if self._frames is None:
+            raise RuntimeError("Audio source not open")
+
+        for frame in self._frames:
+            if frame.dropped and self.skip_dropped:
+                continue
+            self._pace(frame.timestamp)
+            self.frames_replayed += 1
+            return frame.data
+
+        raise EOFError(f"End of recording {self.path}")
+
+    def _pace(self, timestamp: float) -> None:
+        """Sleep until the frame's offset from the first frame has elapsed."""
+        if self._first_timestamp is None:
+            self._first_timestamp = timestamp
+            self._clock_start = time.monotonic()
+            return
+
+        if self.speed is None:
+            return
+
+        due = self._clock_start + (timestamp - self._first_timestamp) / self.speed
+        delay = due - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    @property
+    def sample_rate(self) -> int:
+        return self._sample_rate
+
+    @property
+    def sample_width(self) -> int:
+        return self._sample_width
+
+    @property
+    def supports_backpressure(self) -> bool:
+        return True
@@ -0,0 +1,150 @@
+"""Uploads of utterances while they are still being spoken."""
+
+import logging
+import queue
+import threading
+from typing import Callable, Optional, Union
+
+from .interfaces import Transcriber, TranscriptionStream
+from .types import AudioChunk, SpeechSegment
+
+logger = logging.getLogger("hearken")
+
+# Audio for an upload thread, then the segment, or None to abandon the stream
+_UploadQueue = queue.Queue[Union[bytes, SpeechSegment, None]]
+
+
+class StreamingUploader:
+    """
+    Feeds detector audio into per-utterance transcription streams.
+
+    Driven from the detection thread: `write()` opens a stream for a new
+    utterance on first use and forwards audio, `finish()` hands over the
+    completed segment. Each utterance gets its own upload thread, so slow
+    network writes never block detection, and the transcript is ready
+    roughly one server decode after the utterance ends.
+    """
+
+    def __init__(
+        self,
+        transcriber: Transcriber,
+        on_transcript: Callable[[str, SpeechSegment], None],
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ):
+        """
+        Args:
+            transcriber: Transcriber with streaming support
+            on_transcript: Callback for finished transcripts
+            on_error: Callback for upload or transcription failures
+
+        Raises:
+            ValueError: If the transcriber doesn't support streaming
+        """
+        if not transcriber.supports_streaming:
+            raise ValueError(f"{type(transcriber).__name__} does not support streaming")
+
+        self.transcriber = transcriber
+        self.on_transcript = on_transcript
+        self.on_error = on_error
+
+        self._pending: Optional[_UploadQueue] = None
+        self._threads: list[threading.Thread] = []
+
+    @property
+    def active(self) -> bool:
+        """Whether an utterance is currently being uploaded."""
+        return self._pending is not None
+
+    def write(self, chunks: list[AudioChunk]) -> None:
+        """Forward audio of the current utterance, opening a stream if needed."""
+        if self._pending is None:
+            self._pending = _UploadQueue()
+            thread = threading.Thread(
+                target=self._upload,
+                args=(self._pending, chunks[0].sample_rate, chunks[0].sample_width),
+                name="hearken-upload",
+                daemon=True,
+            )
+            self._threads = [t for t in self._threads if t.is_alive()]
+            self._threads.append(thread)
+            thread.start()
+
+        self._pending.put(b"".join(c.data for c in chunks))
+
+    def finish(self, segment: SpeechSegment) -> bool:
+        """
+        Complete the current utterance with its segment.
+
+        Returns:
+            True if a stream took the segment, False if none was open
+        """
+        if self._pending is None:
+            return False
+
+        self._pending.put(segment)
+        self._pending = None
+        return True
+
+    def abort(self) -> None:
+        """Abandon the current utterance, if any."""
+        if self._pending is not None:
+            self._pending.put(None)
+            self._pending = None
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """Wait for outstanding uploads to finish."""
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        self._threads = [t for t in self._threads if t.is_alive()]
+
+    def _upload(self, pending: _UploadQueue, sample_rate: int, sample_width: int) -> None:
+        """
+        Upload thread: stream audio until the segment or an abort arrives.
+
+        If the stream fails before the segment ends, the rest of the audio is
+        drained and the segment is transcribed in one shot instead.
+        """
+        stream = None
+        try:
+            stream = self.transcriber.open_stream(sample_rate, sample_width)
+        except Exception as e:
+            logger.warning(f"Opening transcription stream failed, will send in one shot: {e}")
+
+        while True:
+            item = pending.get()
+
+            if item is None:
+                if stream is not None:
+                    self._abort(stream)
+                return
+
+            if isinstance(item, SpeechSegment):
+                try:
+                    if stream is not None:
+                        text = stream.finish(item)
+                    else:
+                        text = self.transcriber.transcribe(item)
+                    self.on_transcript(text, item)
+                except Exception as e:
+                    logger.error(f"Streaming transcription failed: {e}")
+                    if stream is not None:
+                        self._abort(stream)
+                    if self.on_error:
+                        self.on_error(e)
+                return
+
+            if stream is None:
+                continue
+            try:
+                stream.write(item)
+            except Exception as e:
+                logger.warning(f"Transcription stream failed, will send in one shot: {e}")
+                self._abort(stream)
+                stream = None
+
+    @staticmethod
+    def _abort(stream: TranscriptionStream) -> None:
+        try:
+            stream.abort()
+        except Exception as e:
+            logger.debug(f"Aborting transcription stream failed: {e}")
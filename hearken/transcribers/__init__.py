@@ -0,0 +1,6 @@
+"""Transcriber wrappers that add behaviour to any Transcriber."""
+
+from .cache import CachingTranscriber, CacheStats
+from .resilient import ResilientTranscriber
+
+__all__ = ["CachingTranscriber", "CacheStats", "ResilientTranscriber"]
@@ -0,0 +1,348 @@
+"""Transcription result cache keyed by audio fingerprint."""
+
+import collections
+import hashlib
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from ..interfaces import Transcriber, TranscriptionStream
+from ..types import SpeechSegment
+
+logger = logging.getLogger("hearken")
+
+# Silence trimming before fuzzy fingerprinting: resolution, and level
+# relative to the loudest part of the segment
+_TRIM_HOP_MS = 10
+_TRIM_FLOOR = 0.05
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for CachingTranscriber."""
+
+    hits: int = 0
+    fuzzy_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.fuzzy_hits + self.misses
+        return (self.hits + self.fuzzy_hits) / lookups if lookups else 0.0
+
+
+@dataclass
+class _Fingerprint:
+    sample_rate: int
+    envelope: np.ndarray  # Energy per window, scaled so the loudest is 1.0
+
+    @property
+    def bucket(self) -> tuple[int, int]:
+        return self.sample_rate, len(self.envelope)
+
+
+@dataclass
+class _Entry:
+    text: str
+    expires_at: Optional[float]
+    size: int
+    fingerprint: Optional[_Fingerprint]
+
+
+class CachingTranscriber(Transcriber):
+    """
+    Caches transcripts of repeated audio.
+
+    In IVR and kiosk use the same prompts and commands recur constantly.
+    Segments are keyed by a fast hash of their PCM audio (exact match) and,
+    optionally, by a coarse energy-envelope fingerprint that also matches
+    near-duplicates such as the same prompt replayed at a different gain or
+    with more leading silence. A fuzzy hit needs an envelope of about the
+    same length whose mean difference from the cached one is at most
+    `fingerprint_tolerance`. Segments shorter than `fingerprint_min_ms`
+    (after trimming silence) are only ever matched exactly.
+
+    Entries are evicted least-recently-used first, when they expire, or
+    when the cache exceeds its entry or byte budget.
+
+    Example:
+        transcriber = CachingTranscriber(SRTranscriber(recognizer), ttl=3600)
+        listener = Listener(source=..., transcriber=transcriber)
+    """
+
+    def __init__(
+        self,
+        transcriber: Transcriber,
+        max_entries: int = 1024,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        fuzzy: bool = False,
+        fingerprint_ms: int = 50,
+        fingerprint_tolerance: float = 0.05,
+        fingerprint_min_ms: int = 400,
+    ):
+        """
+        Args:
+            transcriber: Transcriber to wrap
+            max_entries: Maximum number of cached transcripts
+            max_bytes: Budget for cached keys and text in bytes (None = no limit)
+            ttl: Seconds before an entry expires (None = never)
+            fuzzy: Also match near-duplicate audio by coarse fingerprint
+            fingerprint_ms: Envelope resolution of the fuzzy fingerprint
+            fingerprint_tolerance: Largest mean difference between two
+                envelopes (each scaled to a peak of 1.0) that still matches
+            fingerprint_min_ms: Shortest audio, after trimming silence, that
+                is matched fuzzily
+
+        Raises:
+            ValueError: If max_entries is less than 1
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+
+        self.transcriber = transcriber
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.fuzzy = fuzzy
+        self.fingerprint_ms = fingerprint_ms
+        self.fingerprint_tolerance = fingerprint_tolerance
+        self.fingerprint_min_ms = fingerprint_min_ms
+
+        self._entries: collections.OrderedDict[bytes, _Entry] = collections.OrderedDict()
+        # Fingerprints of cached entries by exact key, bucketed by (sample rate, envelope length)
+        self._fuzzy_index: dict[tuple[int, int], dict[bytes, _Fingerprint]] = {}
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def transcribe(self, segment: SpeechSegment) -> str:
+        """Return a cached transcript, or transcribe and cache the result."""
+        key = self._exact_key(segment)
+        fingerprint = self._fingerprint(segment) if self.fuzzy else None
+
+        with self._lock:
+            text = self._lookup(key, fingerprint)
+        if text is not None:
+            return text
+
+        # Errors propagate and are never cached
+        text = self.transcriber.transcribe(segment)
+
+        with self._lock:
+            self._store(key, fingerprint, text)
+        return text
+
+    def transcribe_batch(self, segments: list[SpeechSegment]) -> list[str]:
+        """
+        Answer cached segments directly and batch the rest to the wrapped transcriber.
+
+        Raises:
+            RuntimeError: If the wrapped transcriber returns the wrong number of texts
+        """
+        keys = [self._exact_key(segment) for segment in segments]
+        fingerprints = [self._fingerprint(segment) if self.fuzzy else None for segment in segments]
+
+        with self._lock:
+            cached = [self._lookup(k, f) for k, f in zip(keys, fingerprints)]
+
+        missing = [i for i, text in enumerate(cached) if text is None]
+        if not missing:
+            return [text for text in cached if text is not None]
+
+        results = self.transcriber.transcribe_batch([segments[i] for i in missing])
+        if len(results) != len(missing):
+            raise RuntimeError(
+                f"transcribe_batch returned {len(results)} results for {len(missing)} segments"
+            )
+
+        fresh = dict(zip(missing, results))
+        with self._lock:
+            for i, text in fresh.items():
+                self._store(keys[i], fingerprints[i], text)
+        return [fresh[i] if text is None else text for i, text in enumerate(cached)]
+
+    @property
+    def supports_batch(self) -> bool:
+        """Batches whenever the wrapped transcriber does."""
+        return self.transcriber.supports_batch
+
+    def open_stream(self, sample_rate: int, sample_width: int) -> TranscriptionStream:
+        """Stream through the wrapped transcriber, answering from the cache on finish."""
+        return _CachingStream(self, self.transcriber.open_stream(sample_rate, sample_width))
+
+    @property
+    def supports_streaming(self) -> bool:
+        """Streams whenever the wrapped transcriber does."""
+        return self.transcriber.supports_streaming
+
+    @property
+    def stats(self) -> CacheStats:
+        """Snapshot of cache counters."""
+        with self._lock:
+            return CacheStats(**vars(self._stats))
+
+    def clear(self) -> None:
+        """Drop all cached transcripts."""
+        with self._lock:
+            self._entries.clear()
+            self._fuzzy_index.clear()
+            self._stats.entries = 0
+            self._stats.bytes = 0
+
+    def _lookup(self, key: bytes, fingerprint: Optional[_Fingerprint]) -> Optional[str]:
+        """Find a live entry by exact key, then by fingerprint."""
+        entry = self._live_entry(key)
+        if entry is not None:
+            self._stats.hits += 1
+            return entry.text
+
+        if fingerprint is not None:
+            match = self._nearest(fingerprint)
+            entry = self._live_entry(match) if match is not None else None
+            if entry is not None:
+                self._stats.fuzzy_hits += 1
+                return entry.text
+
+        self._stats.misses += 1
+        return None
+
+    def _nearest(self, fingerprint: _Fingerprint) -> Optional[bytes]:
+        """Key of the closest cached envelope within tolerance, if any."""
+        sample_rate, length = fingerprint.bucket
+        best, best_distance = None, self.fingerprint_tolerance
+        # A shift of a few samples can change the trimmed length by a window
+        for bucket in ((sample_rate, length - 1), (sample_rate, length), (sample_rate, length + 1)):
+            for key, candidate in self._fuzzy_index.get(bucket, {}).items():
+                cached = candidate.envelope
+                n = min(len(cached), length)
+                distance = float(np.mean(np.abs(cached[:n] - fingerprint.envelope[:n])))
+                if distance <= best_distance:
+                    best, best_distance = key, distance
+        return best
+
+    def _live_entry(self, key: bytes) -> Optional[_Entry]:
+        """Return an unexpired entry and mark it recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if entry.expires_at is not None and time.monotonic() >= entry.expires_at:
+            self._remove(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return entry
+
+    def _store(self, key: bytes, fingerprint: Optional[_Fingerprint], text: str) -> None:
+        """Insert an entry and evict until within budget."""
+        if key in self._entries:
+            self._remove(key)
+
+        size = len(key) + len(text.encode("utf-8"))
+        if fingerprint is not None:
+            size += fingerprint.envelope.nbytes
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._entries[key] = _Entry(text, expires_at, size, fingerprint)
+        if fingerprint is not None:
+            self._fuzzy_index.setdefault(fingerprint.bucket, {})[key] = fingerprint
+        self._stats.entries += 1
+        self._stats.bytes += size
+
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self._stats.bytes > self.max_bytes
+        ):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self._stats.evictions += 1
+
+    def _remove(self, key: bytes) -> None:
+        """Remove an entry and its fingerprint mapping."""
+        entry = self._entries.pop(key)
+        if entry.fingerprint is not None:
+            bucket = entry.fingerprint.bucket
+            del self._fuzzy_index[bucket][key]
+            if not self._fuzzy_index[bucket]:
+                del self._fuzzy_index[bucket]
+        self._stats.entries -= 1
+        self._stats.bytes -= entry.size
+
+    @staticmethod
+    def _exact_key(segment: SpeechSegment) -> bytes:
+        """Fast hash of the PCM audio and its format."""
+        digest = hashlib.blake2b(segment.audio_data, digest_size=16)
+        digest.update(segment.sample_rate.to_bytes(4, "little"))
+        digest.update(segment.sample_width.to_bytes(1, "little"))
+        return digest.digest()
+
+    def _fingerprint(self, segment: SpeechSegment) -> Optional[_Fingerprint]:
+        """
+        Coarse, gain-independent energy envelope of the audio.
+
+        Leading and trailing silence is trimmed first, so envelopes line up
+        at the onset of the sound.
+
+        Returns:
+            The fingerprint, or None if too little audio remains to tell
+            segments apart
+        """
+        samples = np.frombuffer(segment.audio_data, dtype=np.int16).astype(np.float32)
+        rate = segment.sample_rate
+
+        hop = max(1, rate * _TRIM_HOP_MS // 1000)
+        hops = len(samples) // hop
+        if hops == 0:
+            return None
+        energy = np.sqrt(np.mean(samples[: hops * hop].reshape(hops, hop) ** 2, axis=1))
+        active = np.flatnonzero(energy > energy.max() * _TRIM_FLOOR)
+        if active.size == 0:
+            return None
+        samples = samples[active[0] * hop : (active[-1] + 1) * hop]
+
+        window = max(1, rate * self.fingerprint_ms // 1000)
+        frames = len(samples) // window
+        if frames == 0 or len(samples) * 1000 < self.fingerprint_min_ms * rate:
+            return None
+
+        rms = np.sqrt(np.mean(samples[: frames * window].reshape(frames, window) ** 2, axis=1))
+        return _Fingerprint(rate, (rms / rms.max()).astype(np.float32))
+
+
+class _CachingStream(TranscriptionStream):
+    """Wrapped upload whose transcript is looked up and stored like a one-shot call."""
+
+    def __init__(self, cache: CachingTranscriber, stream: TranscriptionStream):
+        self._cache = cache
+        self._stream = stream
+
+    def write(self, data: bytes) -> None:
+        self._stream.write(data)
+
+    def finish(self, segment: SpeechSegment) -> str:
+        cache = self._cache
+        key = cache._exact_key(segment)
+        fingerprint = cache._fingerprint(segment) if cache.fuzzy else None
+
+        with cache._lock:
+            text = cache._lookup(key, fingerprint)
+        if text is not None:
+            # Already known: the server's answer isn't needed
+            self._stream.abort()
+            return text
+
+        text = self._stream.finish(segment)
+        with cache._lock:
+            cache._store(key, fingerprint, text)
+        return text
+
+    def abort(self) -> None:
+        self._stream.abort()
@@ -0,0 +1,229 @@
+"""Deadlines, retries and hedged requests for transcribers."""
+
+import collections
+import concurrent.futures
+import logging
+import random
+import threading
+import time
+from typing import Callable, Optional, TypeVar
+
+import numpy as np
+
+from ..interfaces import Transcriber, TranscriptionStream
+from ..types import SpeechSegment
+
+logger = logging.getLogger("hearken")
+
+# Argument and result of a wrapped backend call
+_A = TypeVar("_A")
+_R = TypeVar("_R")
+
+
+class ResilientTranscriber(Transcriber):
+    """
+    Adds per-call deadlines, retries and hedging to any transcriber.
+
+    Each attempt runs on a small worker pool so a hung backend call can't
+    block the transcription thread past `timeout`. Failed attempts are
+    retried with jittered exponential backoff. With hedging enabled, a
+    second request is issued if the first hasn't answered within the
+    recent p95 latency, and whichever answers first wins.
+
+    Python threads can't be cancelled, so a timed-out call keeps its pool
+    worker until the backend returns; size `max_workers` accordingly.
+
+    Example:
+        transcriber = ResilientTranscriber(
+            SRTranscriber(recognizer), timeout=5.0, retries=2, hedge=True
+        )
+    """
+
+    def __init__(
+        self,
+        transcriber: Transcriber,
+        timeout: Optional[float] = 10.0,
+        retries: int = 2,
+        backoff: float = 0.2,
+        max_backoff: float = 2.0,
+        retry_on: tuple[type[BaseException], ...] = (Exception,),
+        hedge: bool = False,
+        hedge_quantile: float = 0.95,
+        hedge_delay: float = 1.0,
+        hedge_min_samples: int = 20,
+        latency_window: int = 200,
+        max_workers: int = 4,
+    ):
+        """
+        Args:
+            transcriber: Transcriber to wrap
+            timeout: Deadline per attempt in seconds (None = wait indefinitely)
+            retries: Extra attempts after the first one fails
+            backoff: Base backoff in seconds, doubled per retry
+            max_backoff: Upper bound on the backoff before jitter
+            retry_on: Exception types worth retrying; others propagate at once
+            hedge: Issue a second request when the first is slow
+            hedge_quantile: Latency quantile after which to hedge
+            hedge_delay: Hedge delay used until enough latencies are recorded
+            hedge_min_samples: Latencies needed before using the quantile
+            latency_window: Number of recent latencies kept
+            max_workers: Worker threads for backend calls
+
+        Raises:
+            ValueError: If retries is negative or timeout is not positive
+        """
+        if retries < 0:
+            raise ValueError(f"Retries must be non-negative, got {retries}")
+
+        if timeout is not None and timeout <= 0:
+            raise ValueError(f"Timeout must be positive, got {timeout}")
+
+        self.transcriber = transcriber
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retry_on = retry_on
+        self.hedge = hedge
+        self.hedge_quantile = hedge_quantile
+        self.hedge_delay = hedge_delay
+        self.hedge_min_samples = hedge_min_samples
+
+        self._latencies: collections.deque[float] = collections.deque(maxlen=latency_window)
+        self._lock = threading.Lock()
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="hearken-transcribe-call"
+        )
+
+    def transcribe(self, segment: SpeechSegment) -> str:
+        """
+        Transcribe with deadlines, retries and optional hedging.
+
+        Raises:
+            TimeoutError: If the last attempt exceeded its deadline
+            Exception: The last backend error once retries are exhausted
+        """
+        return self._with_retries(self._timed_call, segment, hedge=self.hedge)
+
+    def transcribe_batch(self, segments: list[SpeechSegment]) -> list[str]:
+        """
+        Transcribe a batch with deadlines and retries.
+
+        Batches are never hedged, since the latency quantile is tracked for
+        single segments.
+
+        Raises:
+            TimeoutError: If the last attempt exceeded its deadline
+            Exception: The last backend error once retries are exhausted
+        """
+        return self._with_retries(self.transcriber.transcribe_batch, segments, hedge=False)
+
+    @property
+    def supports_batch(self) -> bool:
+        """Batches whenever the wrapped transcriber does."""
+        return self.transcriber.supports_batch
+
+    def open_stream(self, sample_rate: int, sample_width: int) -> TranscriptionStream:
+        """
+        Stream through the wrapped transcriber.
+
+        A streamed upload can't be replayed, so if finishing it fails with a
+        retryable error the segment is transcribed in one shot, with retries.
+        """
+        return _ResilientStream(self, self.transcriber.open_stream(sample_rate, sample_width))
+
+    @property
+    def supports_streaming(self) -> bool:
+        """Streams whenever the wrapped transcriber does."""
+        return self.transcriber.supports_streaming
+
+    def _with_retries(self, call: Callable[[_A], _R], arg: _A, hedge: bool) -> _R:
+        """Run attempts of a backend call until one succeeds or retries run out."""
+        for attempt in range(self.retries + 1):
+            try:
+                return self._attempt(call, arg, hedge)
+            except self.retry_on as e:
+                if attempt == self.retries:
+                    raise
+                delay = random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+                logger.warning(
+                    f"Transcription attempt {attempt + 1} failed ({e}), "
+                    f"retrying in {delay:.2f}s"
+                )
+                time.sleep(delay)
+
+        raise AssertionError("unreachable")
+
+    def current_hedge_delay(self) -> float:
+        """Delay before a hedged request: recent latency quantile, or the default."""
+        with self._lock:
+            if len(self._latencies) < self.hedge_min_samples:
+                return self.hedge_delay
+            return float(np.quantile(self._latencies, self.hedge_quantile))
+
+    def close(self) -> None:
+        """Release worker threads without waiting for hung calls."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _attempt(self, call: Callable[[_A], _R], arg: _A, hedge: bool) -> _R:
+        """One attempt: primary request, plus a hedge if it's slow."""
+        start = time.monotonic()
+        deadline = start + self.timeout if self.timeout is not None else None
+        hedge_at = start + self.current_hedge_delay() if hedge else None
+
+        pending = {self._pool.submit(call, arg)}
+        last_error: Optional[BaseException] = None
+
+        while pending:
+            now = time.monotonic()
+            wake_times = [t for t in (deadline, hedge_at) if t is not None]
+            wait_for = max(0.0, min(wake_times) - now) if wake_times else None
+
+            done, pending = concurrent.futures.wait(
+                pending, timeout=wait_for, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                try:
+                    return future.result()
+                except Exception as e:
+                    last_error = e
+
+            now = time.monotonic()
+            if hedge_at is not None and now >= hedge_at and pending:
+                logger.debug(f"Hedging transcription after {now - start:.2f}s")
+                pending.add(self._pool.submit(call, arg))
+                hedge_at = None
+            elif deadline is not None and now >= deadline and pending:
+                raise TimeoutError(f"Transcription exceeded {self.timeout}s deadline")
+
+        assert last_error is not None
+        raise last_error
+
+    def _timed_call(self, segment: SpeechSegment) -> str:
+        """Call the backend and record its latency on success."""
+        start = time.monotonic()
+        text = self.transcriber.transcribe(segment)
+        with self._lock:
+            self._latencies.append(time.monotonic() - start)
+        return text
+
+
+class _ResilientStream(TranscriptionStream):
+    """Wrapped upload that falls back to a retried one-shot call if finishing fails."""
+
+    def __init__(self, owner: ResilientTranscriber, stream: TranscriptionStream):
+        self._owner = owner
+        self._stream = stream
+
+    def write(self, data: bytes) -> None:
+        self._stream.write(data)
+
+    def finish(self, segment: SpeechSegment) -> str:
+        try:
+            return self._stream.finish(segment)
+        except self._owner.retry_on as e:
+            logger.warning(f"Streamed transcription failed ({e}), retrying in one shot")
+            return self._owner.transcribe(segment)
+
+    def abort(self) -> None:
+        self._stream.abort()
@@ -1,6 +1,6 @@
 """Core data types for hearken pipeline."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Optional
 
@@ -23,10 +23,34 @@ class SpeechSegment:
     start_time: float
     end_time: float
 
+    # (offset into audio_data in seconds, original timestamp) at the start of
+    # each contiguous run of kept audio. None unless silence was compacted or
+    # segments were merged.
+    time_map: Optional[list[tuple[float, float]]] = None
+
+    # (offset into audio_data in seconds, start_time, end_time) of each
+    # original segment. None unless several segments were merged.
+    parts: Optional[list[tuple[float, float, float]]] = None
+
+    # Encoded audio keyed by format (e.g. "wav", "flac"), filled by the
+    # optional encoding stage so transcribers don't encode on their thread
+    payloads: dict[str, bytes] = field(default_factory=dict, repr=False)
+
     @property
     def duration(self) -> float:
+        """
+        Span of the original timeline covered by the segment.
+
+        Longer than audio_duration when silence was compacted or segments
+        were merged; time_map and parts map the audio back to this span.
+        """
         return self.end_time - self.start_time
 
+    @property
+    def audio_duration(self) -> float:
+        """Length of audio_data in seconds, what a transcriber actually processes."""
+        return len(self.audio_data) / (self.sample_rate * self.sample_width)
+
 
 @dataclass
 class VADResult:
@@ -53,6 +77,19 @@ class DetectorConfig:
     # Maximum speech duration before forced segmentation
     max_speech_duration: float = 30.0  # seconds
 
+    # Forced splits: look back this far for the quietest frame to cut at, and
+    # stay in SPEAKING afterwards (0 = cut at the current frame and go IDLE)
+    split_lookback: float = 0.0  # seconds
+
+    # Forced splits: audio before the cut repeated at the start of the next segment
+    split_overlap: float = 0.0  # seconds
+
+    # Compaction: trailing non-speech kept at the end of a segment (None = keep all)
+    trailing_silence_margin: Optional[float] = None  # seconds
+
+    # Compaction: internal pauses longer than this are shortened to it (None = keep all)
+    max_internal_pause: Optional[float] = None  # seconds
+
     # Silence duration to end an utterance
     silence_timeout: float = 0.8  # seconds
 
@@ -61,3 +98,78 @@ class DetectorConfig:
 
     # Frame duration for audio chunks
     frame_duration_ms: int = 30  # milliseconds
+
+    # Duty cycling while IDLE: run the VAD on every Nth frame only (1 = every frame)
+    idle_vad_interval: int = 1
+
+    # Duty cycling while IDLE: also run the VAD on frames whose RMS energy
+    # reaches this floor (None = disabled)
+    idle_energy_floor: Optional[float] = None
+
+    # Derive timing from cumulative sample counts anchored at the first chunk's
+    # timestamp, instead of per-chunk wall-clock stamps. Makes segmentation
+    # deterministic and independent of capture jitter or replay speed.
+    sample_clock: bool = False
+
+
+@dataclass
+class MergeConfig:
+    """Configuration for coalescing short adjacent segments."""
+
+    # Merge segments whose gap (next start - previous end) is at most this
+    max_gap: float = 0.5  # seconds
+
+    # Never merge past this much audio (compacted silence and the gaps
+    # between parts don't count)
+    max_duration: float = 15.0  # seconds
+
+    # Never merge past this many bytes of audio (None = no limit)
+    max_bytes: Optional[int] = None
+
+    # Longest a segment is held back waiting for a neighbour
+    max_hold: float = 1.0  # seconds
+
+
+@dataclass
+class WatchdogConfig:
+    """Configuration for the real-time watchdog that degrades to fallback VADs."""
+
+    # Switch to the next fallback when detection cost per second of audio
+    # (smoothed) exceeds this
+    degrade_rtf: float = 0.8
+
+    # ...or when the capture queue is at least this full and still filling
+    degrade_fill: float = 0.5
+
+    # Switch back one level once the real-time factor stays below this...
+    recover_rtf: float = 0.3
+
+    # ...and the capture queue below this fill...
+    recover_fill: float = 0.1
+
+    # ...for this long
+    recover_after: float = 5.0  # seconds
+
+    # Overload soon after a recovery doubles recover_after, up to this
+    max_recover_after: float = 300.0  # seconds
+
+    # Minimum time between switches
+    min_dwell: float = 2.0  # seconds
+
+    # Window over which the queue-fill slope is measured
+    slope_window: float = 1.0  # seconds
+
+    # EMA weight of the newest real-time factor sample
+    smoothing: float = 0.1
+
+
+@dataclass
+class VADSwitch:
+    """A watchdog switch between the primary and fallback VADs."""
+    from_vad: str
+    to_vad: str
+    level: int                # 0 = primary VAD, 1+ = fallbacks in order
+    reason: str               # "overload" or "recovered"
+    realtime_factor: float    # Smoothed detection cost per second of audio
+    queue_fill: float         # Capture queue fill (0.0-1.0)
+    timestamp: float          # time.monotonic() of the switch
@@ -1,6 +1,8 @@
 """Voice Activity Detection implementations."""
 
 from .energy import EnergyVAD
+from .spectral import SpectralVAD
+from .smoothed import SmoothedVAD
 
 try:
     from .webrtc import WebRTCVAD
@@ -14,7 +16,7 @@ try:
 except ImportError:
     _silero_available = False
 
-__all__ = ['EnergyVAD']
+__all__ = ['EnergyVAD', 'SpectralVAD', 'SmoothedVAD']
 if _webrtc_available:
     __all__.append('WebRTCVAD')
 if _silero_available:
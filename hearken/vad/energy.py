@@ -1,8 +1,9 @@
 """Energy-based voice activity detection."""
 
+import collections
 import logging
 import numpy as np
-from typing import Optional
+from typing import Optional, Sequence
 
 from ..interfaces import VAD
 from ..types import AudioChunk, VADResult
@@ -15,7 +16,8 @@ class EnergyVAD(VAD):
     Simple energy-based voice activity detection.
 
     Uses RMS (root mean square) energy threshold to detect speech.
-    Optionally adapts threshold based on ambient noise during calibration.
+    Optionally adapts threshold based on ambient noise during calibration,
+    and can keep tracking the noise floor afterwards for long-running streams.
     """
 
     def __init__(
@@ -24,22 +26,35 @@ class EnergyVAD(VAD):
         dynamic: bool = True,
         calibration_samples: int = 50,  # ~1.5s at 30ms frames
         threshold_multiplier: float = 1.5,
+        track_noise_floor: bool = False,
+        noise_window: int = 100,  # ~3s of non-speech at 30ms frames
     ):
         """
         Args:
             threshold: RMS energy threshold for speech detection
             dynamic: If True, adapt threshold based on ambient noise
             calibration_samples: Number of initial samples for calibration
+            threshold_multiplier: Threshold as a multiple of ambient energy
+            track_noise_floor: If True, keep following the noise floor after
+                calibration using the minimum energy over recent non-speech frames
+            noise_window: Number of non-speech frames in the minimum window
         """
         self.base_threshold = threshold
         self.dynamic = dynamic
         self.calibration_samples = calibration_samples
+        self.track_noise_floor = track_noise_floor
+        self.noise_window = noise_window
 
         self._ambient_energy: Optional[float] = None
         self._threshold_multiplier = threshold_multiplier
         self._samples_seen = 0
         self._effective_threshold = self.base_threshold
-        self._energy_samples = []
+
+        # Sliding-window minimum over non-speech energies: a monotonic deque of
+        # (frame index, energy) with increasing energies, O(1) amortized per frame
+        self._noise_minima: collections.deque[tuple[int, float]] = collections.deque()
+        self._noise_frames = 0
+        self._speech_run = 0
 
     def process(self, chunk: AudioChunk) -> VADResult:
         # Convert bytes to int16 samples
@@ -70,8 +85,64 @@ class EnergyVAD(VAD):
         # Confidence: how far above/below threshold
         confidence = min(1.0, float(energy / self._effective_threshold)) if is_speech else 0.0
 
+        calibrating = self.dynamic and self._samples_seen < self.calibration_samples
+        if self.track_noise_floor and not calibrating:
+            self._update_noise_floor(float(energy), is_speech)
+
         return VADResult(is_speech=is_speech, confidence=confidence)
 
+    def _update_noise_floor(self, energy: float, is_speech: bool) -> None:
+        """Update the sliding-window noise floor and threshold from one frame."""
+        if is_speech:
+            self._speech_run += 1
+            # A full window of uninterrupted "speech" means the noise has risen
+            # above the threshold; let the frame through so the floor can follow
+            if self._speech_run < self.noise_window:
+                return
+        else:
+            self._speech_run = 0
+
+        index = self._noise_frames
+        self._noise_frames += 1
+
+        minima = self._noise_minima
+        while minima and minima[-1][1] >= energy:
+            minima.pop()
+        minima.append((index, energy))
+        if minima[0][0] <= index - self.noise_window:
+            minima.popleft()
+
+        noise_floor = minima[0][1]
+        self._effective_threshold = max(
+            self.base_threshold, noise_floor * self._threshold_multiplier
+        )
+        logger.debug(f"Noise floor: {noise_floor}, threshold: {self._effective_threshold}")
+
+    def calibrate(self, chunks: Sequence[AudioChunk]) -> None:
+        """
+        Set the ambient level from audio known to be non-speech, ending calibration.
+
+        For a VAD switched in mid-utterance, which would otherwise calibrate
+        on the speech in progress. Ignored without chunks or when not dynamic.
+        """
+        if not self.dynamic or not chunks:
+            return
+
+        energies = [
+            float(np.sqrt(np.mean(np.frombuffer(c.data, dtype=np.int16).astype(np.float32) ** 2)))
+            for c in chunks
+        ]
+        self._ambient_energy = float(np.mean(energies))
+        self._samples_seen = self.calibration_samples
+        self._effective_threshold = max(
+            self.base_threshold, self._ambient_energy * self._threshold_multiplier
+        )
+        logger.debug(f"Calibrated threshold from {len(chunks)} frames: {self._effective_threshold}")
+
+        if self.track_noise_floor:
+            for energy in energies:
+                self._update_noise_floor(energy, is_speech=False)
+
     def reset(self) -> None:
         """Reset between utterances. Don't reset ambient calibration."""
         pass
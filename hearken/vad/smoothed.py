@@ -0,0 +1,127 @@
+"""Smoothing and hysteresis wrapper for any VAD."""
+
+import collections
+import logging
+from typing import Optional
+
+from ..interfaces import VAD
+from ..types import AudioChunk, VADResult
+
+logger = logging.getLogger("hearken")
+
+
+class SmoothedVAD(VAD):
+    """
+    Wraps another VAD to stabilize its decisions.
+
+    Smooths the wrapped VAD's output, then applies hysteresis: speech starts
+    when the smoothed value reaches onset_threshold and only ends once it
+    drops below offset_threshold. Borderline frames no longer flip the
+    detector between SPEAKING and TRAILING_SILENCE, so utterances aren't
+    fragmented into many short segments.
+
+    Smoothing modes (both O(1) per frame):
+    - "ema": exponential moving average of confidence
+    - "vote": fraction of the last `window` frames the wrapped VAD called speech
+    """
+
+    SMOOTHING_MODES = ["ema", "vote"]
+
+    def __init__(
+        self,
+        vad: VAD,
+        onset_threshold: float = 0.6,
+        offset_threshold: float = 0.4,
+        smoothing: str = "ema",
+        alpha: float = 0.3,
+        window: int = 5,
+    ):
+        """
+        Args:
+            vad: VAD to wrap
+            onset_threshold: Smoothed value at which speech starts (0.0-1.0)
+            offset_threshold: Smoothed value below which speech ends (0.0-1.0)
+            smoothing: Smoothing mode ("ema" or "vote")
+            alpha: EMA weight of the newest frame (0.0-1.0], for "ema"
+            window: Number of frames in the vote, for "vote"
+
+        Raises:
+            ValueError: If thresholds, smoothing mode, alpha or window are invalid
+        """
+        if not 0.0 <= offset_threshold <= onset_threshold <= 1.0:
+            raise ValueError(
+                f"Thresholds must satisfy 0.0 <= offset <= onset <= 1.0, "
+                f"got onset={onset_threshold}, offset={offset_threshold}"
+            )
+
+        if smoothing not in self.SMOOTHING_MODES:
+            raise ValueError(f"Smoothing must be one of {self.SMOOTHING_MODES}, got {smoothing!r}")
+
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError(f"Alpha must be in (0.0, 1.0], got {alpha}")
+
+        if window < 1:
+            raise ValueError(f"Window must be at least 1, got {window}")
+
+        self.vad = vad
+        self._onset_threshold = onset_threshold
+        self._offset_threshold = offset_threshold
+        self._smoothing = smoothing
+        self._alpha = alpha
+        self._window = window
+
+        self._is_speech = False
+        self._ema: Optional[float] = None
+        self._votes: collections.deque[bool] = collections.deque(maxlen=window)
+        self._vote_count = 0
+
+    def process(self, chunk: AudioChunk) -> VADResult:
+        """Process audio chunk and return the smoothed speech decision."""
+        result = self.vad.process(chunk)
+
+        if self._smoothing == "ema":
+            score = self._update_ema(result.confidence)
+        else:
+            score = self._update_vote(result.is_speech)
+
+        # Hysteresis: separate thresholds for entering and leaving speech
+        if self._is_speech:
+            if score < self._offset_threshold:
+                self._is_speech = False
+        elif score >= self._onset_threshold:
+            self._is_speech = True
+
+        return VADResult(is_speech=self._is_speech, confidence=score)
+
+    def _update_ema(self, confidence: float) -> float:
+        """Fold a confidence value into the running average."""
+        if self._ema is None:
+            self._ema = confidence
+        else:
+            self._ema += self._alpha * (confidence - self._ema)
+        return self._ema
+
+    def _update_vote(self, is_speech: bool) -> float:
+        """Add a decision to the sliding window and return the speech fraction."""
+        if len(self._votes) == self._window and self._votes[0]:
+            self._vote_count -= 1
+        self._votes.append(is_speech)
+        if is_speech:
+            self._vote_count += 1
+        return self._vote_count / len(self._votes)
+
+    def reset(self) -> None:
+        """Reset smoothing state and the wrapped VAD between utterances."""
+        self.vad.reset()
+        self._is_speech = False
+        self._ema = None
+        self._votes.clear()
+        self._vote_count = 0
+
+    @property
+    def required_sample_rate(self) -> Optional[int]:
+        return self.vad.required_sample_rate
+
+    @property
+    def required_frame_duration_ms(self) -> int | float | None:
+        return self.vad.required_frame_duration_ms
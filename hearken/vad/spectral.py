@@ -0,0 +1,212 @@
+"""Spectral voice activity detection using NumPy FFTs."""
+
+import logging
+from typing import Optional, Sequence
+
+import numpy as np
+
+from ..interfaces import VAD
+from ..types import AudioChunk, VADResult
+
+logger = logging.getLogger("hearken")
+
+
+def _ramp(values: np.ndarray, good: float, bad: float) -> np.ndarray:
+    """Map values linearly to 1.0 at `good` and 0.0 at `bad`, clipped."""
+    return np.clip((bad - values) / (bad - good), 0.0, 1.0)
+
+
+class SpectralVAD(VAD):
+    """
+    Spectral voice activity detection.
+
+    Sits between EnergyVAD and SileroVAD in cost and accuracy. Each chunk is
+    split into short analysis frames and scored on four features:
+    - SNR of speech-band energy over an adaptive noise floor
+    - Speech-band energy ratio (rejects low-frequency hum like fans/HVAC)
+    - Spectral flatness within the speech band (rejects broadband noise)
+    - Zero-crossing rate (rejects hiss)
+
+    All frames of a batch of chunks are analysed in one vectorized pass.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.5,
+        analysis_frame_ms: int = 10,
+        speech_band: tuple[float, float] = (200.0, 4000.0),
+        min_snr_db: float = 6.0,
+        min_band_ratio: float = 0.4,
+        max_flatness: float = 0.3,
+        max_zcr: float = 0.25,
+        noise_adaptation_rate: float = 0.05,
+        min_noise_floor: float = 1e-6,
+    ):
+        """
+        Args:
+            threshold: Confidence threshold for speech detection (0.0-1.0)
+            analysis_frame_ms: Duration of each FFT analysis frame
+            speech_band: Low and high edges of the speech band in Hz
+            min_snr_db: Speech-band SNR above the noise floor for full score
+            min_band_ratio: Fraction of energy in the speech band for full score
+            max_flatness: Speech-band spectral flatness for full score
+            max_zcr: Zero-crossing rate (crossings per sample) for full score
+            noise_adaptation_rate: How fast the noise floor rises on non-speech frames
+            min_noise_floor: Lower bound for the noise floor (normalized power)
+
+        Raises:
+            ValueError: If threshold not in [0.0, 1.0] or speech band is invalid
+        """
+        if not 0.0 <= threshold <= 1.0:
+            raise ValueError(f"Threshold must be between 0.0 and 1.0, got {threshold}")
+
+        if not 0.0 <= speech_band[0] < speech_band[1]:
+            raise ValueError(f"Invalid speech band: {speech_band}")
+
+        self._threshold = threshold
+        self._analysis_frame_ms = analysis_frame_ms
+        self._speech_band = speech_band
+        self._min_snr_db = min_snr_db
+        self._min_band_ratio = min_band_ratio
+        self._max_flatness = max_flatness
+        self._max_zcr = max_zcr
+        self._noise_adaptation_rate = noise_adaptation_rate
+        self._min_noise_floor = min_noise_floor
+
+        self._noise_floor: Optional[float] = None
+
+        # Window and band mask depend on frame length and sample rate
+        self._frame_samples: Optional[int] = None
+        self._sample_rate: Optional[int] = None
+        self._window: Optional[np.ndarray] = None
+        self._window_power = 1.0
+        self._band_mask: Optional[np.ndarray] = None
+
+    def process(self, chunk: AudioChunk) -> VADResult:
+        """Process audio chunk and return speech detection result."""
+        return self.process_batch([chunk])[0]
+
+    def process_batch(self, chunks: Sequence[AudioChunk]) -> list[VADResult]:
+        """
+        Process several chunks in one vectorized pass.
+
+        The noise floor is updated once per batch, from the frames the batch
+        classified as non-speech.
+
+        Args:
+            chunks: Audio chunks sharing one sample rate
+
+        Returns:
+            One VADResult per chunk, in order
+        """
+        if not chunks:
+            return []
+
+        sample_rate = chunks[0].sample_rate
+        frame_samples = max(1, sample_rate * self._analysis_frame_ms // 1000)
+
+        # Split every chunk into analysis frames and stack them
+        frames = []
+        counts = []
+        for chunk in chunks:
+            samples = np.frombuffer(chunk.data, dtype=np.int16)
+            if len(samples) < frame_samples:
+                # Short chunk: analyse it as one zero-padded frame
+                padded = np.zeros(frame_samples, dtype=np.int16)
+                padded[: len(samples)] = samples
+                samples = padded
+            n = len(samples) // frame_samples
+            frames.append(samples[: n * frame_samples].reshape(n, frame_samples))
+            counts.append(n)
+
+        batch = np.concatenate(frames).astype(np.float32) / 32768.0
+        confidence = self._score(batch, sample_rate)
+
+        # Average frame confidences per chunk
+        offsets = np.cumsum([0] + counts[:-1])
+        chunk_confidence = np.add.reduceat(confidence, offsets) / np.asarray(counts)
+
+        return [
+            VADResult(is_speech=bool(c >= self._threshold), confidence=float(c))
+            for c in chunk_confidence
+        ]
+
+    def _score(self, frames: np.ndarray, sample_rate: int) -> np.ndarray:
+        """Score a (num_frames, frame_samples) array; returns per-frame confidence."""
+        self._prepare(frames.shape[1], sample_rate)
+
+        # Zero-crossing rate
+        signs = np.signbit(frames)
+        zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / frames.shape[1]
+
+        # Power spectrum
+        power = np.abs(np.fft.rfft(frames * self._window, axis=1)) ** 2
+        band = power[:, self._band_mask]
+
+        eps = 1e-12
+        total_energy = power.sum(axis=1) + eps
+        band_energy = band.sum(axis=1)
+        band_ratio = band_energy / total_energy
+
+        # Geometric mean / arithmetic mean over the speech band
+        flatness = np.exp(np.mean(np.log(band + eps), axis=1)) / (band.mean(axis=1) + eps)
+
+        # Normalize band energy to mean-square units for the noise floor
+        band_power = 2.0 * band_energy / (frames.shape[1] * self._window_power)
+
+        if self._noise_floor is None:
+            self._noise_floor = max(self._min_noise_floor, float(band_power.min()))
+
+        snr_db = 10.0 * np.log10(band_power / self._noise_floor + eps)
+
+        confidence: np.ndarray = (
+            np.clip(snr_db / self._min_snr_db, 0.0, 1.0)
+            * _ramp(band_ratio, self._min_band_ratio, self._min_band_ratio / 2)
+            * _ramp(flatness, self._max_flatness, 2 * self._max_flatness)
+            * _ramp(zcr, self._max_zcr, 2 * self._max_zcr)
+        )
+
+        self._update_noise_floor(band_power[confidence < self._threshold])
+
+        return confidence
+
+    def _update_noise_floor(self, noise_power: np.ndarray) -> None:
+        """Track the noise floor: fall immediately, rise slowly on non-speech frames."""
+        floor = self._noise_floor
+        if floor is None or len(noise_power) == 0:
+            return
+
+        lowest = float(noise_power.min())
+        if lowest < floor:
+            floor = lowest
+        else:
+            floor += self._noise_adaptation_rate * (float(noise_power.mean()) - floor)
+
+        self._noise_floor = max(self._min_noise_floor, floor)
+        logger.debug(f"Spectral noise floor: {self._noise_floor}")
+
+    def _prepare(self, frame_samples: int, sample_rate: int) -> None:
+        """Cache window and band mask for the current frame geometry."""
+        if frame_samples == self._frame_samples and sample_rate == self._sample_rate:
+            return
+
+        self._frame_samples = frame_samples
+        self._sample_rate = sample_rate
+        self._window = np.hanning(frame_samples).astype(np.float32)
+        self._window_power = float(np.sum(self._window**2))
+
+        freqs = np.fft.rfftfreq(frame_samples, d=1.0 / sample_rate)
+        low, high = self._speech_band
+        self._band_mask = (freqs >= low) & (freqs <= high)
+
+    def reset(self) -> None:
+        """Reset between utterances. Don't reset the noise floor."""
+        pass
+
+    @property
+    def required_sample_rate(self) -> Optional[int]:
+        return None  # Works with any sample rate
+
+    @property
+    def required_frame_duration_ms(self) -> Optional[int]:
+        return None  # Works with any frame size
@@ -23,15 +23,27 @@ class WebRTCVAD(VAD):
     Uses Google's WebRTC VAD for robust speech detection.
     More accurate than EnergyVAD in noisy environments.
 
+    Chunks of any length are split into 10, 20, or 30 ms sub-frames.
+    Samples that don't fill a whole sub-frame are carried over to the
+    next call, and the sub-frame decisions are combined into a single
+    VADResult whose confidence is the fraction of speech sub-frames.
+
     Constraints:
     - Sample rate must be 8000, 16000, 32000, or 48000 Hz
-    - Frame duration must be 10, 20, or 30 ms
+    - Sub-frame duration must be 10, 20, or 30 ms
     """
 
     SUPPORTED_SAMPLE_RATES = [8000, 16000, 32000, 48000]
     SUPPORTED_FRAME_DURATIONS_MS = [10, 20, 30]
-
-    def __init__(self, aggressiveness: int = 1):
+    VOTING_STRATEGIES = ["any", "majority", "all"]
+
+    def __init__(
+        self,
+        aggressiveness: int = 1,
+        frame_duration_ms: Optional[int] = None,
+        vote: str = "majority",
+        speech_ratio: Optional[float] = None,
+    ):
         """
         Initialize WebRTC VAD.
 
@@ -41,24 +53,55 @@ class WebRTCVAD(VAD):
                 1: Quality mode (default)
                 2: Low bitrate mode
                 3: Very aggressive (less speech detected)
+            frame_duration_ms: Sub-frame duration (10, 20, or 30 ms). If None,
+                uses the largest supported duration that fits in the first chunk.
+            vote: How sub-frame decisions are combined ("any", "majority", "all")
+            speech_ratio: Fraction of speech sub-frames required for a chunk to
+                count as speech. Overrides vote when set.
 
         Raises:
-            ValueError: If aggressiveness is not in range 0-3
+            ValueError: If aggressiveness is not in range 0-3, or framing
+                options are invalid
         """
         if not 0 <= aggressiveness <= 3:
             raise ValueError(
                 f"Aggressiveness must be 0-3, got {aggressiveness}"
             )
 
+        if (
+            frame_duration_ms is not None
+            and frame_duration_ms not in self.SUPPORTED_FRAME_DURATIONS_MS
+        ):
+            raise ValueError(
+                f"WebRTC VAD requires frame duration of {self.SUPPORTED_FRAME_DURATIONS_MS} ms. "
+                f"Got {frame_duration_ms} ms."
+            )
+
+        if vote not in self.VOTING_STRATEGIES:
+            raise ValueError(f"Vote must be one of {self.VOTING_STRATEGIES}, got {vote!r}")
+
+        if speech_ratio is not None and not 0.0 < speech_ratio <= 1.0:
+            raise ValueError(f"Speech ratio must be in (0.0, 1.0], got {speech_ratio}")
+
         self._aggressiveness = aggressiveness
+        self._frame_duration_ms = frame_duration_ms
+        self._vote = vote
+        self._speech_ratio = speech_ratio
         self._vad = webrtcvad.Vad(aggressiveness)
         self._validated = False
         self._sample_rate: Optional[int] = None
+        self._frame_bytes = 0
+
+        # Samples left over from the previous chunk
+        self._pending = b""
+        # Returned when a chunk is too short to complete a sub-frame
+        self._last_result = VADResult(is_speech=False, confidence=0.0)
 
     def process(self, chunk: AudioChunk) -> VADResult:
         """Process audio chunk and return speech detection result."""
-        # Validate sample rate and frame duration on first call
-        if not self._validated:
+        # Validate sample rate and resolve sub-frame size on first call,
+        # or when the stream format changes
+        if not self._validated or chunk.sample_rate != self._sample_rate:
             if chunk.sample_rate not in self.SUPPORTED_SAMPLE_RATES:
                 raise ValueError(
                     f"WebRTC VAD requires sample rate of {self.SUPPORTED_SAMPLE_RATES} Hz. "
@@ -66,35 +109,63 @@ class WebRTCVAD(VAD):
                     f"Configure your AudioSource with a supported sample rate."
                 )
 
-            # Calculate frame duration from chunk
-            num_samples = len(chunk.data) // chunk.sample_width
-            duration_ms = int((num_samples / chunk.sample_rate) * 1000)
-
-            if duration_ms not in self.SUPPORTED_FRAME_DURATIONS_MS:
-                raise ValueError(
-                    f"WebRTC VAD requires frame duration of {self.SUPPORTED_FRAME_DURATIONS_MS} ms. "
-                    f"Got {duration_ms} ms. "
-                    f"Configure your AudioSource with a supported frame duration."
-                )
+            duration_ms = self._frame_duration_ms
+            if duration_ms is None:
+                num_samples = len(chunk.data) // chunk.sample_width
+                chunk_ms = (num_samples / chunk.sample_rate) * 1000
+                fitting = [d for d in self.SUPPORTED_FRAME_DURATIONS_MS if d <= chunk_ms]
+                duration_ms = max(fitting) if fitting else self.SUPPORTED_FRAME_DURATIONS_MS[0]
 
             self._sample_rate = chunk.sample_rate
+            self._frame_bytes = chunk.sample_rate * duration_ms // 1000 * chunk.sample_width
             self._validated = True
-
-        # Call WebRTC VAD
-        is_speech = self._vad.is_speech(chunk.data, self._sample_rate)
-
-        # Map boolean to confidence
-        confidence = 1.0 if is_speech else 0.0
-
-        return VADResult(is_speech=is_speech, confidence=confidence)
+            logger.debug(f"WebRTC VAD using {duration_ms}ms sub-frames")
+
+        data = self._pending + chunk.data if self._pending else chunk.data
+        frame_bytes = self._frame_bytes
+        num_frames = len(data) // frame_bytes
+
+        if num_frames == 0:
+            self._pending = data
+            return self._last_result
+
+        # Run WebRTC VAD on each complete sub-frame
+        view = memoryview(data)
+        speech_frames = 0
+        for i in range(num_frames):
+            frame = view[i * frame_bytes : (i + 1) * frame_bytes]
+            if self._vad.is_speech(frame, self._sample_rate):
+                speech_frames += 1
+
+        self._pending = data[num_frames * frame_bytes :]
+
+        # Fraction of speech sub-frames doubles as confidence
+        confidence = speech_frames / num_frames
+        is_speech = self._decide(speech_frames, num_frames)
+
+        self._last_result = VADResult(is_speech=is_speech, confidence=confidence)
+        return self._last_result
+
+    def _decide(self, speech_frames: int, num_frames: int) -> bool:
+        """Combine sub-frame decisions into one chunk-level decision."""
+        if self._speech_ratio is not None:
+            return speech_frames >= self._speech_ratio * num_frames
+        if self._vote == "any":
+            return speech_frames > 0
+        if self._vote == "all":
+            return speech_frames == num_frames
+        return speech_frames * 2 >= num_frames
 
     def reset(self) -> None:
-        """Reset internal state between utterances."""
-        # Recreate VAD instance for clean state
+        """
+        Reset internal state between utterances.
+
+        Replaces the WebRTC instance but keeps the validated stream format,
+        so reset is cheap enough to call after every segment.
+        """
         self._vad = webrtcvad.Vad(self._aggressiveness)
-        # Clear validation state to allow revalidation
-        self._validated = False
-        self._sample_rate = None
+        self._pending = b""
+        self._last_result = VADResult(is_speech=False, confidence=0.0)
 
     @property
     def required_sample_rate(self) -> Optional[int]:
@@ -104,4 +175,4 @@ class WebRTCVAD(VAD):
     @property
     def required_frame_duration_ms(self) -> Optional[int]:
         """Required frame duration in ms, or None if flexible."""
-        return None  # Validated at runtime
+        return None  # Any chunk size is split into sub-frames
@@ -0,0 +1,198 @@
+"""Real-time watchdog that degrades to cheaper VADs under load."""
+
+import collections
+import logging
+import time
+from typing import Callable, Optional, Sequence
+
+from .interfaces import VAD
+from .types import VADSwitch, WatchdogConfig
+
+logger = logging.getLogger("hearken.watchdog")
+
+
+class RealtimeWatchdog:
+    """
+    Tracks whether detection keeps up with real time and picks the VAD.
+
+    The VADs form a ladder from the primary (most accurate, most expensive)
+    to the cheapest fallback, e.g. Silero -> WebRTC -> Energy. After every
+    frame, the detect thread reports how long detection took and how full
+    the capture queue is. When the smoothed real-time factor (detection
+    time per second of audio) or a filling queue shows detection falling
+    behind, the watchdog steps one VAD down the ladder; once there has been
+    headroom for `recover_after` seconds, it steps back up one level.
+    Switches are at least `min_dwell` seconds apart.
+
+    Headroom on a cheap fallback doesn't show whether the VAD above it
+    would keep up. If detection is overloaded again within `recover_after`
+    seconds of a recovery, the wait before the next recovery is doubled
+    (up to `max_recover_after`). It returns to `recover_after` once a
+    recovery has held for the current wait.
+    """
+
+    def __init__(
+        self,
+        vads: Sequence[VAD],
+        config: Optional[WatchdogConfig] = None,
+        on_switch: Optional[Callable[[VADSwitch], None]] = None,
+    ):
+        """
+        Args:
+            vads: Primary VAD followed by fallbacks, most expensive first
+            config: Watchdog thresholds (uses defaults if None)
+            on_switch: Callback for every switch
+
+        Raises:
+            ValueError: If fewer than two VADs are given, thresholds overlap or
+                max_recover_after is below recover_after
+        """
+        self.config = config or WatchdogConfig()
+        if len(vads) < 2:
+            raise ValueError("Watchdog needs a primary VAD and at least one fallback")
+        if self.config.recover_rtf >= self.config.degrade_rtf:
+            raise ValueError(
+                f"recover_rtf ({self.config.recover_rtf}) must be below "
+                f"degrade_rtf ({self.config.degrade_rtf})"
+            )
+        if self.config.recover_fill >= self.config.degrade_fill:
+            raise ValueError(
+                f"recover_fill ({self.config.recover_fill}) must be below "
+                f"degrade_fill ({self.config.degrade_fill})"
+            )
+        if self.config.max_recover_after < self.config.recover_after:
+            raise ValueError(
+                f"max_recover_after ({self.config.max_recover_after}) must be at least "
+                f"recover_after ({self.config.recover_after})"
+            )
+
+        self.vads = list(vads)
+        self.on_switch = on_switch
+        self.level = 0
+        self.realtime_factor = 0.0
+        self.switches = 0
+        # Current wait before recovering, backed off after flapping
+        self.recover_after = self.config.recover_after
+
+        self._fills: collections.deque[tuple[float, float]] = collections.deque()
+        self._last_switch: Optional[float] = None
+        self._headroom_since: Optional[float] = None
+        self._last_recovery: Optional[float] = None
+        self._fresh = True
+
+    @property
+    def vad(self) -> VAD:
+        """The VAD detection should use now."""
+        return self.vads[self.level]
+
+    def observe(
+        self,
+        cost: float,
+        audio_seconds: float,
+        queue_fill: float,
+        now: Optional[float] = None,
+    ) -> Optional[VAD]:
+        """
+        Record one processed frame.
+
+        Args:
+            cost: Seconds spent detecting the frame
+            audio_seconds: Duration of the frame
+            queue_fill: Capture queue fill after the frame (0.0-1.0)
+            now: Current time.monotonic() (read if None)
+
+        Returns:
+            The VAD to switch to, or None to keep the current one
+        """
+        if now is None:
+            now = time.monotonic()
+        if audio_seconds <= 0:
+            return None
+
+        config = self.config
+        rtf = cost / audio_seconds
+        if self._last_switch is None:
+            # Startup counts as a switch, so warm-up frames can't trigger one
+            self._last_switch = now
+        if self._fresh:
+            # Seed the average with the current VAD's own cost
+            self.realtime_factor = rtf
+            self._fresh = False
+        else:
+            self.realtime_factor += config.smoothing * (rtf - self.realtime_factor)
+
+        slope = self._fill_slope(queue_fill, now)
+
+        if self._last_recovery is not None and now - self._last_recovery >= self.recover_after:
+            # The last recovery held, so the VAD above is affordable again
+            self._last_recovery = None
+            self.recover_after = config.recover_after
+
+        overloaded = self.realtime_factor > config.degrade_rtf or (
+            queue_fill >= config.degrade_fill and slope > 0
+        )
+        if self.realtime_factor < config.recover_rtf and queue_fill <= config.recover_fill:
+            if self._headroom_since is None:
+                self._headroom_since = now
+        else:
+            self._headroom_since = None
+
+        if now - self._last_switch < config.min_dwell:
+            return None
+
+        if overloaded and self.level < len(self.vads) - 1:
+            return self._switch(self.level + 1, "overload", queue_fill, now)
+
+        if (
+            self.level > 0
+            and self._headroom_since is not None
+            and now - self._headroom_since >= self.recover_after
+        ):
+            return self._switch(self.level - 1, "recovered", queue_fill, now)
+
+        return None
+
+    def _fill_slope(self, queue_fill: float, now: float) -> float:
+        """Change in queue fill per second over the slope window."""
+        self._fills.append((now, queue_fill))
+        while now - self._fills[0][0] > self.config.slope_window:
+            self._fills.popleft()
+
+        first_time, first_fill = self._fills[0]
+        if now == first_time:
+            return 0.0
+        return (queue_fill - first_fill) / (now - first_time)
+
+    def _switch(self, level: int, reason: str, queue_fill: float, now: float) -> VAD:
+        if reason == "recovered":
+            self._last_recovery = now
+        elif self._last_recovery is not None:
+            # Overloaded again soon after recovering: wait longer next time
+            self._last_recovery = None
+            self.recover_after = min(self.recover_after * 2, self.config.max_recover_after)
+            logger.info(f"VAD recovery flapped, now waiting {self.recover_after:.1f}s")
+
+        previous = self.vad
+        self.level = level
+        self.switches += 1
+        self._last_switch = now
+        self._headroom_since = None
+        self._fills.clear()
+        self._fresh = True
+
+        event = VADSwitch(
+            from_vad=type(previous).__name__,
+            to_vad=type(self.vad).__name__,
+            level=level,
+            reason=reason,
+            realtime_factor=self.realtime_factor,
+            queue_fill=queue_fill,
+            timestamp=now,
+        )
+        logger.warning(
+            f"Switching VAD {event.from_vad} -> {event.to_vad} ({reason}, "
+            f"rtf={self.realtime_factor:.2f}, queue={queue_fill:.0%})"
+        )
+        if self.on_switch:
+            self.on_switch(event)
+        return self.vad
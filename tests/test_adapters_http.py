@@ -0,0 +1,219 @@
+import base64
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from hearken.adapters.http import HTTPTranscriber
+from hearken.types import SpeechSegment
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive
+
+    def do_POST(self):
+        if self.headers.get("Transfer-Encoding") == "chunked":
+            body = self._read_chunked()
+        else:
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+
+        server = self.server
+        server.requests.append(
+            {
+                "client": self.client_address,
+                "headers": dict(self.headers),
+                "body": body,
+                "path": self.path,
+            }
+        )
+
+        status = server.status
+        response = json.dumps({"result": {"text": f"heard {len(body)} bytes"}}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+        if server.drop_after_response:
+            # Close without announcing it, like an idle-timeout on the server
+            self.close_connection = True
+
+    def _read_chunked(self) -> bytes:
+        body = b""
+        while True:
+            size = int(self.rfile.readline().strip(), 16)
+            if size == 0:
+                self.rfile.readline()
+                return body
+            body += self.rfile.read(size)
+            self.rfile.readline()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    httpd.requests = []
+    httpd.status = 200
+    httpd.drop_after_response = False
+    thread = threading.Thread(
+        target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def url_for(server, path="/recognize") -> str:
+    host, port = server.server_address
+    return f"http://{host}:{port}{path}"
+
+
+def make_segment(num_bytes: int = 3200) -> SpeechSegment:
+    return SpeechSegment(
+        audio_data=b"\x01\x00" * (num_bytes // 2),
+        sample_rate=16000,
+        sample_width=2,
+        start_time=0.0,
+        end_time=num_bytes / 32000,
+    )
+
+
+def test_http_transcriber_reuses_connection(server):
+    """Test consecutive segments share one keep-alive connection."""
+    transcriber = HTTPTranscriber(url_for(server), audio_format="pcm", response_field="result.text")
+
+    for _ in range(3):
+        assert transcriber.transcribe(make_segment()) == "heard 3200 bytes"
+    transcriber.close()
+
+    clients = {request["client"] for request in server.requests}
+    assert len(server.requests) == 3
+    assert len(clients) == 1
+    assert server.requests[0]["headers"]["Content-Type"] == "audio/L16; rate=16000"
+
+
+def test_http_transcriber_streams_chunked_body(server):
+    """Test streamed bodies arrive intact with chunked transfer encoding."""
+    transcriber = HTTPTranscriber(
+        url_for(server),
+        audio_format="pcm",
+        response_field="result.text",
+        stream=True,
+        chunk_size=1000,
+    )
+    segment = make_segment(4500)
+
+    assert transcriber.transcribe(segment) == "heard 4500 bytes"
+
+    request = server.requests[0]
+    assert request["headers"]["Transfer-Encoding"] == "chunked"
+    assert request["body"] == segment.audio_data
+
+
+def test_http_transcriber_json_request(server):
+    """Test JSON mode base64-encodes audio alongside extra fields."""
+    transcriber = HTTPTranscriber(
+        url_for(server, "/v1/stt?model=small"),
+        audio_format="wav",
+        json_field="audio",
+        json_body={"language": "en-US"},
+        parse_response=lambda data: json.loads(data)["result"]["text"].upper(),
+    )
+    segment = make_segment()
+
+    assert transcriber.transcribe(segment).startswith("HEARD")
+
+    request = server.requests[0]
+    payload = json.loads(request["body"])
+    assert request["path"] == "/v1/stt?model=small"
+    assert request["headers"]["Content-Type"] == "application/json"
+    assert payload["language"] == "en-US"
+    assert base64.b64decode(payload["audio"]) == segment.payloads["wav"]
+
+
+def test_http_transcriber_reconnects_after_server_close(server):
+    """Test a connection dropped by the server is transparently replaced."""
+    server.drop_after_response = True
+    transcriber = HTTPTranscriber(url_for(server), audio_format="pcm", response_field="result.text")
+
+    for _ in range(3):
+        assert transcriber.transcribe(make_segment()) == "heard 3200 bytes"
+
+    assert len(server.requests) == 3
+
+
+def test_http_transcriber_error_status(server):
+    """Test non-2xx responses raise and the pooled connection stays usable."""
+    transcriber = HTTPTranscriber(url_for(server), audio_format="pcm", response_field="result.text")
+
+    server.status = 503
+    with pytest.raises(RuntimeError, match="503"):
+        transcriber.transcribe(make_segment())
+
+    server.status = 200
+    assert transcriber.transcribe(make_segment()) == "heard 3200 bytes"
+
+
+def test_http_transcriber_pool_limits_concurrency(server):
+    """Test concurrent calls never open more connections than the pool size."""
+    transcriber = HTTPTranscriber(
+        url_for(server), audio_format="pcm", response_field="result.text", pool_size=2
+    )
+
+    threads = [
+        threading.Thread(target=transcriber.transcribe, args=(make_segment(),)) for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=5.0)
+
+    clients = {request["client"] for request in server.requests}
+    assert len(server.requests) == 8
+    assert len(clients) <= 2
+
+
+def test_http_transcriber_streams_utterance(server):
+    """Test open_stream uploads audio incrementally on a pooled connection."""
+    transcriber = HTTPTranscriber(url_for(server), audio_format="pcm", response_field="result.text")
+    assert transcriber.supports_streaming
+
+    segment = make_segment(3000)
+    stream = transcriber.open_stream(16000, 2)
+    stream.write(segment.audio_data[:1000])
+    stream.write(segment.audio_data[1000:])
+
+    assert stream.finish(segment) == "heard 3000 bytes"
+    assert transcriber.transcribe(make_segment()) == "heard 3200 bytes"
+
+    request = server.requests[0]
+    assert request["headers"]["Transfer-Encoding"] == "chunked"
+    assert request["body"] == segment.audio_data
+    assert server.requests[0]["client"] == server.requests[1]["client"]
+
+
+def test_http_transcriber_streaming_requires_raw_pcm():
+    """Test formats that need the whole segment can't be streamed."""
+    transcriber = HTTPTranscriber("http://example.com/", audio_format="wav")
+
+    assert not transcriber.supports_streaming
+    with pytest.raises(ValueError, match="Streaming requires"):
+        transcriber.open_stream(16000, 2)
+
+
+def test_http_transcriber_validation():
+    """Test invalid configuration is rejected."""
+    with pytest.raises(ValueError, match="scheme"):
+        HTTPTranscriber("ftp://example.com/")
+
+    with pytest.raises(ValueError, match="no host"):
+        HTTPTranscriber("http:///transcribe")
+
+    with pytest.raises(ValueError, match="Pool size"):
+        HTTPTranscriber("http://example.com/", pool_size=0)
@@ -95,3 +95,28 @@ def test_sr_transcriber_creates_audio_data():
             pass
         else:
             raise
+
+
+def test_sr_transcriber_reuses_pre_encoded_payload():
+    """Test SRTranscriber serves cached FLAC instead of re-encoding."""
+    recognizer = sr.Recognizer()
+    captured = {}
+
+    def fake_recognize(audio_data, **kwargs):
+        captured["flac"] = audio_data.get_flac_data()
+        return "ok"
+
+    recognizer.recognize_fake = fake_recognize
+    transcriber = SRTranscriber(recognizer, method="recognize_fake")
+
+    segment = SpeechSegment(
+        audio_data=b"\x00" * 3200,
+        sample_rate=16000,
+        sample_width=2,
+        start_time=0.0,
+        end_time=0.1,
+    )
+    segment.payloads["flac"] = b"fLaC-cached"
+
+    assert transcriber.transcribe(segment) == "ok"
+    assert captured["flac"] == b"fLaC-cached"
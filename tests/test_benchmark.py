@@ -0,0 +1,92 @@
+import json
+import wave
+
+import numpy as np
+import pytest
+
+from hearken.benchmark import (
+    bench_detector,
+    bench_pipeline,
+    bench_vad,
+    split_frames,
+    synthetic_speech,
+)
+from hearken.benchmark.suite import load_audio, main
+from hearken.vad.energy import EnergyVAD
+
+
+def test_split_frames():
+    """Test audio is cut into whole frames with sample-clock timestamps."""
+    frames = split_frames(b"\x00" * (16000 * 2 + 100), 16000, 30)
+
+    assert len(frames) == 33
+    assert all(len(f.data) == 960 for f in frames)
+    assert frames[1].timestamp == pytest.approx(0.03)
+
+
+def test_bench_vad_reports_latency_and_throughput():
+    """Test VAD benchmarks report percentiles, throughput and memory."""
+    result = bench_vad(EnergyVAD, synthetic_speech(2), memory_streams=3)
+
+    assert result.name == "EnergyVAD"
+    assert result.frames == 66
+    assert 0 < result.p50_us <= result.p90_us <= result.p99_us <= result.max_us
+    assert result.frames_per_second > 0
+    assert result.memory_per_stream > 0
+
+    data = result.to_dict()
+    assert data["realtime_factor"] == result.realtime_factor
+    json.dumps(data)
+
+
+def test_bench_detector_includes_detector_state():
+    """Test detector benchmarks cost at least their VAD's memory."""
+    audio = synthetic_speech(2)
+    vad = bench_vad(EnergyVAD, audio, memory_streams=3)
+    detector = bench_detector(EnergyVAD, audio, name="energy", memory_streams=3)
+
+    assert detector.name == "energy"
+    assert detector.frames == vad.frames
+    assert detector.memory_per_stream > vad.memory_per_stream
+
+
+def test_bench_vad_rejects_short_audio():
+    """Test audio shorter than a frame is rejected."""
+    with pytest.raises(ValueError, match="shorter than one frame"):
+        bench_vad(EnergyVAD, b"\x00" * 100)
+
+
+def test_bench_pipeline_measures_segment_latency():
+    """Test segments and transcripts are timed through a Listener."""
+    result = bench_pipeline(synthetic_speech(2), transcribe_delay=0.05)
+
+    assert result.segments >= 1
+    assert result.transcripts == result.segments
+    assert 0 <= result.segment_latency_ms["p50"] < result.transcript_latency_ms["p50"]
+    assert result.transcript_latency_ms["p50"] >= 50
+
+
+def test_main_writes_json(tmp_path):
+    """Test the CLI benchmarks fixture audio and records skipped VADs."""
+    audio_path = tmp_path / "speech.wav"
+    with wave.open(str(audio_path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(8000)
+        wav.writeframes(synthetic_speech(1, sample_rate=8000))
+
+    audio, sample_rate = load_audio(str(audio_path))
+    assert sample_rate == 8000
+    assert len(audio) == 16000
+
+    output = tmp_path / "results.json"
+    args = f"--audio {audio_path} --vad energy --vad missing --no-pipeline --memory-streams 2"
+    main(args.split() + ["--output", str(output)])
+
+    results = json.loads(output.read_text())
+    assert results["sample_rate"] == 8000
+    assert [r["name"] for r in results["vad"]] == ["energy"]
+    assert [r["name"] for r in results["detector"]] == ["energy"]
+    assert results["pipeline"] is None
+    assert results["skipped"] == {"missing": "not installed"}
+    assert np.isfinite(results["vad"][0]["p99_us"])
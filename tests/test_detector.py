@@ -1,8 +1,10 @@
 from hearken.detector import SpeechDetector
 from hearken.vad.energy import EnergyVAD
 from hearken.types import DetectorState, DetectorConfig, AudioChunk
+import dataclasses
 import numpy as np
 import time
+import pytest
 
 
 def create_chunk(is_speech: bool, timestamp: float) -> AudioChunk:
@@ -172,3 +174,356 @@ def test_detector_handles_pause():
 
     assert detector.state == DetectorState.SPEAKING
     assert len(segments) == 0  # No segment emitted yet
+
+
+class CountingVAD(EnergyVAD):
+    """EnergyVAD that records how many frames it evaluated."""
+
+    def __init__(self):
+        super().__init__(threshold=300.0, dynamic=False)
+        self.calls = 0
+
+    def process(self, chunk):
+        self.calls += 1
+        return super().process(chunk)
+
+
+def test_detector_duty_cycle_skips_idle_frames():
+    """Test IDLE duty cycling runs the VAD on every Nth frame only."""
+    vad = CountingVAD()
+    config = DetectorConfig(idle_vad_interval=4)
+    detector = SpeechDetector(vad=vad, config=config)
+
+    for i in range(40):
+        detector.process(create_chunk(is_speech=False, timestamp=i * 0.03))
+
+    assert vad.calls == 10
+    assert detector.state == DetectorState.IDLE
+    assert len(detector.padding_buffer) == detector.padding_buffer.maxlen
+
+
+def test_detector_duty_cycle_energy_floor():
+    """Test IDLE duty cycling with an energy pre-check only probes loud frames."""
+    vad = CountingVAD()
+    config = DetectorConfig(idle_energy_floor=200.0)
+    detector = SpeechDetector(vad=vad, config=config)
+
+    for i in range(20):
+        detector.process(create_chunk(is_speech=False, timestamp=i * 0.03))
+    assert vad.calls == 0
+
+    detector.process(create_chunk(is_speech=True, timestamp=0.6))
+    assert detector.state == DetectorState.SPEECH_STARTING
+    assert detector.speech_start_time == 0.6
+    # Pre-roll is kept even though the quiet frames were never probed
+    assert len(detector.segment_chunks) == detector.padding_buffer.maxlen
+
+
+def test_detector_duty_cycle_backfills_onset():
+    """Test speech onset in skipped frames is recovered on detection."""
+    vad = CountingVAD()
+    config = DetectorConfig(idle_vad_interval=5, min_speech_duration=0.06)
+    detector = SpeechDetector(vad=vad, config=config)
+
+    t = 0.0
+    # Silence until the duty cycle counter is mid-way, then speech starts
+    for _ in range(7):
+        detector.process(create_chunk(is_speech=False, timestamp=t))
+        t += 0.03
+    onset = t
+    for _ in range(3):
+        detector.process(create_chunk(is_speech=True, timestamp=t))
+        t += 0.03
+
+    # Probe frame (10th) detected speech and the two skipped speech frames
+    # before it were replayed, so the FSM already confirmed speech
+    assert detector.state == DetectorState.SPEAKING
+    assert detector.speech_start_time == onset
+    assert detector.segment_chunks[-1].timestamp == onset + 0.06
+
+
+def test_detector_duty_cycle_disabled_by_default():
+    """Test the VAD runs on every frame unless duty cycling is configured."""
+    vad = CountingVAD()
+    detector = SpeechDetector(vad=vad)
+
+    for i in range(10):
+        detector.process(create_chunk(is_speech=False, timestamp=i * 0.03))
+
+    assert vad.calls == 10
+
+
+def test_detector_sample_clock_ignores_jitter():
+    """Test sample clock derives timing from sample counts, not chunk stamps."""
+    vad = EnergyVAD(threshold=300.0, dynamic=False)
+    config = DetectorConfig(
+        min_speech_duration=0.06,
+        silence_timeout=0.12,
+        sample_clock=True,
+    )
+
+    segments = []
+    detector = SpeechDetector(vad=vad, config=config, on_segment=segments.append)
+
+    # Replay as fast as possible: every chunk carries nearly the same wall-clock stamp
+    pattern = [False] * 5 + [True] * 10 + [False] * 6
+    for i, is_speech in enumerate(pattern):
+        detector.process(create_chunk(is_speech=is_speech, timestamp=100.0 + i * 1e-6))
+
+    assert len(segments) == 1
+    # Speech starts at frame 5 (30ms frames of 480 samples at 16kHz)
+    assert segments[0].start_time == 100.0 + 5 * 0.03
+    # Silence confirmed after 0.12s past the last speech frame (frame 14)
+    assert segments[0].end_time == pytest.approx(100.0 + 18 * 0.03)
+
+
+def test_detector_wall_clock_by_default():
+    """Test chunk timestamps are used as-is without the sample clock."""
+    vad = EnergyVAD(threshold=300.0, dynamic=False)
+    detector = SpeechDetector(vad=vad)
+
+    detector.process(create_chunk(is_speech=True, timestamp=42.0))
+
+    assert detector.speech_start_time == 42.0
+
+
+def test_detector_max_duration_hard_split_by_default():
+    """Test max duration cuts at the current frame and returns to IDLE."""
+    vad = EnergyVAD(threshold=300.0, dynamic=False)
+    config = DetectorConfig(min_speech_duration=0.06, max_speech_duration=0.3)
+
+    segments = []
+    detector = SpeechDetector(vad=vad, config=config, on_segment=segments.append)
+
+    for i in range(11):
+        detector.process(create_chunk(is_speech=True, timestamp=i * 0.03))
+
+    assert len(segments) == 1
+    assert detector.state == DetectorState.IDLE
+
+
+def test_detector_smart_split_cuts_at_quietest_frame():
+    """Test smart split cuts at the lowest-confidence frame in the lookback."""
+    vad = EnergyVAD(threshold=300.0, dynamic=False)
+    config = DetectorConfig(
+        min_speech_duration=0.06,
+        max_speech_duration=0.3,
+        split_lookback=0.15,
+        speech_padding=0.03,
+    )
+
+    segments = []
+    detector = SpeechDetector(vad=vad, config=config, on_segment=segments.append)
+
+    # Speech with a one-frame dip at frame 8, inside the lookback window
+    pattern = [True] * 8 + [False] + [True] * 2
+    for i, is_speech in enumerate(pattern):
+        detector.process(create_chunk(is_speech=is_speech, timestamp=i * 0.03))
+
+    assert len(segments) == 1
+    # First segment ends right after the dip frame
+    assert segments[0].end_time == pytest.approx(9 * 0.03)
+    assert len(segments[0].audio_data) == 9 * 960
+    # Detector keeps speaking with the remaining frames
+    assert detector.state == DetectorState.SPEAKING
+    assert [c.timestamp for c in detector.segment_chunks] == pytest.approx([0.27, 0.30])
+    assert detector.speech_start_time == pytest.approx(0.27)
+
+
+def test_detector_smart_split_overlap():
+    """Test smart split carries overlap into the next segment."""
+    vad = EnergyVAD(threshold=300.0, dynamic=False)
+    config = DetectorConfig(
+        min_speech_duration=0.06,
+        max_speech_duration=0.3,
+        split_lookback=0.15,
+        split_overlap=0.06,
+        speech_padding=0.03,
+    )
+
+    segments = []
+    detector = SpeechDetector(vad=vad, config=config, on_segment=segments.append)
+
+    pattern = [True] * 8 + [False] + [True] * 2
+    for i, is_speech in enumerate(pattern):
+        detector.process(create_chunk(is_speech=is_speech, timestamp=i * 0.03))
+
+    assert len(segments) == 1
+    # Two frames before the cut (frames 7 and 8) are repeated
+    assert detector.segment_chunks[0].timestamp == pytest.approx(0.21)
+    assert len(detector.segment_chunks) == 4
+    assert detector.segment_chunks[0].data == segments[0].audio_data[-2 * 960:-960]
+
+
+def test_detector_smart_split_continues_segmenting():
+    """Test speech after a smart split is emitted as its own segment."""
+    vad = EnergyVAD(threshold=300.0, dynamic=False)
+    config = DetectorConfig(
+        min_speech_duration=0.06,
+        max_speech_duration=0.3,
+        silence_timeout=0.09,
+        split_lookback=0.15,
+    )
+
+    segments = []
+    detector = SpeechDetector(vad=vad, config=config, on_segment=segments.append)
+
+    pattern = [True] * 14 + [False] * 5
+    for i, is_speech in enumerate(pattern):
+        detector.process(create_chunk(is_speech=is_speech, timestamp=i * 0.03))
+
+    assert len(segments) == 2
+    assert segments[1].start_time >= segments[0].start_time
+    assert detector.state == DetectorState.IDLE
+
+
+def run_pattern(config: DetectorConfig, pattern: list[bool]) -> list:
+    """Feed a speech/silence pattern of 30ms frames and collect segments."""
+    vad = EnergyVAD(threshold=300.0, dynamic=False)
+    segments = []
+    detector = SpeechDetector(vad=vad, config=config, on_segment=segments.append)
+    for i, is_speech in enumerate(pattern):
+        detector.process(create_chunk(is_speech=is_speech, timestamp=i * 0.03))
+    return segments
+
+
+def test_detector_no_compaction_by_default():
+    """Test segments keep all trailing silence without compaction options."""
+    config = DetectorConfig(min_speech_duration=0.06, silence_timeout=0.15, speech_padding=0.03)
+
+    segments = run_pattern(config, [True] * 5 + [False] * 6)
+
+    assert len(segments) == 1
+    # 5 speech frames + 5 trailing silence frames before timeout
+    assert len(segments[0].audio_data) == 10 * 960
+    assert segments[0].time_map is None
+
+
+def test_detector_trims_trailing_silence():
+    """Test trailing silence is trimmed to the configured margin."""
+    config = DetectorConfig(
+        min_speech_duration=0.06,
+        silence_timeout=0.15,
+        speech_padding=0.03,
+        trailing_silence_margin=0.06,
+    )
+
+    segments = run_pattern(config, [True] * 5 + [False] * 6)
+
+    assert len(segments) == 1
+    assert len(segments[0].audio_data) == 7 * 960
+    assert segments[0].time_map == [(0.0, 0.0)]
+    assert segments[0].end_time == pytest.approx(7 * 0.03)
+
+
+def test_detector_collapses_internal_pauses():
+    """Test long internal pauses are shortened and the time map records the gap."""
+    config = DetectorConfig(
+        min_speech_duration=0.06,
+        silence_timeout=0.3,
+        speech_padding=0.03,
+        max_internal_pause=0.06,
+    )
+
+    # 3 speech, 8 pause (< timeout), 3 speech, then silence to emit
+    pattern = [True] * 3 + [False] * 8 + [True] * 3 + [False] * 11
+    segments = run_pattern(config, pattern)
+    uncompacted = run_pattern(dataclasses.replace(config, max_internal_pause=None), pattern)
+
+    assert len(segments) == 1
+    segment = segments[0]
+    # Pause of 8 frames collapsed to 2 (one kept on each side)
+    assert len(uncompacted[0].audio_data) - len(segment.audio_data) == 6 * 960
+    assert segment.time_map[0] == (0.0, 0.0)
+    assert segment.time_map[1][0] == pytest.approx(4 * 0.03)
+    assert segment.time_map[1][1] == pytest.approx(10 * 0.03)
+    # duration keeps the original span, audio_duration what was kept
+    assert segment.duration == pytest.approx(uncompacted[0].duration)
+    assert segment.audio_duration == pytest.approx(uncompacted[0].audio_duration - 6 * 0.03)
+
+
+def test_detector_streams_confirmed_audio():
+    """Test on_audio receives the segment's audio from confirmation onwards."""
+    vad = EnergyVAD(threshold=300.0, dynamic=False)
+    config = DetectorConfig(min_speech_duration=0.06, silence_timeout=0.15, speech_padding=0.03)
+    streamed = []
+    segments = []
+    detector = SpeechDetector(
+        vad=vad, config=config, on_segment=segments.append, on_audio=streamed.append
+    )
+
+    # False start is never streamed
+    detector.process(create_chunk(is_speech=True, timestamp=0.0))
+    for i in range(1, 7):
+        detector.process(create_chunk(is_speech=False, timestamp=i * 0.03))
+    assert detector.state == DetectorState.IDLE
+    assert streamed == []
+
+    pattern = [True] * 5 + [False] * 6
+    for i, is_speech in enumerate(pattern):
+        detector.process(create_chunk(is_speech=is_speech, timestamp=1.0 + i * 0.03))
+
+    assert len(segments) == 1
+    # First call carries pre-roll and the confirming frames, then one chunk per call
+    assert len(streamed[0]) > 1
+    assert all(len(chunks) == 1 for chunks in streamed[1:])
+    audio = b''.join(c.data for chunks in streamed for c in chunks)
+    assert audio == segments[0].audio_data
+
+
+def test_detector_streams_overlap_after_split():
+    """Test forced splits stream each utterance's audio once, overlap included."""
+    vad = EnergyVAD(threshold=300.0, dynamic=False)
+    config = DetectorConfig(
+        min_speech_duration=0.06,
+        max_speech_duration=0.6,
+        split_lookback=0.15,
+        split_overlap=0.06,
+    )
+    events = []
+    detector = SpeechDetector(
+        vad=vad,
+        config=config,
+        on_segment=lambda s: events.append(("segment", s)),
+        on_audio=lambda chunks: events.append(("audio", chunks)),
+    )
+
+    for i in range(30):
+        detector.process(create_chunk(is_speech=True, timestamp=i * 0.03))
+    detector.flush()
+
+    # Each utterance streams exactly its own audio: nothing past a cut, and the
+    # carried-over audio again as the start of the next utterance
+    streamed = b''
+    segments = []
+    for kind, item in events:
+        if kind == "audio":
+            streamed += b''.join(c.data for c in item)
+        else:
+            assert streamed == item.audio_data
+            segments.append(item)
+            streamed = b''
+    assert len(segments) >= 2
+
+
+def test_detector_flush_emits_segment_in_progress():
+    """Test flush() emits confirmed speech and drops unconfirmed speech."""
+    vad = EnergyVAD(threshold=300.0, dynamic=False)
+    config = DetectorConfig(min_speech_duration=0.06)
+    segments = []
+    detector = SpeechDetector(vad=vad, config=config, on_segment=segments.append)
+
+    for i in range(5):
+        detector.process(create_chunk(is_speech=True, timestamp=i * 0.03))
+    assert detector.state == DetectorState.SPEAKING
+
+    detector.flush()
+    assert detector.state == DetectorState.IDLE
+    assert len(segments) == 1
+    assert segments[0].end_time == pytest.approx(0.15)
+
+    detector.process(create_chunk(is_speech=True, timestamp=1.0))
+    assert detector.state == DetectorState.SPEECH_STARTING
+    detector.flush()
+    assert detector.state == DetectorState.IDLE
+    assert len(segments) == 1
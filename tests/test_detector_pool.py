@@ -0,0 +1,232 @@
+import time
+
+import pytest
+
+from hearken import Listener
+from hearken.benchmark import synthetic_speech
+from hearken.detector import SpeechDetector
+from hearken.detector_pool import DetectorPool, SharedRing
+from hearken.sources.file import FileAudioSource
+from hearken.types import AudioChunk, DetectorConfig
+from hearken.vad.energy import EnergyVAD
+
+CONFIG = DetectorConfig(min_speech_duration=0.09, silence_timeout=0.15)
+
+
+def failing_vad():
+    raise RuntimeError("model missing")
+
+
+def make_frames(seconds: float = 2.0) -> list[AudioChunk]:
+    audio = synthetic_speech(seconds)
+    return [
+        AudioChunk(
+            data=audio[offset : offset + 960],
+            timestamp=offset / 32000,
+            sample_rate=16000,
+            sample_width=2,
+        )
+        for offset in range(0, len(audio), 960)
+    ]
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with DetectorPool(processes=1) as pool:
+        yield pool
+
+
+def test_shared_ring_round_trip_and_wraparound():
+    """Test records survive wrapping around the end of the ring."""
+    ring = SharedRing(size=100)
+    reader = SharedRing(name=ring.name)
+    try:
+        for i in range(10):
+            payload = bytes([i]) * 40
+            assert ring.put(float(i), payload)
+            assert reader.get() == (float(i), payload)
+        assert reader.get() is None
+    finally:
+        reader.close()
+        ring.close()
+
+
+def test_shared_ring_refuses_when_full():
+    """Test a record that doesn't fit is refused until the reader catches up."""
+    ring = SharedRing(size=100)
+    try:
+        assert ring.put(0.0, b"a" * 50)
+        assert not ring.put(1.0, b"b" * 50)
+        assert ring.get() == (0.0, b"a" * 50)
+        assert ring.put(1.0, b"b" * 50)
+    finally:
+        ring.close()
+
+
+def collect(pool, frames, expected: int = 1):
+    segments = []
+    errors = []
+
+    stream = pool.open_stream(
+        EnergyVAD,
+        CONFIG,
+        16000,
+        2,
+        on_segment=segments.append,
+        on_error=errors.append,
+    )
+    for chunk in frames:
+        # Wait out the worker's start-up instead of dropping frames
+        while not stream.write(chunk):
+            time.sleep(0.01)
+
+    deadline = time.monotonic() + 5.0
+    while len(segments) < expected and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.1)
+    stream.close()
+    return segments, errors
+
+
+def test_pool_matches_in_process_detection(pool):
+    """Test worker-side detection yields the same segments as a local detector."""
+    frames = make_frames()
+    expected = []
+    detector = SpeechDetector(EnergyVAD(), CONFIG, on_segment=expected.append)
+    for chunk in frames:
+        detector.process(chunk)
+
+    segments, errors = collect(pool, frames, expected=len(expected))
+
+    assert errors == []
+    assert len(expected) >= 1
+    assert [(s.start_time, s.end_time, s.audio_data) for s in segments] == [
+        (s.start_time, s.end_time, s.audio_data) for s in expected
+    ]
+
+
+def test_pool_sends_oversized_segments_inline():
+    """Test segments larger than the output ring still arrive intact."""
+    frames = make_frames()
+    expected = []
+    detector = SpeechDetector(EnergyVAD(), CONFIG, on_segment=expected.append)
+    for chunk in frames:
+        detector.process(chunk)
+
+    with DetectorPool(processes=1, segment_buffer_seconds=0.05) as small:
+        segments, _ = collect(small, frames, expected=len(expected))
+
+    assert [s.audio_data for s in segments] == [s.audio_data for s in expected]
+
+
+def test_pool_reports_worker_errors(pool):
+    """Test a VAD factory failing in the worker reaches on_error."""
+    errors = []
+    stream = pool.open_stream(
+        failing_vad, CONFIG, 16000, 2, on_segment=print, on_error=errors.append
+    )
+
+    deadline = time.monotonic() + 5.0
+    while not errors and time.monotonic() < deadline:
+        time.sleep(0.01)
+    stream.close(timeout=0.5)
+
+    assert "model missing" in str(errors[0])
+
+
+def test_pool_rejects_unpicklable_factory(pool):
+    """Test lambdas are rejected since workers can't import them."""
+    with pytest.raises(ValueError, match="picklable"):
+        pool.open_stream(lambda: EnergyVAD(), CONFIG, 16000, 2, on_segment=print)
+
+
+def test_listener_uses_detector_pool(pool, tmp_path):
+    """Test a Listener detects in the pool instead of a detect thread."""
+    path = tmp_path / "speech.pcm"
+    path.write_bytes(synthetic_speech(2))
+
+    # Unthrottled reads arrive faster than real time, so count time in samples
+    config = DetectorConfig(min_speech_duration=0.09, silence_timeout=0.15, sample_clock=True)
+    expected = []
+    detector = SpeechDetector(EnergyVAD(), config, on_segment=expected.append)
+    for chunk in make_frames():
+        detector.process(chunk)
+    detector.flush()
+
+    segments = []
+    listener = Listener(
+        # Unthrottled, so capture has to wait for the worker's ring to drain
+        source=FileAudioSource(str(path), sample_rate=16000, speed=None),
+        vad_factory=EnergyVAD,
+        detector_config=config,
+        on_speech=segments.append,
+        detector_pool=pool,
+    )
+    assert listener.vad is None
+    listener.start()
+    assert [t.name for t in listener._threads] == ["hearken-capture"]
+    assert listener.wait_for_end(timeout=5.0)
+    listener.stop()
+
+    assert listener.chunks_dropped == 0
+    assert len(expected) >= 1
+    assert [s.audio_data for s in segments] == [s.audio_data for s in expected]
+
+
+def test_listener_detector_pool_validation(pool, tmp_path):
+    """Test pooled detection needs a factory and excludes in-thread features."""
+    source = FileAudioSource(str(tmp_path / "x.pcm"), sample_rate=16000)
+
+    with pytest.raises(ValueError, match="vad_factory"):
+        Listener(source=source, vad=EnergyVAD(), detector_pool=pool)
+
+    with pytest.raises(ValueError, match="fallback_vads"):
+        Listener(source=source, detector_pool=pool, fallback_vads=[EnergyVAD()])
+
+
+def test_pool_flush_emits_segment_in_progress(pool):
+    """Test flushing a stream emits speech that runs up to the end of input."""
+    frames = make_frames()
+    segments = []
+    stream = pool.open_stream(
+        EnergyVAD, DetectorConfig(silence_timeout=5.0), 16000, 2, on_segment=segments.append
+    )
+    for chunk in frames:
+        while not stream.write(chunk):
+            time.sleep(0.01)
+    stream.flush()
+
+    deadline = time.monotonic() + 5.0
+    while not segments and time.monotonic() < deadline:
+        time.sleep(0.01)
+    stream.close()
+
+    assert len(segments) == 1
+
+
+def test_pool_stream_refuses_writes_after_close(pool):
+    """Test writes racing with close are refused instead of touching freed memory."""
+    frames = make_frames(0.5)
+    stream = pool.open_stream(EnergyVAD, CONFIG, 16000, 2, on_segment=print)
+    stream.close()
+
+    assert not any(stream.write(chunk) for chunk in frames)
+    stream.flush()
+
+
+def test_listener_start_fails_when_worker_vad_fails(pool, tmp_path):
+    """Test start() raises and closes the source if the worker can't build the VAD."""
+    path = tmp_path / "speech.pcm"
+    path.write_bytes(synthetic_speech(1))
+
+    listener = Listener(
+        source=FileAudioSource(str(path), sample_rate=16000),
+        vad_factory=failing_vad,
+        detector_pool=pool,
+        on_error=lambda e: None,
+    )
+    with pytest.raises(RuntimeError, match="model missing"):
+        listener.start()
+
+    assert not listener._running
+    assert listener._detector_stream is None
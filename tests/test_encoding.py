@@ -0,0 +1,138 @@
+import io
+import shutil
+import threading
+import time
+import wave
+
+import numpy as np
+import pytest
+
+from hearken import encoding
+from hearken.encoding import ENCODERS, SegmentEncoder, encode_wav, get_payload
+from hearken.types import SpeechSegment
+
+
+def make_segment() -> SpeechSegment:
+    samples = (np.sin(np.arange(1600) * 0.1) * 8000).astype(np.int16)
+    return SpeechSegment(
+        audio_data=samples.tobytes(),
+        sample_rate=16000,
+        sample_width=2,
+        start_time=0.0,
+        end_time=0.1,
+    )
+
+
+def test_encode_wav_round_trip():
+    """Test WAV payload decodes back to the segment's PCM."""
+    segment = make_segment()
+
+    with wave.open(io.BytesIO(encode_wav(segment)), "rb") as wav:
+        assert wav.getnchannels() == 1
+        assert wav.getsampwidth() == 2
+        assert wav.getframerate() == 16000
+        assert wav.readframes(wav.getnframes()) == segment.audio_data
+
+
+def test_get_payload_caches_on_segment():
+    """Test payloads are encoded once and reused."""
+    segment = make_segment()
+
+    payload = get_payload(segment, "wav")
+
+    assert segment.payloads["wav"] is payload
+    assert get_payload(segment, "wav") is payload
+
+
+def test_get_payload_unknown_format():
+    """Test unknown formats are rejected."""
+    with pytest.raises(ValueError, match="Unknown encoding format"):
+        get_payload(make_segment(), "mp3")
+
+
+def test_custom_encoder(monkeypatch):
+    """Test formats can be added through the registry."""
+    monkeypatch.setitem(ENCODERS, "raw", lambda segment: segment.audio_data)
+    segment = make_segment()
+
+    assert get_payload(segment, "raw") == segment.audio_data
+
+
+def test_encode_flac():
+    """Test FLAC encoding produces a FLAC stream when an encoder is available."""
+    try:
+        import speech_recognition  # noqa: F401
+    except ImportError:
+        if shutil.which("flac") is None:
+            pytest.skip("No FLAC encoder available")
+
+    payload = encoding.encode_flac(make_segment())
+
+    assert payload[:4] == b"fLaC"
+
+
+def test_segment_encoder_fills_payloads():
+    """Test the worker pool encodes every format before delivering."""
+    delivered = []
+    done = threading.Event()
+
+    def on_segment(segment):
+        delivered.append(segment)
+        done.set()
+
+    encoder = SegmentEncoder(["wav"], on_segment=on_segment, workers=1)
+    segment = make_segment()
+    encoder.submit(segment)
+    assert done.wait(timeout=2.0)
+    encoder.close()
+
+    assert delivered == [segment]
+    assert "wav" in segment.payloads
+
+
+def test_segment_encoder_delivers_on_failure(monkeypatch):
+    """Test segments are still delivered when encoding fails."""
+
+    def broken(segment):
+        raise RuntimeError("encoder missing")
+
+    monkeypatch.setitem(ENCODERS, "broken", broken)
+    errors = []
+    delivered = []
+
+    encoder = SegmentEncoder(
+        ["broken"], on_segment=delivered.append, on_error=errors.append, workers=1
+    )
+    encoder.submit(make_segment()).result(timeout=2.0)
+    encoder.close()
+
+    assert len(delivered) == 1
+    assert delivered[0].payloads == {}
+    assert len(errors) == 1
+
+
+def test_segment_encoder_delivers_in_submission_order(monkeypatch):
+    """Test a segment that encodes quickly waits for slower ones ahead of it."""
+
+    def slow_first(segment):
+        if segment.start_time == 0.0:
+            time.sleep(0.2)
+        return b""
+
+    monkeypatch.setitem(ENCODERS, "slow", slow_first)
+    delivered = []
+
+    encoder = SegmentEncoder(["slow"], on_segment=delivered.append, workers=2)
+    segments = [make_segment(), make_segment()]
+    segments[1].start_time = 1.0
+    for segment in segments:
+        encoder.submit(segment)
+    encoder.close()
+
+    assert [s.start_time for s in delivered] == [0.0, 1.0]
+
+
+def test_segment_encoder_validates_formats():
+    """Test unknown formats are rejected up front."""
+    with pytest.raises(ValueError, match="Unknown encoding formats"):
+        SegmentEncoder(["wav", "mp3"])
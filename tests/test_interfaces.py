@@ -49,6 +49,11 @@ def test_audio_source_read():
     source.close()
 
 
+def test_audio_source_default_backpressure():
+    """Test sources are treated as live devices unless they opt in to waiting."""
+    assert MockAudioSource().supports_backpressure is False
+
+
 from hearken.interfaces import Transcriber
 from hearken.types import SpeechSegment
 
@@ -76,6 +81,25 @@ def test_transcriber_interface():
     assert result == "transcribed 1.0s"
 
 
+def test_transcriber_default_batch():
+    """Test default transcribe_batch falls back to single calls."""
+    transcriber = MockTranscriber()
+
+    segments = [
+        SpeechSegment(
+            audio_data=b'\x00' * 16000,
+            sample_rate=16000,
+            sample_width=2,
+            start_time=0.0,
+            end_time=float(n),
+        )
+        for n in (1, 2)
+    ]
+
+    assert transcriber.supports_batch is False
+    assert transcriber.transcribe_batch(segments) == ["transcribed 1.0s", "transcribed 2.0s"]
+
+
 from hearken.interfaces import VAD
 from hearken.types import AudioChunk, VADResult
 
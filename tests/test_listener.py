@@ -206,3 +206,303 @@ def test_listener_wait_for_speech():
     # Segment should be detected
     assert segment is not None, f"Expected segment but got None (waited {elapsed:.2f}s)"
     assert segment.duration > 0
+
+
+def test_listener_merges_adjacent_segments():
+    """Test merge_config coalesces back-to-back segments before queueing."""
+    from hearken.types import MergeConfig
+
+    source = SpeechAudioSource()
+    config = DetectorConfig(
+        min_speech_duration=0.09,
+        silence_timeout=0.12,
+        sample_clock=True,
+    )
+
+    listener = Listener(
+        source=source,
+        vad=EnergyVAD(threshold=300.0, dynamic=False),
+        detector_config=config,
+        merge_config=MergeConfig(max_gap=0.5, max_duration=1.5, max_hold=5.0),
+    )
+
+    listener.start()
+    segment = listener.wait_for_speech(timeout=3.0)
+    listener.stop()
+
+    assert segment is not None
+    # Speech cycles every 540ms, so two or more detected segments fit under 1.5s
+    assert segment.parts is not None
+    assert len(segment.parts) >= 2
+    assert segment.duration <= 1.5
+
+
+def test_listener_merges_on_the_detector_clock(tmp_path):
+    """Test merged segments don't depend on how fast a file is replayed."""
+    from hearken.sources.file import FileAudioSource
+    from hearken.types import MergeConfig
+
+    # Six 0.3s bursts, one every 0.8s
+    rng = np.random.default_rng(0)
+    burst = rng.uniform(-5000, 5000, 4800)
+    audio = np.concatenate([np.concatenate([burst, np.zeros(8000)]) for _ in range(6)])
+    path = tmp_path / "bursts.pcm"
+    path.write_bytes(audio.astype(np.int16).tobytes())
+
+    def run(speed):
+        segments = []
+        listener = Listener(
+            source=FileAudioSource(str(path), sample_rate=16000, speed=speed),
+            vad=EnergyVAD(threshold=300.0, dynamic=False),
+            detector_config=DetectorConfig(
+                min_speech_duration=0.09, silence_timeout=0.15, sample_clock=True
+            ),
+            on_speech=segments.append,
+            merge_config=MergeConfig(max_gap=0.6, max_hold=1.0),
+        )
+        listener.start()
+        assert listener.wait_for_end(timeout=5.0)
+        listener.stop()
+
+        origin = segments[0].start_time
+        return [
+            (round(s.start_time - origin, 6), round(s.end_time - origin, 6), len(s.parts or []))
+            for s in segments
+        ]
+
+    unthrottled = run(None)
+    # Holds end after 1s of stream time, so bursts pair up
+    assert [parts for _, _, parts in unthrottled] == [2, 2, 2]
+    assert run(4.0) == unthrottled
+
+
+class BatchTranscriber(Transcriber):
+    """Batch-capable mock that records the batches it receives."""
+
+    def __init__(self):
+        self.batches = []
+
+    def transcribe(self, segment: SpeechSegment) -> str:
+        raise AssertionError("single calls should not be used")
+
+    def transcribe_batch(self, segments):
+        self.batches.append(len(segments))
+        return [f"text {s.start_time:.0f}" for s in segments]
+
+    @property
+    def supports_batch(self) -> bool:
+        return True
+
+
+def test_listener_pre_encodes_segments():
+    """Test encode_formats attaches encoded payloads before transcription."""
+    import threading
+
+    seen = []
+    done = threading.Event()
+
+    class PayloadTranscriber(Transcriber):
+        def transcribe(self, segment: SpeechSegment) -> str:
+            seen.append(dict(segment.payloads))
+            done.set()
+            return "ok"
+
+    listener = Listener(
+        source=SpeechAudioSource(),
+        transcriber=PayloadTranscriber(),
+        # Calibrating on the speech pattern can set the threshold above it
+        vad=EnergyVAD(threshold=300.0, dynamic=False),
+        on_transcript=lambda text, segment: None,
+        detector_config=DetectorConfig(
+            min_speech_duration=0.09,
+            silence_timeout=0.12,
+            sample_clock=True,
+        ),
+        encode_formats=["wav"],
+    )
+
+    listener.start()
+    assert done.wait(timeout=3.0)
+    listener.stop()
+
+    assert seen[0]["wav"].startswith(b"RIFF")
+
+
+def test_listener_streams_uploads():
+    """Test stream_uploads sends audio during speech and transcribes on close."""
+    import threading
+    from hearken.interfaces import TranscriptionStream
+
+    results = []
+    done = threading.Event()
+
+    class Stream(TranscriptionStream):
+        def __init__(self):
+            self.data = b""
+
+        def write(self, data: bytes) -> None:
+            self.data += data
+
+        def finish(self, segment: SpeechSegment) -> str:
+            return "match" if self.data == segment.audio_data else "mismatch"
+
+        def abort(self) -> None:
+            pass
+
+    class StreamTranscriber(Transcriber):
+        def transcribe(self, segment: SpeechSegment) -> str:
+            return "one-shot"
+
+        def open_stream(self, sample_rate: int, sample_width: int) -> TranscriptionStream:
+            return Stream()
+
+        @property
+        def supports_streaming(self) -> bool:
+            return True
+
+    def on_transcript(text, segment):
+        results.append(text)
+        done.set()
+
+    listener = Listener(
+        source=SpeechAudioSource(),
+        transcriber=StreamTranscriber(),
+        # Calibrating on the speech pattern can set the threshold above it
+        vad=EnergyVAD(threshold=300.0, dynamic=False),
+        on_transcript=on_transcript,
+        detector_config=DetectorConfig(
+            min_speech_duration=0.09,
+            silence_timeout=0.12,
+            sample_clock=True,
+        ),
+        stream_uploads=True,
+    )
+
+    listener.start()
+    assert done.wait(timeout=3.0)
+    listener.stop()
+
+    assert results[0] == "match"
+
+
+def test_listener_stream_uploads_validation():
+    """Test stream_uploads needs a streaming transcriber and on_transcript."""
+    import pytest
+
+    with pytest.raises(ValueError, match="on_transcript required"):
+        Listener(source=MockAudioSource(), transcriber=MockTranscriber(), stream_uploads=True)
+
+    with pytest.raises(ValueError, match="does not support streaming"):
+        Listener(
+            source=MockAudioSource(),
+            transcriber=MockTranscriber(),
+            on_transcript=lambda text, segment: None,
+            stream_uploads=True,
+        )
+
+
+def make_segment(start: float) -> SpeechSegment:
+    return SpeechSegment(
+        audio_data=b"\x00" * 320,
+        sample_rate=16000,
+        sample_width=2,
+        start_time=start,
+        end_time=start + 0.01,
+    )
+
+
+def run_transcribe_loop(listener: Listener, segments: list) -> None:
+    """Run the transcription loop on pre-queued segments until the poison pill."""
+    for segment in segments:
+        listener._segment_queue.put(segment)
+    listener._segment_queue.put(None)
+    listener._running = True
+    listener._transcribe_loop()
+    listener._running = False
+
+
+def test_listener_batches_transcription():
+    """Test queued segments are transcribed in batches and results mapped back."""
+    import threading
+
+    transcripts = []
+    done = threading.Event()
+
+    def on_transcript(text, segment):
+        transcripts.append((text, segment.start_time))
+        if len(transcripts) == 5:
+            done.set()
+
+    transcriber = BatchTranscriber()
+    listener = Listener(
+        source=MockAudioSource(),
+        transcriber=transcriber,
+        on_transcript=on_transcript,
+        batch_size=3,
+        batch_wait=0.01,
+    )
+
+    run_transcribe_loop(listener, [make_segment(float(n)) for n in range(5)])
+
+    assert done.wait(timeout=1.0)
+    assert transcriber.batches == [3, 2]
+    assert sorted(transcripts) == [(f"text {n}", float(n)) for n in range(5)]
+
+
+def test_listener_batch_falls_back_to_single_calls():
+    """Test transcribers without batch support get one call per segment."""
+    import threading
+
+    transcripts = []
+    done = threading.Event()
+
+    def on_transcript(text, segment):
+        transcripts.append(text)
+        if len(transcripts) == 3:
+            done.set()
+
+    listener = Listener(
+        source=MockAudioSource(),
+        transcriber=MockTranscriber(),
+        on_transcript=on_transcript,
+        batch_size=3,
+    )
+
+    run_transcribe_loop(listener, [make_segment(float(n)) for n in range(3)])
+
+    assert done.wait(timeout=1.0)
+    assert len(transcripts) == 3
+
+
+def test_listener_transcribe_worker_pool():
+    """Test several transcription workers share the segment queue."""
+    import threading
+    import time
+
+    class SlowTranscriber(Transcriber):
+        def __init__(self):
+            self.threads = set()
+
+        def transcribe(self, segment: SpeechSegment) -> str:
+            self.threads.add(threading.current_thread().name)
+            time.sleep(0.05)
+            return "text"
+
+    transcripts = []
+    transcriber = SlowTranscriber()
+    listener = Listener(
+        source=MockAudioSource(),
+        transcriber=transcriber,
+        on_transcript=lambda text, seg: transcripts.append(text),
+        scheduling="sjf",
+        transcribe_workers=3,
+    )
+
+    listener.start()
+    for n in range(6):
+        listener._segment_queue.put(make_segment(float(n)))
+    time.sleep(0.3)
+    listener.stop()
+
+    assert len(transcripts) == 6
+    assert len(transcriber.threads) > 1
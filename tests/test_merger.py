@@ -0,0 +1,159 @@
+from hearken.merger import SegmentMerger
+from hearken.types import MergeConfig, SpeechSegment
+import pytest
+
+
+def make_segment(start: float, end: float, fill: bytes = b"\x01") -> SpeechSegment:
+    """Create a segment whose audio length matches its duration at 16kHz."""
+    num_bytes = int(round((end - start) * 16000)) * 2
+    return SpeechSegment(
+        audio_data=fill * num_bytes,
+        sample_rate=16000,
+        sample_width=2,
+        start_time=start,
+        end_time=end,
+    )
+
+
+def test_merger_merges_close_segments():
+    """Test segments within max_gap are coalesced with part boundaries."""
+    merged = []
+    merger = SegmentMerger(MergeConfig(max_gap=0.5), on_segment=merged.append)
+
+    a = make_segment(0.0, 0.5, b"\x01")
+    b = make_segment(0.8, 1.2, b"\x02")
+    merger.add(a)
+    merger.add(b)
+    assert merged == []
+
+    merger.flush()
+
+    assert len(merged) == 1
+    segment = merged[0]
+    assert segment.audio_data == a.audio_data + b.audio_data
+    assert segment.start_time == 0.0
+    assert segment.end_time == 1.2
+    assert segment.parts == [(0.0, 0.0, 0.5), (pytest.approx(0.5), 0.8, 1.2)]
+
+
+def test_merger_passes_through_distant_segments():
+    """Test segments further apart than max_gap are emitted separately."""
+    merged = []
+    merger = SegmentMerger(MergeConfig(max_gap=0.3), on_segment=merged.append)
+
+    a = make_segment(0.0, 0.5)
+    merger.add(a)
+    merger.add(make_segment(1.0, 1.5))
+
+    assert merged == [a]
+    assert merged[0].parts is None
+
+
+def test_merger_respects_duration_cap():
+    """Test merging stops at max_duration."""
+    merged = []
+    merger = SegmentMerger(MergeConfig(max_gap=0.5, max_duration=1.0), on_segment=merged.append)
+
+    merger.add(make_segment(0.0, 0.6))
+    merger.add(make_segment(0.7, 1.3))  # Would make 1.3s
+
+    assert len(merged) == 1
+    assert merged[0].end_time == 0.6
+
+
+def test_merger_respects_byte_cap():
+    """Test merging stops at max_bytes, flushing as soon as the cap is reached."""
+    merged = []
+    merger = SegmentMerger(MergeConfig(max_gap=0.5, max_bytes=16000), on_segment=merged.append)
+
+    merger.add(make_segment(0.0, 0.25))  # 8000 bytes
+    merger.add(make_segment(0.3, 0.55))  # 16000 total, cap reached
+
+    assert len(merged) == 1
+    assert len(merged[0].audio_data) == 16000
+
+
+def test_merger_poll_flushes_after_gap_when_idle():
+    """Test poll releases the held segment once a neighbour can no longer arrive."""
+    merged = []
+    merger = SegmentMerger(MergeConfig(max_gap=0.3, max_hold=5.0), on_segment=merged.append)
+
+    merger.add(make_segment(0.0, 0.5))
+
+    merger.poll(0.7, idle=True)
+    assert merged == []
+
+    # Speech in progress: keep holding even past the gap
+    merger.poll(0.9, idle=False)
+    assert merged == []
+
+    merger.poll(0.9, idle=True)
+    assert len(merged) == 1
+
+
+def test_merger_poll_flushes_after_max_hold():
+    """Test poll releases the held segment after max_hold regardless of state."""
+    merged = []
+    merger = SegmentMerger(MergeConfig(max_gap=0.3, max_hold=1.0), on_segment=merged.append)
+
+    merger.add(make_segment(0.0, 0.5))
+    merger.poll(1.4, idle=False)
+    assert merged == []
+
+    merger.poll(1.5, idle=False)
+    assert len(merged) == 1
+
+
+def test_merger_combines_time_maps():
+    """Test compacted parts keep their time maps, shifted into the merged audio."""
+    merged = []
+    merger = SegmentMerger(MergeConfig(max_gap=0.5), on_segment=merged.append)
+
+    a = make_segment(0.0, 0.5)
+    a.time_map = [(0.0, 0.0)]
+    b = make_segment(0.8, 1.2)
+    b.time_map = [(0.0, 0.7), (0.2, 1.0)]
+    merger.add(a)
+    merger.add(b)
+    merger.flush()
+
+    assert merged[0].time_map == [
+        (0.0, 0.0),
+        (pytest.approx(0.5), 0.7),
+        (pytest.approx(0.7), 1.0),
+    ]
+
+
+def test_merger_maps_uncompacted_parts():
+    """Test parts without a time map still map into the merged audio."""
+    merged = []
+    merger = SegmentMerger(MergeConfig(max_gap=0.5), on_segment=merged.append)
+
+    a = make_segment(0.0, 0.5)
+    b = make_segment(0.8, 1.2)
+    b.time_map = [(0.0, 0.7), (0.2, 1.0)]
+    c = make_segment(1.4, 1.6)
+    for segment in (a, b, c):
+        merger.add(segment)
+    merger.flush()
+
+    assert merged[0].time_map == [
+        (0.0, 0.0),
+        (pytest.approx(0.5), 0.7),
+        (pytest.approx(0.7), 1.0),
+        (pytest.approx(0.9), 1.4),
+    ]
+
+
+def test_merger_callback_errors_are_contained():
+    """Test a failing callback doesn't break the merger."""
+
+    def boom(segment):
+        raise RuntimeError("callback failed")
+
+    merger = SegmentMerger(MergeConfig(), on_segment=boom)
+    merger.add(make_segment(0.0, 0.5))
+    merger.flush()  # Should not raise
+
+    merger.add(make_segment(2.0, 2.5))
+    merger.flush()
@@ -0,0 +1,192 @@
+import time
+import wave
+
+import numpy as np
+import pytest
+
+from hearken import Listener
+from hearken.recording import CaptureRecorder, read_recording, recording_format
+from hearken.sources.callback import CallbackAudioSource
+from hearken.sources.file import FileAudioSource
+from hearken.sources.replay import ReplayAudioSource
+from hearken.types import AudioChunk, DetectorConfig
+
+
+def make_chunk(value: int, timestamp: float) -> AudioChunk:
+    return AudioChunk(
+        data=np.full(320, value, dtype=np.int16).tobytes(),
+        timestamp=timestamp,
+        sample_rate=16000,
+        sample_width=2,
+    )
+
+
+def record(path, chunks, dropped=()) -> None:
+    recorder = CaptureRecorder(str(path))
+    recorder.open(16000, 2)
+    for i, chunk in enumerate(chunks):
+        recorder.record_frame(chunk)
+        if i in dropped:
+            recorder.record_drop(chunk)
+    recorder.close()
+
+
+def test_recording_round_trip(tmp_path):
+    """Test frames, timestamps and drops survive a round trip."""
+    path = tmp_path / "capture.hkrc"
+    chunks = [make_chunk(i, 10.0 + i * 0.02) for i in range(5)]
+    record(path, chunks, dropped={1, 4})
+
+    assert recording_format(str(path)) == (16000, 2)
+    frames = list(read_recording(str(path)))
+    assert [f.data for f in frames] == [c.data for c in chunks]
+    assert [f.timestamp for f in frames] == [c.timestamp for c in chunks]
+    assert [f.dropped for f in frames] == [False, True, False, False, True]
+
+
+def test_recording_appends(tmp_path):
+    """Test reopening appends, and a different format is rejected."""
+    path = tmp_path / "capture.hkrc"
+    record(path, [make_chunk(1, 0.0)])
+    record(path, [make_chunk(2, 1.0)])
+
+    assert [f.timestamp for f in read_recording(str(path))] == [0.0, 1.0]
+
+    with pytest.raises(ValueError, match="different audio format"):
+        CaptureRecorder(str(path)).open(8000, 2)
+
+
+def test_recording_ignores_truncated_tail(tmp_path):
+    """Test a record cut short by a crash ends the recording."""
+    path = tmp_path / "capture.hkrc"
+    record(path, [make_chunk(i, i * 0.02) for i in range(3)])
+    path.write_bytes(path.read_bytes()[:-100])
+
+    assert len(list(read_recording(str(path)))) == 2
+
+
+def test_recording_rejects_other_files(tmp_path):
+    """Test files without the recording header are rejected."""
+    path = tmp_path / "audio.raw"
+    path.write_bytes(b"\x00" * 64)
+
+    with pytest.raises(ValueError, match="Not a hearken"):
+        ReplayAudioSource(str(path))
+
+
+def test_replay_skips_dropped_frames(tmp_path):
+    """Test dropped frames are left out unless skip_dropped is off."""
+    path = tmp_path / "capture.hkrc"
+    chunks = [make_chunk(i, i * 0.02) for i in range(4)]
+    record(path, chunks, dropped={2})
+
+    def replay(skip_dropped):
+        source = ReplayAudioSource(str(path), speed=None, skip_dropped=skip_dropped)
+        source.open()
+        data = []
+        with pytest.raises(EOFError):
+            while True:
+                data.append(source.read(320))
+        source.close()
+        return data
+
+    assert replay(True) == [chunks[i].data for i in (0, 1, 3)]
+    assert replay(False) == [c.data for c in chunks]
+
+
+def test_replay_pacing(tmp_path):
+    """Test frames are released at their original offsets, scaled by speed."""
+    path = tmp_path / "capture.hkrc"
+    record(path, [make_chunk(0, 100.0), make_chunk(0, 100.1), make_chunk(0, 100.2)])
+
+    def elapsed(speed):
+        source = ReplayAudioSource(str(path), speed=speed)
+        source.open()
+        start = time.monotonic()
+        for _ in range(3):
+            source.read(320)
+        duration = time.monotonic() - start
+        source.close()
+        return duration
+
+    # Sleeps never end early, but may overrun on a loaded machine, so only
+    # lower bounds and the ordering are checked
+    paced, double, unpaced = elapsed(1.0), elapsed(2.0), elapsed(None)
+    assert paced >= 0.19
+    assert double >= 0.095
+    assert unpaced < double < paced
+
+
+def run_listener(source, recorder=None):
+    segments = []
+    listener = Listener(
+        source=source,
+        on_speech=segments.append,
+        detector_config=DetectorConfig(
+            min_speech_duration=0.09, silence_timeout=0.15, sample_clock=True
+        ),
+        recorder=recorder,
+        # Unthrottled reads outpace detection; capture must wait, not drop
+        capture_queue_size=2,
+    )
+    listener.start()
+    assert listener.wait_for_end(timeout=5.0)
+    listener.stop()
+    assert listener.chunks_dropped == 0
+    return segments
+
+
+def test_listener_replay_reproduces_segments(tmp_path):
+    """Test replaying a Listener's recording reproduces its segments."""
+    t = np.arange(16000 * 2) / 16000
+    amplitude = np.where((t % 1.0) < 0.4, 100, 5000)
+    samples = np.random.default_rng(0).uniform(-1, 1, t.size) * amplitude
+    wav_path = tmp_path / "speech.wav"
+    with wave.open(str(wav_path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(samples.astype(np.int16).tobytes())
+
+    path = tmp_path / "capture.hkrc"
+    live = run_listener(FileAudioSource(str(wav_path), speed=None), CaptureRecorder(str(path)))
+    source = ReplayAudioSource(str(path), speed=None)
+    replayed = run_listener(source)
+    assert source.frames_replayed == len(list(read_recording(str(path))))
+    replayed_again = run_listener(ReplayAudioSource(str(path), speed=None))
+
+    # Capture stamps are wall-clock, so compare timing relative to the first segment
+    def timeline(segments):
+        origin = segments[0].start_time
+        return [
+            (round(s.start_time - origin, 6), round(s.end_time - origin, 6), s.audio_data)
+            for s in segments
+        ]
+
+    # One segment per burst of noise, the last flushed at the end of input
+    assert len(live) == 2
+    assert timeline(replayed) == timeline(live)
+    assert timeline(replayed_again) == timeline(live)
+
+
+def test_listener_start_cleans_up_when_recorder_fails(tmp_path):
+    """Test a recorder that can't open leaves the source closed and unhooked."""
+    path = tmp_path / "other.hkn"
+    record(path, [make_chunk(1, 0.0)])
+
+    class Source(CallbackAudioSource):
+        closed = False
+
+        def close(self):
+            self.closed = True
+            super().close()
+
+    # The existing recording is 16kHz, so appending 8kHz audio fails
+    source = Source(sample_rate=8000)
+    listener = Listener(source=source, recorder=CaptureRecorder(str(path)))
+    with pytest.raises(ValueError, match="different audio format"):
+        listener.start()
+
+    assert source.closed
+    assert source._consumer is None
+    assert not listener._running
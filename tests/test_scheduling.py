@@ -0,0 +1,108 @@
+import pytest
+from unittest.mock import patch
+from hearken.scheduling import SegmentQueue
+from hearken.types import SpeechSegment
+
+
+def make_segment(duration: float, start: float = 0.0) -> SpeechSegment:
+    return SpeechSegment(
+        audio_data=b"\x00\x00" * int(duration * 16000),
+        sample_rate=16000,
+        sample_width=2,
+        start_time=start,
+        end_time=start + duration,
+    )
+
+
+def drain(q: SegmentQueue) -> list:
+    items = []
+    while not q.empty():
+        items.append(q.get_nowait())
+    return items
+
+
+def test_segment_queue_invalid_policy():
+    """Test SegmentQueue rejects unknown policy names."""
+    with pytest.raises(ValueError, match="Policy must be one of"):
+        SegmentQueue(policy="lifo")
+
+
+def test_segment_queue_fifo_default():
+    """Test default policy preserves arrival order."""
+    q = SegmentQueue()
+    segments = [make_segment(d) for d in (5.0, 1.0, 3.0)]
+    for s in segments:
+        q.put(s)
+
+    assert drain(q) == segments
+
+
+def test_segment_queue_shortest_first():
+    """Test sjf serves short segments before long ones."""
+    q = SegmentQueue(policy="sjf")
+    long, short, medium = make_segment(30.0), make_segment(0.5), make_segment(2.0)
+    for s in (long, short, medium):
+        q.put(s)
+
+    assert drain(q) == [short, medium, long]
+
+
+def test_segment_queue_sjf_ranks_by_audio_sent():
+    """Test sjf ranks compacted segments by their audio, not the span they cover."""
+    q = SegmentQueue(policy="sjf")
+    compacted = make_segment(1.0)
+    compacted.end_time = 10.0
+    medium = make_segment(2.0)
+    q.put(medium)
+    q.put(compacted)
+
+    assert drain(q) == [compacted, medium]
+
+
+def test_segment_queue_sjf_aging_prevents_starvation():
+    """Test a long segment that has waited long enough beats a fresh short one."""
+    q = SegmentQueue(policy="sjf", aging=1.0)
+    long, short = make_segment(10.0), make_segment(1.0)
+
+    with patch("hearken.scheduling.time.monotonic", return_value=0.0):
+        q.put(long)
+    with patch("hearken.scheduling.time.monotonic", return_value=5.0):
+        q.put(short)
+    assert drain(q) == [short, long]
+
+    with patch("hearken.scheduling.time.monotonic", return_value=0.0):
+        q.put(long)
+    with patch("hearken.scheduling.time.monotonic", return_value=12.0):
+        q.put(short)
+    assert drain(q) == [long, short]
+
+
+def test_segment_queue_priority_function():
+    """Test a caller-supplied priority function orders segments."""
+    q = SegmentQueue(policy=lambda s: -s.start_time)  # latest start first
+    a, b, c = make_segment(1.0, 0.0), make_segment(1.0, 2.0), make_segment(1.0, 1.0)
+    for s in (a, b, c):
+        q.put(s)
+
+    assert drain(q) == [b, c, a]
+
+
+def test_segment_queue_poison_pill_last():
+    """Test the poison pill is served after queued segments."""
+    q = SegmentQueue(policy="sjf")
+    segment = make_segment(30.0)
+    q.put(None)
+    q.put(segment)
+
+    assert drain(q) == [segment, None]
+
+
+def test_segment_queue_respects_maxsize():
+    """Test maxsize still applies with a scheduling policy."""
+    import queue
+
+    q = SegmentQueue(maxsize=1, policy="sjf")
+    q.put_nowait(make_segment(1.0))
+
+    with pytest.raises(queue.Full):
+        q.put_nowait(make_segment(0.5))
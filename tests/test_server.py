@@ -0,0 +1,242 @@
+import asyncio
+import json
+import struct
+import threading
+
+from hearken.benchmark import synthetic_speech
+from hearken.interfaces import Transcriber
+from hearken.server import IngestServer, VADPool, WebSocket
+from hearken.server.loadgen import run_load
+from hearken.types import DetectorConfig, SpeechSegment
+from hearken.vad.energy import EnergyVAD
+
+LENGTH = struct.Struct("!I")
+
+
+def make_server(**kwargs) -> IngestServer:
+    return IngestServer(
+        vad_factory=lambda: EnergyVAD(threshold=300.0, dynamic=False),
+        detector_config=DetectorConfig(min_speech_duration=0.09, silence_timeout=0.15),
+        workers=2,
+        **kwargs,
+    )
+
+
+async def tcp_session(port: int, audio: bytes, frame_bytes: int = 640) -> list[dict]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for offset in range(0, len(audio), frame_bytes):
+        frame = audio[offset : offset + frame_bytes]
+        writer.write(LENGTH.pack(len(frame)) + frame)
+    writer.write(LENGTH.pack(0))
+    await writer.drain()
+
+    messages = []
+    while True:
+        (length,) = LENGTH.unpack(await reader.readexactly(LENGTH.size))
+        messages.append(json.loads(await reader.readexactly(length)))
+        if messages[-1]["type"] == "end":
+            writer.close()
+            return messages
+
+
+def test_tcp_stream_returns_segments():
+    """Test a raw TCP stream gets one segment message per utterance."""
+
+    async def scenario():
+        server = make_server(include_audio=True)
+        listening = await server.start_tcp()
+        port = listening.sockets[0].getsockname()[1]
+        try:
+            return await tcp_session(port, synthetic_speech(3.0))
+        finally:
+            await server.close()
+
+    messages = asyncio.run(scenario())
+
+    segments = [m for m in messages if m["type"] == "segment"]
+    assert messages[-1] == {"type": "end"}
+    # Three 600ms bursts, the last flushed at end of stream
+    assert len(segments) == 3
+    assert all(0.5 < m["duration"] < 1.0 for m in segments)
+    assert segments[0]["start"] < segments[1]["start"] < segments[2]["start"]
+    assert "audio" in segments[0]
+
+
+def test_websocket_stream_returns_segments():
+    """Test WebSocket streams use binary audio and text replies."""
+
+    async def scenario():
+        server = make_server()
+        listening = await server.start_websocket()
+        port = listening.sockets[0].getsockname()[1]
+        try:
+            ws = await WebSocket.connect("127.0.0.1", port, "/stream")
+            audio = synthetic_speech(2.0)
+            for offset in range(0, len(audio), 3200):
+                await ws.send(audio[offset : offset + 3200])
+            await ws.send("end")
+
+            messages = []
+            while True:
+                message = json.loads(await ws.recv())
+                messages.append(message)
+                if message["type"] == "end":
+                    break
+            await ws.close()
+            return messages
+        finally:
+            await server.close()
+
+    messages = asyncio.run(scenario())
+
+    assert [m["type"] for m in messages] == ["segment", "segment", "end"]
+
+
+def test_stream_transcripts():
+    """Test a server with a transcriber replies with transcripts."""
+
+    class DurationTranscriber(Transcriber):
+        def transcribe(self, segment: SpeechSegment) -> str:
+            return f"{segment.duration:.1f}s"
+
+    async def scenario():
+        server = make_server(transcriber=DurationTranscriber())
+        listening = await server.start_tcp()
+        port = listening.sockets[0].getsockname()[1]
+        try:
+            return await tcp_session(port, synthetic_speech(2.0))
+        finally:
+            await server.close()
+
+    messages = asyncio.run(scenario())
+
+    transcripts = [m for m in messages if m["type"] == "transcript"]
+    assert len(transcripts) == 2
+    assert all(m["text"].endswith("s") for m in transcripts)
+    assert messages[-1]["type"] == "end"
+
+
+def test_vad_pool_recycles_between_streams():
+    """Test sequential streams reuse pooled VADs."""
+
+    async def scenario():
+        server = make_server()
+        listening = await server.start_tcp()
+        port = listening.sockets[0].getsockname()[1]
+        try:
+            for _ in range(3):
+                await tcp_session(port, synthetic_speech(0.5))
+            return server
+        finally:
+            await server.close()
+
+    server = asyncio.run(scenario())
+
+    assert server.total_streams == 3
+    assert server.active_streams == 0
+    assert server.vad_pool.created == 1
+
+
+def test_vad_pool_creates_per_concurrent_stream():
+    """Test the pool creates VADs only when none are idle."""
+    pool = VADPool(EnergyVAD)
+
+    first = pool.acquire()
+    second = pool.acquire()
+    pool.release(first)
+
+    assert second is not first
+    assert pool.acquire() is first
+    assert pool.created == 2
+
+
+def test_cancelled_stream_keeps_vad_until_detection_ends():
+    """Test a VAD still running on a detect thread isn't handed to the next stream."""
+    started, proceed = threading.Event(), threading.Event()
+
+    class BlockingVAD(EnergyVAD):
+        def process(self, chunk):
+            started.set()
+            proceed.wait(timeout=5.0)
+            return super().process(chunk)
+
+    class Writer:
+        def close(self):
+            pass
+
+    async def scenario():
+        server = IngestServer(vad_factory=BlockingVAD, workers=1)
+        sent = asyncio.Event()
+
+        async def receive():
+            if sent.is_set():
+                await asyncio.sleep(10)
+            sent.set()
+            return synthetic_speech(0.1)
+
+        async def send(message):
+            pass
+
+        task = asyncio.create_task(server._run_connection(Writer(), receive, send))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5.0)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        in_use = list(server.vad_pool._idle)
+
+        proceed.set()
+        for _ in range(100):
+            if server.vad_pool._idle:
+                break
+            await asyncio.sleep(0.01)
+        idle = list(server.vad_pool._idle)
+        await server.close()
+        return in_use, idle
+
+    in_use, idle = asyncio.run(scenario())
+
+    assert in_use == []
+    assert len(idle) == 1
+
+
+def test_websocket_rejects_plain_http():
+    """Test non-upgrade requests get a 400 response."""
+
+    async def scenario():
+        server = make_server()
+        listening = await server.start_websocket()
+        port = listening.sockets[0].getsockname()[1]
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n")
+            await writer.drain()
+            status = await reader.readline()
+            writer.close()
+            return status
+        finally:
+            await server.close()
+
+    assert b"400" in asyncio.run(scenario())
+
+
+def test_load_generator_concurrent_streams():
+    """Test many concurrent streams are all segmented."""
+
+    async def scenario(protocol):
+        server = make_server()
+        if protocol == "tcp":
+            listening = await server.start_tcp()
+        else:
+            listening = await server.start_websocket()
+        port = listening.sockets[0].getsockname()[1]
+        try:
+            return await run_load("127.0.0.1", port, streams=8, seconds=2.0, protocol=protocol)
+        finally:
+            await server.close()
+
+    for protocol in ("tcp", "websocket"):
+        result = asyncio.run(scenario(protocol))
+
+        assert result.segments == 8 * 2
+        assert result.audio_seconds == 16.0
+        assert result.streams_per_core > 0
+        assert result.to_dict()["protocol"] == protocol
@@ -0,0 +1,161 @@
+import threading
+
+import numpy as np
+import pytest
+
+from hearken import Listener
+from hearken.sources.callback import CallbackAudioSource, RingBuffer
+from hearken.types import DetectorConfig
+
+
+def test_ring_buffer_wraps_around():
+    """Test reads return bytes in order across the wrap point."""
+    ring = RingBuffer(8)
+
+    ring.write(b"abcdef")
+    assert ring.read(4) == b"abcd"
+    ring.write(b"ghijk")
+
+    assert len(ring) == 7
+    assert ring.read(10) == b"efghijk"
+    assert len(ring) == 0
+
+
+def test_ring_buffer_overwrites_oldest():
+    """Test writes past capacity drop the oldest bytes."""
+    ring = RingBuffer(4)
+
+    assert ring.write(b"abc") == 0
+    assert ring.write(b"def") == 2
+    assert ring.read(4) == b"cdef"
+
+    assert ring.write(b"0123456789") == 6
+    assert ring.read(4) == b"6789"
+
+
+def test_callback_source_frames_pushes():
+    """Test odd-sized pushes are re-framed into fixed-size chunks."""
+    source = CallbackAudioSource(sample_rate=16000)
+    chunks = []
+    source.set_consumer(chunks.append, frame_samples=480)
+    source.open()
+
+    data = np.arange(1600, dtype=np.int16).tobytes()
+    for start in range(0, len(data), 700):
+        source.push(data[start : start + 700])
+
+    assert len(chunks) == 3
+    assert all(len(c.data) == 960 for c in chunks)
+    assert b"".join(c.data for c in chunks) == data[: 3 * 960]
+
+
+def test_callback_source_dates_frames_by_backlog():
+    """Test frames delivered from one push are spaced by their duration."""
+    source = CallbackAudioSource(sample_rate=16000)
+    chunks = []
+    source.set_consumer(chunks.append, frame_samples=160)
+    source.open()
+
+    source.push(b"\x00" * 960)
+
+    assert len(chunks) == 3
+    assert chunks[1].timestamp - chunks[0].timestamp == pytest.approx(0.01)
+    assert chunks[2].timestamp - chunks[1].timestamp == pytest.approx(0.01)
+
+
+def test_callback_source_pull_mode():
+    """Test read() blocks until enough audio has been pushed."""
+    source = CallbackAudioSource(sample_rate=16000)
+    source.open()
+
+    timer = threading.Timer(0.05, source.push, args=(b"\x01\x00" * 320,))
+    timer.start()
+
+    assert source.read(320) == b"\x01\x00" * 320
+    source.close()
+
+
+def test_callback_source_ignores_push_when_closed():
+    """Test audio pushed before open or after close is discarded."""
+    source = CallbackAudioSource(sample_rate=16000)
+    chunks = []
+    source.set_consumer(chunks.append, frame_samples=160)
+
+    source.push(b"\x00" * 320)
+    assert chunks == []
+
+    source.open()
+    source.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        source.read(160)
+
+
+def test_callback_source_counts_overruns():
+    """Test overflowing the ring buffer is counted, not grown."""
+    source = CallbackAudioSource(sample_rate=1000, buffer_seconds=0.1)
+    source.open()
+
+    source.push(b"\x00" * 300)
+
+    assert source.dropped_bytes == 100
+
+
+class TimerSource(CallbackAudioSource):
+    """Fake device that pushes 10ms buffers from a timer thread."""
+
+    def __init__(self):
+        super().__init__(sample_rate=16000)
+        self._timer_stop = threading.Event()
+        self._timer = None
+        self.buffers = 0
+
+    def open(self) -> None:
+        super().open()
+        self._timer_stop.clear()
+        self._timer = threading.Thread(target=self._tick, daemon=True)
+        self._timer.start()
+
+    def close(self) -> None:
+        self._timer_stop.set()
+        if self._timer:
+            self._timer.join()
+        super().close()
+
+    def _tick(self) -> None:
+        while not self._timer_stop.wait(0.001):
+            # 240ms of speech, then 120ms of silence, in 10ms buffers
+            amplitude = 5000 if self.buffers % 36 < 24 else 100
+            samples = np.random.randint(-amplitude, amplitude, size=160, dtype=np.int16)
+            self.push(samples.tobytes())
+            self.buffers += 1
+
+
+def test_listener_consumes_callback_source_without_capture_thread():
+    """Test Listener takes chunks straight from a push-style source."""
+    source = TimerSource()
+    segments = []
+    detected = threading.Event()
+
+    def on_speech(segment):
+        segments.append(segment)
+        detected.set()
+
+    listener = Listener(
+        source=source,
+        on_speech=on_speech,
+        detector_config=DetectorConfig(
+            min_speech_duration=0.09,
+            silence_timeout=0.06,
+            sample_clock=True,
+        ),
+    )
+
+    listener.start()
+    thread_names = {t.name for t in threading.enumerate()}
+    assert detected.wait(timeout=5.0)
+    listener.stop()
+
+    assert "hearken-capture" not in thread_names
+    assert "hearken-detect" in thread_names
+    assert segments[0].duration > 0
+    assert listener._chunks_captured > 0
@@ -0,0 +1,192 @@
+import time
+import wave
+
+import numpy as np
+import pytest
+
+from hearken import Listener
+from hearken.sources.file import FileAudioSource
+from hearken.types import AudioChunk, DetectorConfig
+from hearken.vad.energy import EnergyVAD
+
+
+def write_wav(path, samples: np.ndarray, sample_rate: int = 16000, channels: int = 1) -> None:
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(samples.astype(np.int16).tobytes())
+
+
+@pytest.fixture
+def ramp():
+    return np.arange(1000, dtype=np.int16)
+
+
+def test_file_source_reads_wav(tmp_path, ramp):
+    """Test WAV headers are parsed and reads return the PCM data."""
+    path = tmp_path / "ramp.wav"
+    write_wav(path, ramp, sample_rate=8000)
+
+    source = FileAudioSource(str(path), speed=None)
+    assert source.sample_rate == 8000
+    assert source.sample_width == 2
+
+    source.open()
+    data = source.read(400)
+    source.close()
+
+    assert isinstance(data, bytes)
+    assert np.array_equal(np.frombuffer(data, dtype=np.int16), ramp[:400])
+
+
+def test_file_source_raw_requires_sample_rate(tmp_path, ramp):
+    """Test raw files need an explicit sample rate."""
+    path = tmp_path / "ramp.raw"
+    path.write_bytes(ramp.tobytes())
+
+    with pytest.raises(ValueError, match="sample_rate"):
+        FileAudioSource(str(path))
+
+    source = FileAudioSource(str(path), sample_rate=16000, speed=None)
+    source.open()
+    assert bytes(source.read(10)) == ramp[:10].tobytes()
+    source.close()
+
+
+def test_file_source_end_of_file(tmp_path, ramp):
+    """Test the final read is short and the next one raises EOFError."""
+    path = tmp_path / "ramp.wav"
+    write_wav(path, ramp)
+
+    source = FileAudioSource(str(path), speed=None)
+    source.open()
+    source.read(600)
+    assert len(source.read(600)) == 400 * 2
+    with pytest.raises(EOFError):
+        source.read(600)
+    source.close()
+
+
+def test_file_source_loops(tmp_path, ramp):
+    """Test looping wraps reads around the end of the file."""
+    path = tmp_path / "ramp.wav"
+    write_wav(path, ramp)
+
+    source = FileAudioSource(str(path), speed=None, loop=True, start=900 / 16000)
+    source.open()
+    data = np.frombuffer(source.read(300), dtype=np.int16)
+    source.close()
+
+    assert np.array_equal(data, np.concatenate([ramp[900:], ramp[:200]]))
+
+
+def test_file_source_pacing(tmp_path):
+    """Test speed paces reads against real time."""
+    path = tmp_path / "silence.wav"
+    write_wav(path, np.zeros(16000, dtype=np.int16))
+
+    def elapsed(speed):
+        source = FileAudioSource(str(path), speed=speed)
+        source.open()
+        start = time.monotonic()
+        for _ in range(10):
+            source.read(320)  # 20ms each, 200ms total
+        duration = time.monotonic() - start
+        source.close()
+        return duration
+
+    # Sleeps never end early, but may overrun on a loaded machine, so only
+    # lower bounds and the ordering are checked
+    paced, quadruple, unpaced = elapsed(1.0), elapsed(4.0), elapsed(None)
+    assert paced >= 0.19
+    assert quadruple >= 0.045
+    assert unpaced < quadruple < paced
+
+
+def test_file_source_feeds_webrtc_vad_across_frame_boundaries(tmp_path):
+    """Test reads that don't align with VAD frames can be buffered by the VAD."""
+    pytest.importorskip("webrtcvad")
+    from hearken.vad.webrtc import WebRTCVAD
+
+    samples = np.random.default_rng(0).uniform(-5000, 5000, 16000)
+    path = tmp_path / "speech.wav"
+    write_wav(path, samples)
+
+    source = FileAudioSource(str(path), speed=None)
+    vad = WebRTCVAD(frame_duration_ms=30)
+    source.open()
+    results = []
+    for _ in range(10):
+        # 50ms reads leave a partial 30ms frame pending after each chunk
+        chunk = AudioChunk(data=source.read(800), timestamp=0.0, sample_rate=16000, sample_width=2)
+        results.append(vad.process(chunk))
+    source.close()
+
+    assert len(results) == 10
+
+
+def test_file_source_rejects_stereo(tmp_path):
+    """Test multi-channel WAVs are rejected."""
+    path = tmp_path / "stereo.wav"
+    write_wav(path, np.zeros(200, dtype=np.int16), channels=2)
+
+    with pytest.raises(ValueError, match="mono"):
+        FileAudioSource(str(path))
+
+
+def test_listener_replays_file(tmp_path):
+    """Test a Listener segments a file and capture ends at end of file."""
+    t = np.arange(16000 * 2) / 16000
+    amplitude = np.where((t % 1.0) < 0.4, 100, 5000)
+    samples = np.random.default_rng(0).uniform(-1, 1, t.size) * amplitude
+    path = tmp_path / "speech.wav"
+    write_wav(path, samples)
+
+    segments = []
+    listener = Listener(
+        source=FileAudioSource(str(path), speed=None),
+        on_speech=segments.append,
+        vad=EnergyVAD(dynamic=False),
+        detector_config=DetectorConfig(
+            min_speech_duration=0.09, silence_timeout=0.15, sample_clock=True
+        ),
+        # Unthrottled reads outpace detection; capture must wait, not drop
+        capture_queue_size=2,
+    )
+    listener.start()
+    capture = next(t for t in listener._threads if t.name == "hearken-capture")
+    assert listener.wait_for_end(timeout=5.0)
+    capture.join(timeout=1.0)
+    listener.stop()
+
+    assert not capture.is_alive()
+    assert listener.chunks_dropped == 0
+    assert len(segments) == 2
+    assert segments[1].start_time - segments[0].start_time == pytest.approx(1.0, abs=0.03)
+    # The first burst carries its silence timeout, the second ends at end of file
+    assert segments[0].duration == pytest.approx(0.75, abs=0.03)
+    assert segments[1].duration == pytest.approx(0.6, abs=0.03)
+
+
+def test_listener_flushes_speech_at_end_of_file(tmp_path):
+    """Test speech running up to the end of the file still yields a segment."""
+    samples = np.random.default_rng(0).uniform(-5000, 5000, 16000)
+    path = tmp_path / "speech.wav"
+    write_wav(path, np.concatenate([np.zeros(3200), samples]))
+
+    segments = []
+    listener = Listener(
+        source=FileAudioSource(str(path), speed=None),
+        on_speech=segments.append,
+        detector_config=DetectorConfig(
+            min_speech_duration=0.09, silence_timeout=5.0, sample_clock=True
+        ),
+        capture_queue_size=2,
+    )
+    listener.start()
+    assert listener.wait_for_end(timeout=5.0)
+    listener.stop()
+
+    assert len(segments) == 1
+    assert segments[0].duration == pytest.approx(1.0, abs=0.1)
@@ -0,0 +1,118 @@
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from hearken.sources.pipe import PipeAudioSource
+
+# Decoder stand-in: writes 1000 ramp samples of s16le to stdout, then exits
+EMIT_RAMP = (
+    "import sys, numpy as np\n"
+    "ramp = np.arange(1000, dtype=np.int16)\n"
+    "sys.stdout.buffer.write(ramp.tobytes())\n"
+)
+
+
+def test_pipe_source_reassembles_short_reads():
+    """Test frames are complete even when the writer sends odd-sized pieces."""
+    read_fd, write_fd = os.pipe()
+    data = np.arange(2000, dtype=np.int16).tobytes()
+
+    def writer():
+        with os.fdopen(write_fd, "wb", buffering=0) as f:
+            for start in range(0, len(data), 333):
+                f.write(data[start : start + 333])
+                time.sleep(0.001)
+
+    source = PipeAudioSource(read_fd, buffer_size=1024)
+    source.open()
+    thread = threading.Thread(target=writer)
+    thread.start()
+
+    frames = []
+    with pytest.raises(EOFError):
+        while True:
+            frames.append(source.read(320))
+    thread.join()
+    source.close()
+    os.close(read_fd)
+
+    assert all(len(f) == 640 for f in frames[:-1])
+    assert b"".join(frames) == data
+
+
+def test_pipe_source_returns_tail_then_eof():
+    """Test the last partial frame is returned before EOFError."""
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b"\x01\x00" * 200)
+    os.close(write_fd)
+
+    source = PipeAudioSource(read_fd)
+    source.open()
+    assert len(source.read(160)) == 320
+    assert len(source.read(160)) == 80
+    with pytest.raises(EOFError):
+        source.read(160)
+    source.close()
+    os.close(read_fd)
+
+
+def test_pipe_source_spawns_decoder():
+    """Test a decoder command's stdout is read as PCM."""
+    source = PipeAudioSource(command=[sys.executable, "-c", EMIT_RAMP])
+    source.open()
+
+    data = source.read(1000)
+    with pytest.raises(EOFError):
+        source.read(10)
+    source.close()
+
+    assert np.array_equal(np.frombuffer(data, dtype=np.int16), np.arange(1000))
+
+
+def test_pipe_source_restarts_decoder():
+    """Test the decoder is restarted when it exits, up to max_restarts."""
+    source = PipeAudioSource(
+        command=[sys.executable, "-c", EMIT_RAMP], restart=True, max_restarts=2, restart_delay=0
+    )
+    source.open()
+
+    data = source.read(3000)
+    with pytest.raises(EOFError):
+        source.read(10)
+    source.close()
+
+    assert source.restarts == 2
+    assert np.array_equal(np.frombuffer(data, dtype=np.int16), np.tile(np.arange(1000), 3))
+
+
+def test_pipe_source_reports_decoder_failure():
+    """Test a failing decoder raises with its stderr."""
+    command = [sys.executable, "-c", "import sys; sys.stderr.write('bad input\\n'); sys.exit(3)"]
+    source = PipeAudioSource(command=command)
+    source.open()
+
+    with pytest.raises(RuntimeError, match="code 3: bad input"):
+        source.read(160)
+    source.close()
+
+
+def test_pipe_source_close_stops_decoder():
+    """Test close() terminates a running decoder."""
+    command = [sys.executable, "-c", "import time; time.sleep(30)"]
+    source = PipeAudioSource(command=command)
+    source.open()
+    process = source._process
+
+    source.close()
+
+    assert process.poll() is not None
+
+
+def test_pipe_source_validation():
+    """Test pipe and command are mutually exclusive."""
+    with pytest.raises(ValueError, match="either pipe or command"):
+        PipeAudioSource(0, command=["cat"])
@@ -0,0 +1,189 @@
+import threading
+
+import pytest
+
+from hearken.interfaces import Transcriber, TranscriptionStream
+from hearken.streaming import StreamingUploader
+from hearken.transcribers.cache import CachingTranscriber
+from hearken.transcribers.resilient import ResilientTranscriber
+from hearken.types import AudioChunk, SpeechSegment
+
+
+class RecordingStream(TranscriptionStream):
+    def __init__(self, owner):
+        self.owner = owner
+        self.data = b""
+        self.aborted = False
+
+    def write(self, data: bytes) -> None:
+        if self.owner.fail_writes:
+            raise ConnectionResetError("connection dropped")
+        self.data += data
+
+    def finish(self, segment: SpeechSegment) -> str:
+        return f"streamed {len(self.data)} bytes"
+
+    def abort(self) -> None:
+        self.aborted = True
+
+
+class StreamingTranscriber(Transcriber):
+    def __init__(self):
+        self.streams = []
+        self.fail_writes = False
+
+    def transcribe(self, segment: SpeechSegment) -> str:
+        return f"one-shot {len(segment.audio_data)} bytes"
+
+    def open_stream(self, sample_rate: int, sample_width: int) -> TranscriptionStream:
+        stream = RecordingStream(self)
+        self.streams.append(stream)
+        return stream
+
+    @property
+    def supports_streaming(self) -> bool:
+        return True
+
+
+def make_chunk(index: int) -> AudioChunk:
+    return AudioChunk(
+        data=bytes([index]) * 960, timestamp=index * 0.03, sample_rate=16000, sample_width=2
+    )
+
+
+def make_segment(num_chunks: int) -> SpeechSegment:
+    return SpeechSegment(
+        audio_data=b"".join(make_chunk(i).data for i in range(num_chunks)),
+        sample_rate=16000,
+        sample_width=2,
+        start_time=0.0,
+        end_time=num_chunks * 0.03,
+    )
+
+
+def collect_transcripts(count: int):
+    transcripts = []
+    done = threading.Event()
+
+    def on_transcript(text, segment):
+        transcripts.append(text)
+        if len(transcripts) == count:
+            done.set()
+
+    return transcripts, done, on_transcript
+
+
+def test_uploader_streams_utterance():
+    """Test audio is written as it arrives and finished with the segment."""
+    transcriber = StreamingTranscriber()
+    transcripts, done, on_transcript = collect_transcripts(1)
+    uploader = StreamingUploader(transcriber, on_transcript)
+
+    uploader.write([make_chunk(0), make_chunk(1)])
+    uploader.write([make_chunk(2)])
+    assert uploader.active
+    assert uploader.finish(make_segment(3))
+    assert not uploader.active
+
+    assert done.wait(timeout=2.0)
+    assert transcripts == ["streamed 2880 bytes"]
+    assert len(transcriber.streams) == 1
+
+
+def test_uploader_opens_stream_per_utterance():
+    """Test each utterance gets its own stream."""
+    transcriber = StreamingTranscriber()
+    transcripts, done, on_transcript = collect_transcripts(2)
+    uploader = StreamingUploader(transcriber, on_transcript)
+
+    for _ in range(2):
+        uploader.write([make_chunk(0)])
+        uploader.finish(make_segment(1))
+
+    assert done.wait(timeout=2.0)
+    uploader.join(timeout=2.0)
+    assert len(transcriber.streams) == 2
+
+
+def test_uploader_finish_without_stream():
+    """Test finish reports when no utterance was being uploaded."""
+    uploader = StreamingUploader(StreamingTranscriber(), lambda text, segment: None)
+
+    assert not uploader.finish(make_segment(1))
+
+
+def test_uploader_abort():
+    """Test aborted utterances produce no transcript."""
+    transcriber = StreamingTranscriber()
+    transcripts = []
+    uploader = StreamingUploader(transcriber, lambda text, segment: transcripts.append(text))
+
+    uploader.write([make_chunk(0)])
+    uploader.abort()
+    uploader.join(timeout=2.0)
+
+    assert transcriber.streams[0].aborted
+    assert transcripts == []
+
+
+def test_uploader_falls_back_to_one_shot():
+    """Test a failed stream still transcribes the finished segment."""
+    transcriber = StreamingTranscriber()
+    transcriber.fail_writes = True
+    transcripts, done, on_transcript = collect_transcripts(1)
+    uploader = StreamingUploader(transcriber, on_transcript)
+
+    uploader.write([make_chunk(0)])
+    uploader.write([make_chunk(1)])
+    uploader.finish(make_segment(2))
+
+    assert done.wait(timeout=2.0)
+    assert transcripts == ["one-shot 1920 bytes"]
+    assert transcriber.streams[0].aborted
+
+
+def test_uploader_requires_streaming_transcriber():
+    """Test transcribers without streaming support are rejected."""
+
+    class PlainTranscriber(Transcriber):
+        def transcribe(self, segment):
+            return ""
+
+    with pytest.raises(ValueError, match="does not support streaming"):
+        StreamingUploader(PlainTranscriber(), lambda text, segment: None)
+
+
+def test_caching_transcriber_streams_and_caches():
+    """Test the cache streams through its backend and answers repeats itself."""
+    backend = StreamingTranscriber()
+    cache = CachingTranscriber(backend)
+    assert cache.supports_streaming
+
+    texts = []
+    for _ in range(2):
+        stream = cache.open_stream(16000, 2)
+        stream.write(make_segment(2).audio_data)
+        texts.append(stream.finish(make_segment(2)))
+
+    assert texts == ["streamed 1920 bytes"] * 2
+    assert [s.aborted for s in backend.streams] == [False, True]
+    assert cache.stats.hits == 1
+
+
+def test_resilient_transcriber_falls_back_when_stream_fails():
+    """Test a stream that fails to finish is retried as a one-shot call."""
+
+    class FailingStream(RecordingStream):
+        def finish(self, segment):
+            raise ConnectionResetError("connection dropped")
+
+    class Backend(StreamingTranscriber):
+        def open_stream(self, sample_rate, sample_width):
+            return FailingStream(self)
+
+    transcriber = ResilientTranscriber(Backend(), retries=0)
+    assert transcriber.supports_streaming
+
+    stream = transcriber.open_stream(16000, 2)
+    stream.write(b"\x00" * 960)
+    assert stream.finish(make_segment(1)) == "one-shot 960 bytes"
@@ -0,0 +1,270 @@
+import numpy as np
+import pytest
+from unittest.mock import patch
+from hearken.interfaces import Transcriber
+from hearken.transcribers.cache import CachingTranscriber
+from hearken.types import SpeechSegment
+
+
+class CountingTranscriber(Transcriber):
+    """Transcriber that numbers each backend call."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def transcribe(self, segment: SpeechSegment) -> str:
+        self.calls += 1
+        return f"text {self.calls}"
+
+
+def make_segment(samples: np.ndarray) -> SpeechSegment:
+    return SpeechSegment(
+        audio_data=samples.astype(np.int16).tobytes(),
+        sample_rate=16000,
+        sample_width=2,
+        start_time=0.0,
+        end_time=len(samples) / 16000,
+    )
+
+
+def prompt(gain: float = 1.0, seed: int = 0) -> SpeechSegment:
+    """A repeatable 'spoken prompt': bursts of tone with an energy envelope."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(16000) / 16000
+    envelope = np.repeat([0.1, 1.0, 0.6, 0.1, 0.9, 0.3, 0.1, 0.8], 2000)
+    samples = gain * 8000 * envelope * np.sin(2 * np.pi * 220 * t)
+    return make_segment(samples + rng.normal(0, 20, len(t)))
+
+
+def test_cache_invalid_max_entries():
+    """Test CachingTranscriber rejects empty cache."""
+    with pytest.raises(ValueError, match="max_entries must be at least 1"):
+        CachingTranscriber(CountingTranscriber(), max_entries=0)
+
+
+def test_cache_exact_hit():
+    """Test identical audio is served from cache."""
+    backend = CountingTranscriber()
+    cache = CachingTranscriber(backend)
+
+    assert cache.transcribe(prompt()) == "text 1"
+    assert cache.transcribe(prompt()) == "text 1"
+
+    assert backend.calls == 1
+    stats = cache.stats
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.hit_rate == 0.5
+
+
+def test_cache_different_audio_misses():
+    """Test different audio goes to the backend."""
+    backend = CountingTranscriber()
+    cache = CachingTranscriber(backend)
+
+    cache.transcribe(prompt(seed=0))
+    cache.transcribe(prompt(seed=1))
+
+    assert backend.calls == 2
+
+
+def test_cache_fuzzy_hit_on_near_duplicate():
+    """Test fuzzy matching catches the same prompt at a different gain and noise."""
+    backend = CountingTranscriber()
+    cache = CachingTranscriber(backend, fuzzy=True)
+
+    cache.transcribe(prompt(gain=1.0, seed=0))
+    assert cache.transcribe(prompt(gain=0.8, seed=1)) == "text 1"
+
+    assert backend.calls == 1
+    assert cache.stats.fuzzy_hits == 1
+
+
+def test_cache_fuzzy_hit_ignores_leading_silence():
+    """Test fuzzy matching aligns prompts preceded by different amounts of silence."""
+    backend = CountingTranscriber()
+    cache = CachingTranscriber(backend, fuzzy=True)
+    audio = np.frombuffer(prompt().audio_data, dtype=np.int16)
+
+    cache.transcribe(make_segment(np.concatenate([np.zeros(1000), audio])))
+    cache.transcribe(make_segment(np.concatenate([np.zeros(4370), audio, np.zeros(3000)])))
+
+    assert backend.calls == 1
+    assert cache.stats.fuzzy_hits == 1
+
+
+def stepped(levels: np.ndarray, gain: float = 1.0, seed: int = 0, shift: int = 0) -> SpeechSegment:
+    """A 1s tone whose level steps every 50ms (one fingerprint window)."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(16000) / 16000
+    samples = gain * 8000 * np.repeat(levels, 800) * np.sin(2 * np.pi * 220 * t)
+    samples = np.concatenate([np.zeros(shift), samples[: len(samples) - shift]])
+    return make_segment(samples + rng.normal(0, 20, len(t)))
+
+
+STEPS = np.array([1, 7, 3, 1, 6, 2, 1, 5, 4, 2, 7, 1, 3, 6, 2, 5, 1, 4, 3, 2]) / 7
+
+
+def test_cache_fuzzy_hit_on_shifted_copy():
+    """Test a copy shifted by one sample, at another gain and noise, still hits."""
+    for gain, seed in [(0.5, 1), (0.9, 2), (1.0, 3)]:
+        backend = CountingTranscriber()
+        cache = CachingTranscriber(backend, fuzzy=True)
+        levels = np.clip(STEPS + 0.5 / 7, 0.0, 1.0)
+
+        cache.transcribe(stepped(levels))
+        assert cache.transcribe(stepped(levels, gain, seed, shift=1)) == "text 1"
+        assert cache.stats.fuzzy_hits == 1
+
+
+def test_cache_fuzzy_miss_on_similar_envelope():
+    """Test another utterance of the same length and a similar shape misses."""
+    backend = CountingTranscriber()
+    cache = CachingTranscriber(backend, fuzzy=True)
+
+    # Every window differs by about 0.11 of the peak
+    cache.transcribe(stepped(np.clip(STEPS - 0.4 / 7, 0.08, 1.0)))
+    assert cache.transcribe(stepped(np.clip(STEPS + 0.4 / 7, 0.08, 1.0))) == "text 2"
+
+    assert backend.calls == 2
+    assert cache.stats.fuzzy_hits == 0
+
+
+def test_cache_never_fuzzy_matches_short_segments():
+    """Test segments too short for a meaningful envelope only match exactly."""
+    backend = CountingTranscriber()
+    cache = CachingTranscriber(backend, fuzzy=True)
+    t = np.arange(1600) / 16000
+
+    cache.transcribe(make_segment(8000 * np.sin(2 * np.pi * 220 * t)))
+    cache.transcribe(make_segment(3000 * np.sin(2 * np.pi * 440 * t)))
+    cache.transcribe(make_segment(np.zeros(400)))
+
+    assert backend.calls == 3
+    assert cache.stats.fuzzy_hits == 0
+
+
+def test_cache_no_fuzzy_by_default():
+    """Test near-duplicates miss without fuzzy matching."""
+    backend = CountingTranscriber()
+    cache = CachingTranscriber(backend)
+
+    cache.transcribe(prompt(gain=1.0, seed=0))
+    cache.transcribe(prompt(gain=0.8, seed=1))
+
+    assert backend.calls == 2
+
+
+def test_cache_lru_eviction():
+    """Test least recently used entry is evicted at max_entries."""
+    backend = CountingTranscriber()
+    cache = CachingTranscriber(backend, max_entries=2)
+
+    a, b, c = prompt(seed=0), prompt(seed=1), prompt(seed=2)
+    cache.transcribe(a)
+    cache.transcribe(b)
+    cache.transcribe(a)  # a is now most recent
+    cache.transcribe(c)  # evicts b
+
+    assert cache.stats.evictions == 1
+    cache.transcribe(a)
+    assert backend.calls == 3
+    cache.transcribe(b)
+    assert backend.calls == 4
+
+
+def test_cache_byte_budget():
+    """Test entries are evicted to stay within max_bytes."""
+    backend = CountingTranscriber()
+    cache = CachingTranscriber(backend, max_bytes=50)
+
+    cache.transcribe(prompt(seed=0))  # 16-byte key + 6-byte text
+    cache.transcribe(prompt(seed=1))
+    cache.transcribe(prompt(seed=2))
+
+    stats = cache.stats
+    assert stats.bytes <= 50
+    assert stats.entries == 2
+    assert stats.evictions == 1
+
+
+def test_cache_ttl_expiry():
+    """Test entries expire after ttl seconds."""
+    backend = CountingTranscriber()
+    cache = CachingTranscriber(backend, ttl=10.0)
+
+    with patch("hearken.transcribers.cache.time.monotonic", return_value=100.0):
+        cache.transcribe(prompt())
+    with patch("hearken.transcribers.cache.time.monotonic", return_value=105.0):
+        cache.transcribe(prompt())
+    assert backend.calls == 1
+
+    with patch("hearken.transcribers.cache.time.monotonic", return_value=111.0):
+        cache.transcribe(prompt())
+    assert backend.calls == 2
+
+
+def test_cache_does_not_cache_errors():
+    """Test backend errors propagate and aren't cached."""
+
+    class FlakyTranscriber(Transcriber):
+        def __init__(self):
+            self.calls = 0
+
+        def transcribe(self, segment):
+            self.calls += 1
+            if self.calls == 1:
+                raise RuntimeError("backend down")
+            return "ok"
+
+    backend = FlakyTranscriber()
+    cache = CachingTranscriber(backend)
+
+    with pytest.raises(RuntimeError, match="backend down"):
+        cache.transcribe(prompt())
+    assert cache.transcribe(prompt()) == "ok"
+    assert cache.transcribe(prompt()) == "ok"
+    assert backend.calls == 2
+
+
+def test_cache_clear():
+    """Test clear drops all entries."""
+    backend = CountingTranscriber()
+    cache = CachingTranscriber(backend, fuzzy=True)
+
+    cache.transcribe(prompt())
+    cache.clear()
+    cache.transcribe(prompt())
+
+    assert backend.calls == 2
+    assert cache.stats.entries == 1
+
+
+def test_cache_batches_only_misses():
+    """Test cached segments are answered directly and the rest go out as one batch."""
+
+    class BatchTranscriber(CountingTranscriber):
+        def __init__(self):
+            super().__init__()
+            self.batches = []
+
+        def transcribe_batch(self, segments):
+            self.batches.append(len(segments))
+            return [self.transcribe(s) for s in segments]
+
+        @property
+        def supports_batch(self):
+            return True
+
+    backend = BatchTranscriber()
+    cache = CachingTranscriber(backend)
+    assert cache.supports_batch
+    assert not CachingTranscriber(CountingTranscriber()).supports_batch
+
+    cached = cache.transcribe(prompt(seed=0))
+    texts = cache.transcribe_batch([prompt(seed=1), prompt(seed=0), prompt(seed=2)])
+
+    assert texts == ["text 2", cached, "text 3"]
+    assert backend.batches == [2]
+    assert cache.transcribe_batch([prompt(seed=1), prompt(seed=2)]) == ["text 2", "text 3"]
+    assert backend.batches == [2]
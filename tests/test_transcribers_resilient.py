@@ -0,0 +1,158 @@
+import threading
+import time
+import pytest
+from hearken.interfaces import Transcriber
+from hearken.transcribers.resilient import ResilientTranscriber
+from hearken.types import SpeechSegment
+
+SEGMENT = SpeechSegment(
+    audio_data=b"\x00" * 3200, sample_rate=16000, sample_width=2, start_time=0.0, end_time=0.1
+)
+
+
+class FakeBackend(Transcriber):
+    """Local fake backend scripted with per-call delays and failures."""
+
+    def __init__(self, script):
+        # Each entry: (delay_seconds, exception or None)
+        self.script = list(script)
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def transcribe(self, segment: SpeechSegment) -> str:
+        with self.lock:
+            index = self.calls
+            self.calls += 1
+        delay, error = self.script[min(index, len(self.script) - 1)]
+        time.sleep(delay)
+        if error is not None:
+            raise error
+        return f"call {index}"
+
+
+def test_resilient_invalid_arguments():
+    """Test ResilientTranscriber validates retries and timeout."""
+    with pytest.raises(ValueError, match="Retries must be non-negative"):
+        ResilientTranscriber(FakeBackend([(0, None)]), retries=-1)
+    with pytest.raises(ValueError, match="Timeout must be positive"):
+        ResilientTranscriber(FakeBackend([(0, None)]), timeout=0)
+
+
+def test_resilient_passes_through_success():
+    """Test a healthy backend is called once."""
+    backend = FakeBackend([(0, None)])
+    transcriber = ResilientTranscriber(backend)
+
+    assert transcriber.transcribe(SEGMENT) == "call 0"
+    assert backend.calls == 1
+    transcriber.close()
+
+
+def test_resilient_retries_transient_failures():
+    """Test transient errors are retried with backoff."""
+    backend = FakeBackend([(0, ConnectionError("reset")), (0, ConnectionError("reset")), (0, None)])
+    transcriber = ResilientTranscriber(backend, retries=2, backoff=0.01)
+
+    assert transcriber.transcribe(SEGMENT) == "call 2"
+    assert backend.calls == 3
+    transcriber.close()
+
+
+def test_resilient_gives_up_after_retries():
+    """Test the last error propagates once retries are exhausted."""
+    backend = FakeBackend([(0, ConnectionError("down"))])
+    transcriber = ResilientTranscriber(backend, retries=1, backoff=0.01)
+
+    with pytest.raises(ConnectionError, match="down"):
+        transcriber.transcribe(SEGMENT)
+    assert backend.calls == 2
+    transcriber.close()
+
+
+def test_resilient_does_not_retry_other_errors():
+    """Test errors outside retry_on propagate immediately."""
+    backend = FakeBackend([(0, ValueError("no speech"))])
+    transcriber = ResilientTranscriber(backend, retries=3, retry_on=(ConnectionError,))
+
+    with pytest.raises(ValueError, match="no speech"):
+        transcriber.transcribe(SEGMENT)
+    assert backend.calls == 1
+    transcriber.close()
+
+
+def test_resilient_deadline_unblocks_hung_call():
+    """Test a hung backend call times out instead of blocking."""
+    backend = FakeBackend([(1.0, None)])
+    transcriber = ResilientTranscriber(backend, timeout=0.05, retries=0)
+
+    start = time.monotonic()
+    with pytest.raises(TimeoutError, match="deadline"):
+        transcriber.transcribe(SEGMENT)
+    assert time.monotonic() - start < 0.5
+    transcriber.close()
+
+
+def test_resilient_retries_after_timeout():
+    """Test a timed-out attempt is retried."""
+    backend = FakeBackend([(1.0, None), (0, None)])
+    transcriber = ResilientTranscriber(backend, timeout=0.05, retries=1, backoff=0.01)
+
+    assert transcriber.transcribe(SEGMENT) == "call 1"
+    transcriber.close()
+
+
+def test_resilient_hedge_takes_first_answer():
+    """Test a slow primary is hedged and the faster answer wins."""
+    backend = FakeBackend([(1.0, None), (0.0, None)])
+    transcriber = ResilientTranscriber(
+        backend, timeout=2.0, retries=0, hedge=True, hedge_delay=0.05
+    )
+
+    start = time.monotonic()
+    assert transcriber.transcribe(SEGMENT) == "call 1"
+    assert time.monotonic() - start < 0.5
+    assert backend.calls == 2
+    transcriber.close()
+
+
+def test_resilient_no_hedge_when_fast():
+    """Test fast answers don't trigger a hedge request."""
+    backend = FakeBackend([(0.0, None)])
+    transcriber = ResilientTranscriber(backend, hedge=True, hedge_delay=0.5)
+
+    for _ in range(3):
+        transcriber.transcribe(SEGMENT)
+    assert backend.calls == 3
+    transcriber.close()
+
+
+def test_resilient_hedge_delay_tracks_latency_quantile():
+    """Test the hedge delay follows the recorded latency quantile."""
+    backend = FakeBackend([(0.01, None)])
+    transcriber = ResilientTranscriber(backend, hedge=True, hedge_delay=5.0, hedge_min_samples=5)
+
+    assert transcriber.current_hedge_delay() == 5.0
+    for _ in range(5):
+        transcriber.transcribe(SEGMENT)
+
+    assert 0.005 < transcriber.current_hedge_delay() < 0.5
+    transcriber.close()
+
+
+def test_resilient_retries_batches():
+    """Test batches are delegated with retries when the backend supports them."""
+
+    class BatchBackend(FakeBackend):
+        def transcribe_batch(self, segments):
+            return [self.transcribe(s) for s in segments]
+
+        @property
+        def supports_batch(self):
+            return True
+
+    backend = BatchBackend([(0, ConnectionError("reset")), (0, None)])
+    transcriber = ResilientTranscriber(backend, retries=1, backoff=0.0)
+
+    assert transcriber.supports_batch
+    assert transcriber.transcribe_batch([SEGMENT, SEGMENT]) == ["call 1", "call 2"]
+    assert not ResilientTranscriber(FakeBackend([(0, None)])).supports_batch
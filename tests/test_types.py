@@ -73,6 +73,12 @@ def test_detector_config_defaults():
     assert config.silence_timeout == 0.8
     assert config.speech_padding == 0.3
     assert config.frame_duration_ms == 30
+    assert config.split_lookback == 0.0
+    assert config.split_overlap == 0.0
+    assert config.trailing_silence_margin is None
+    assert config.max_internal_pause is None
+    assert config.idle_vad_interval == 1
+    assert config.idle_energy_floor is None
 
 
 def test_detector_config_custom_values():
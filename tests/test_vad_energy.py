@@ -88,3 +88,119 @@ def test_energy_vad_dynamic_calibration():
     chunk = create_speech_chunk()
     result = vad.process(chunk)
     assert result.is_speech is True
+
+
+def create_noise_chunk(
+    amplitude: int, sample_rate: int = 16000, duration_ms: int = 30
+) -> AudioChunk:
+    """Create a chunk of uniform noise at a given amplitude."""
+    num_samples = int(sample_rate * duration_ms / 1000)
+    samples = np.random.randint(-amplitude, amplitude, size=num_samples, dtype=np.int16)
+
+    return AudioChunk(
+        data=samples.tobytes(),
+        timestamp=time.monotonic(),
+        sample_rate=sample_rate,
+        sample_width=2,
+    )
+
+
+def test_energy_vad_threshold_frozen_without_tracking():
+    """Test threshold stays fixed after calibration by default."""
+    vad = EnergyVAD(threshold=100.0, dynamic=True, calibration_samples=10)
+
+    for _ in range(10):
+        vad.process(create_noise_chunk(100))
+    calibrated = vad._effective_threshold
+
+    for _ in range(50):
+        vad.process(create_noise_chunk(400))
+
+    assert vad._effective_threshold == calibrated
+
+
+def test_energy_vad_calibrate_from_known_noise():
+    """Test calibrating on known noise ends calibration, so speech after it is detected."""
+    vad = EnergyVAD(threshold=100.0, dynamic=True, calibration_samples=10)
+
+    vad.calibrate([create_noise_chunk(100) for _ in range(5)])
+    calibrated = vad._effective_threshold
+
+    # Mid-utterance: without the seed these frames would calibrate the threshold
+    for _ in range(20):
+        assert vad.process(create_noise_chunk(3000)).is_speech is True
+    assert vad._effective_threshold == calibrated
+
+    vad.calibrate([])
+    assert vad._effective_threshold == calibrated
+
+
+def test_energy_vad_tracks_rising_noise_floor():
+    """Test noise floor tracking follows ambient noise drift."""
+    vad = EnergyVAD(
+        threshold=100.0,
+        dynamic=True,
+        calibration_samples=10,
+        track_noise_floor=True,
+        noise_window=20,
+    )
+
+    for _ in range(10):
+        vad.process(create_noise_chunk(100))
+
+    # Ambient noise drifts up, slowly enough to stay classified as non-speech
+    for amplitude in range(100, 1000, 20):
+        for _ in range(5):
+            vad.process(create_noise_chunk(amplitude))
+
+    assert vad.process(create_noise_chunk(1000)).is_speech is False
+    # Speech well above the new floor is still detected
+    assert vad.process(create_noise_chunk(8000)).is_speech is True
+
+
+def test_energy_vad_tracking_ignores_speech_frames():
+    """Test speech frames don't raise the tracked noise floor."""
+    vad = EnergyVAD(
+        threshold=100.0,
+        dynamic=False,
+        track_noise_floor=True,
+        noise_window=20,
+    )
+
+    for _ in range(20):
+        vad.process(create_noise_chunk(100))
+    threshold = vad._effective_threshold
+
+    for _ in range(10):
+        assert vad.process(create_speech_chunk()).is_speech is True
+
+    assert vad._effective_threshold == threshold
+
+
+def test_energy_vad_tracking_recovers_from_noise_step():
+    """Test a sustained step in noise doesn't lock the VAD into speech."""
+    vad = EnergyVAD(
+        threshold=100.0,
+        dynamic=False,
+        track_noise_floor=True,
+        noise_window=20,
+    )
+
+    for _ in range(20):
+        vad.process(create_noise_chunk(100))
+
+    # Sudden loud, steady noise is first seen as speech...
+    results = [vad.process(create_noise_chunk(2000)).is_speech for _ in range(60)]
+    assert results[0] is True
+    # ...but the floor catches up after a window of it
+    assert results[-1] is False
+
+
+def test_energy_vad_noise_window_is_bounded():
+    """Test tracking state stays bounded on long streams."""
+    vad = EnergyVAD(dynamic=False, track_noise_floor=True, noise_window=10)
+
+    for _ in range(500):
+        vad.process(create_silence_chunk())
+
+    assert len(vad._noise_minima) <= 10
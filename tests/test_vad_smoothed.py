@@ -0,0 +1,114 @@
+"""Tests for smoothing/hysteresis VAD wrapper."""
+
+import pytest
+from hearken.interfaces import VAD
+from hearken.types import AudioChunk, VADResult
+from hearken.vad.smoothed import SmoothedVAD
+
+
+class ScriptedVAD(VAD):
+    """VAD that replays a fixed sequence of confidences."""
+
+    def __init__(self, confidences, threshold: float = 0.5):
+        self.confidences = list(confidences)
+        self.threshold = threshold
+        self.index = 0
+        self.resets = 0
+
+    def process(self, chunk: AudioChunk) -> VADResult:
+        confidence = self.confidences[self.index]
+        self.index += 1
+        return VADResult(is_speech=confidence >= self.threshold, confidence=confidence)
+
+    def reset(self) -> None:
+        self.resets += 1
+
+    @property
+    def required_frame_duration_ms(self):
+        return 32
+
+
+CHUNK = AudioChunk(data=b"\x00" * 960, timestamp=0.0, sample_rate=16000, sample_width=2)
+
+
+def run(vad: SmoothedVAD, frames: int) -> list[bool]:
+    return [vad.process(CHUNK).is_speech for _ in range(frames)]
+
+
+def test_smoothed_vad_invalid_thresholds():
+    """Test SmoothedVAD rejects offset above onset."""
+    with pytest.raises(ValueError, match="Thresholds must satisfy"):
+        SmoothedVAD(ScriptedVAD([]), onset_threshold=0.3, offset_threshold=0.6)
+
+
+def test_smoothed_vad_invalid_smoothing():
+    """Test SmoothedVAD rejects unknown smoothing mode."""
+    with pytest.raises(ValueError, match="Smoothing must be one of"):
+        SmoothedVAD(ScriptedVAD([]), smoothing="median")
+
+
+def test_smoothed_vad_invalid_window():
+    """Test SmoothedVAD rejects empty vote window."""
+    with pytest.raises(ValueError, match="Window must be at least 1"):
+        SmoothedVAD(ScriptedVAD([]), smoothing="vote", window=0)
+
+
+def test_smoothed_vad_hysteresis_holds_borderline_frames():
+    """Test borderline confidence keeps speech on between onset and offset."""
+    inner = ScriptedVAD([0.9, 0.9, 0.45, 0.5, 0.45, 0.5, 0.1, 0.1])
+    vad = SmoothedVAD(inner, onset_threshold=0.6, offset_threshold=0.4, alpha=1.0)
+
+    # Without smoothing (alpha=1), only hysteresis applies
+    assert run(vad, 8) == [True, True, True, True, True, True, False, False]
+
+
+def test_smoothed_vad_hysteresis_requires_onset():
+    """Test borderline confidence doesn't start speech below onset."""
+    inner = ScriptedVAD([0.5, 0.55, 0.5, 0.7])
+    vad = SmoothedVAD(inner, onset_threshold=0.6, offset_threshold=0.4, alpha=1.0)
+
+    assert run(vad, 4) == [False, False, False, True]
+
+
+def test_smoothed_vad_ema_bridges_dropouts():
+    """Test EMA smoothing rides over single-frame dropouts."""
+    inner = ScriptedVAD([1.0, 1.0, 1.0, 0.0, 1.0, 0.0, 1.0, 1.0])
+    vad = SmoothedVAD(inner, onset_threshold=0.6, offset_threshold=0.4, alpha=0.3)
+
+    assert run(vad, 8) == [True] * 8
+
+
+def test_smoothed_vad_vote_majority():
+    """Test sliding-window vote uses the fraction of speech frames."""
+    inner = ScriptedVAD([0.0, 1.0, 1.0, 0.0, 0.0, 0.0, 0.0])
+    vad = SmoothedVAD(inner, onset_threshold=0.6, offset_threshold=0.5, smoothing="vote", window=3)
+
+    results = [vad.process(CHUNK) for _ in range(7)]
+
+    assert [r.confidence for r in results] == pytest.approx(
+        [0.0, 0.5, 2 / 3, 2 / 3, 1 / 3, 0.0, 0.0]
+    )
+    assert [r.is_speech for r in results] == [False, False, True, True, False, False, False]
+
+
+def test_smoothed_vad_reset_clears_state():
+    """Test reset clears smoothing state and resets the wrapped VAD."""
+    inner = ScriptedVAD([1.0, 0.0])
+    vad = SmoothedVAD(inner, alpha=0.5)
+
+    assert vad.process(CHUNK).is_speech is True
+    vad.reset()
+
+    assert inner.resets == 1
+    # Fresh state: first frame after reset isn't averaged with old speech
+    result = vad.process(CHUNK)
+    assert result.is_speech is False
+    assert result.confidence == 0.0
+
+
+def test_smoothed_vad_delegates_requirements():
+    """Test SmoothedVAD passes through the wrapped VAD's requirements."""
+    vad = SmoothedVAD(ScriptedVAD([]))
+
+    assert vad.required_sample_rate is None
+    assert vad.required_frame_duration_ms == 32
@@ -0,0 +1,138 @@
+"""Tests for spectral VAD implementation."""
+
+import numpy as np
+import pytest
+from hearken.vad.spectral import SpectralVAD
+from hearken.types import AudioChunk
+
+
+def make_chunk(samples: np.ndarray, sample_rate: int = 16000) -> AudioChunk:
+    """Wrap float samples as an int16 audio chunk."""
+    data = np.clip(samples, -32768, 32767).astype(np.int16).tobytes()
+    return AudioChunk(data=data, timestamp=0.0, sample_rate=sample_rate, sample_width=2)
+
+
+def create_speech_chunk(sample_rate: int = 16000, duration_ms: int = 30) -> AudioChunk:
+    """Create a harmonic, voiced-speech-like chunk (150 Hz fundamental)."""
+    t = np.arange(int(sample_rate * duration_ms / 1000)) / sample_rate
+    samples = sum(3000 / k * np.sin(2 * np.pi * 150 * k * t) for k in range(1, 20))
+    return make_chunk(samples, sample_rate)
+
+
+def create_noise_chunk(amplitude: float, sample_rate: int = 16000, duration_ms: int = 30):
+    """Create a chunk of white noise."""
+    num_samples = int(sample_rate * duration_ms / 1000)
+    return make_chunk(np.random.normal(0, amplitude, num_samples), sample_rate)
+
+
+def create_hum_chunk(sample_rate: int = 16000, duration_ms: int = 30) -> AudioChunk:
+    """Create loud low-frequency hum, like a fan or HVAC unit."""
+    t = np.arange(int(sample_rate * duration_ms / 1000)) / sample_rate
+    samples = 4000 * np.sin(2 * np.pi * 60 * t) + 2000 * np.sin(2 * np.pi * 120 * t)
+    return make_chunk(samples, sample_rate)
+
+
+def test_spectral_vad_creation_default():
+    """Test SpectralVAD initialization and default properties."""
+    vad = SpectralVAD()
+
+    assert vad.required_sample_rate is None
+    assert vad.required_frame_duration_ms is None
+
+
+def test_spectral_vad_invalid_threshold():
+    """Test SpectralVAD rejects threshold outside [0, 1]."""
+    with pytest.raises(ValueError, match="Threshold must be between 0.0 and 1.0"):
+        SpectralVAD(threshold=1.5)
+
+
+def test_spectral_vad_invalid_speech_band():
+    """Test SpectralVAD rejects inverted speech band."""
+    with pytest.raises(ValueError, match="Invalid speech band"):
+        SpectralVAD(speech_band=(3400.0, 300.0))
+
+
+def test_spectral_vad_detects_silence():
+    """Test SpectralVAD rejects quiet background noise."""
+    vad = SpectralVAD()
+
+    result = vad.process(create_noise_chunk(amplitude=50))
+
+    assert result.is_speech is False
+    assert result.confidence < 0.5
+
+
+def test_spectral_vad_detects_speech():
+    """Test SpectralVAD detects voiced speech after calibrating on silence."""
+    vad = SpectralVAD()
+    for _ in range(5):
+        vad.process(create_noise_chunk(amplitude=50))
+
+    result = vad.process(create_speech_chunk())
+
+    assert result.is_speech is True
+    assert result.confidence > 0.5
+
+
+def test_spectral_vad_rejects_hum():
+    """Test SpectralVAD rejects loud low-frequency hum."""
+    vad = SpectralVAD()
+    vad.process(create_noise_chunk(amplitude=50))
+
+    for _ in range(5):
+        assert vad.process(create_hum_chunk()).is_speech is False
+
+
+def test_spectral_vad_rejects_broadband_noise():
+    """Test SpectralVAD rejects loud white noise that fools EnergyVAD."""
+    vad = SpectralVAD()
+    vad.process(create_noise_chunk(amplitude=50))
+
+    for _ in range(5):
+        assert vad.process(create_noise_chunk(amplitude=3000)).is_speech is False
+
+
+def test_spectral_vad_noise_floor_adapts():
+    """Test noise floor rises on sustained non-speech and falls on quiet."""
+    vad = SpectralVAD()
+    vad.process(create_noise_chunk(amplitude=50))
+    initial_floor = vad._noise_floor
+
+    for _ in range(20):
+        vad.process(create_hum_chunk())
+    assert vad._noise_floor > initial_floor
+
+    vad.process(make_chunk(np.zeros(480)))
+    assert vad._noise_floor == pytest.approx(vad._min_noise_floor)
+
+
+def test_spectral_vad_process_batch_matches_process():
+    """Test batch processing returns one result per chunk, matching single calls."""
+    chunks = [create_noise_chunk(amplitude=50)] + [create_speech_chunk()] * 3
+
+    single = SpectralVAD()
+    expected = [single.process(c) for c in chunks[:1]]
+    batched = SpectralVAD()
+    batched.process_batch(chunks[:1])
+
+    expected += [single.process(c) for c in chunks[1:]]
+    results = batched.process_batch(chunks[1:])
+
+    assert len(results) == 3
+    for got, want in zip(results, expected[1:]):
+        assert got.is_speech == want.is_speech
+        assert got.confidence == pytest.approx(want.confidence)
+
+
+def test_spectral_vad_short_chunk():
+    """Test chunks shorter than one analysis frame are handled."""
+    vad = SpectralVAD(analysis_frame_ms=10)
+    result = vad.process(create_speech_chunk(duration_ms=5))
+
+    assert result is not None
+    assert 0.0 <= result.confidence <= 1.0
+
+
+def test_spectral_vad_empty_batch():
+    """Test empty batch returns no results."""
+    assert SpectralVAD().process_batch([]) == []
@@ -1,7 +1,9 @@
 """Tests for WebRTC VAD implementation."""
+import logging
 import numpy as np
 import time
 import pytest
+from unittest.mock import patch
 from hearken.vad.webrtc import WebRTCVAD
 from hearken.types import AudioChunk
 
@@ -86,12 +88,32 @@ def test_webrtc_vad_supported_frame_durations():
 
 
 def test_webrtc_vad_unsupported_frame_duration():
-    """Test WebRTC VAD rejects unsupported frame duration."""
+    """Test WebRTC VAD rejects unsupported sub-frame duration."""
+    with pytest.raises(ValueError, match="WebRTC VAD requires frame duration"):
+        WebRTCVAD(frame_duration_ms=25)  # Not 10/20/30
+
+
+def test_webrtc_vad_invalid_vote():
+    """Test WebRTC VAD rejects unknown voting strategy."""
+    with pytest.raises(ValueError, match="Vote must be one of"):
+        WebRTCVAD(vote="plurality")
+
+
+def test_webrtc_vad_invalid_speech_ratio():
+    """Test WebRTC VAD rejects speech ratio outside (0, 1]."""
+    with pytest.raises(ValueError, match="Speech ratio must be"):
+        WebRTCVAD(speech_ratio=0.0)
+
+
+def test_webrtc_vad_arbitrary_chunk_duration():
+    """Test WebRTC VAD accepts chunks that aren't 10/20/30 ms."""
     vad = WebRTCVAD()
-    chunk = create_test_chunk(sample_rate=16000, duration_ms=25)  # Not 10/20/30
+    chunk = create_test_chunk(sample_rate=16000, duration_ms=25)
 
-    with pytest.raises(ValueError, match="WebRTC VAD requires frame duration"):
-        vad.process(chunk)
+    result = vad.process(chunk)  # Should not raise
+    assert result is not None
+    # 25ms chunk -> one 20ms sub-frame, 5ms carried over
+    assert len(vad._pending) == 80 * 2
 
 
 def create_silence_chunk(sample_rate: int = 16000, duration_ms: int = 30) -> AudioChunk:
@@ -179,20 +201,138 @@ def test_webrtc_vad_reset():
     assert result1.confidence == result2.confidence
 
 
-def test_webrtc_vad_reset_clears_validation_state():
-    """Test reset allows revalidation with different sample rates."""
+def test_webrtc_vad_reset_keeps_validation_state():
+    """Test reset keeps the validated stream format."""
     vad = WebRTCVAD()
 
-    # Process with 16kHz
-    chunk1 = create_speech_chunk(sample_rate=16000)
-    vad.process(chunk1)
+    vad.process(create_speech_chunk(sample_rate=16000))
+    frame_bytes = vad._frame_bytes
+
+    vad.reset()
+
+    assert vad._validated is True
+    assert vad._sample_rate == 16000
+    assert vad._frame_bytes == frame_bytes
 
-    # Reset should clear validation state
+
+def test_webrtc_vad_revalidates_on_sample_rate_change():
+    """Test a new sample rate after reset is revalidated."""
+    vad = WebRTCVAD()
+
+    vad.process(create_speech_chunk(sample_rate=16000))
     vad.reset()
 
-    # Should be able to process with different sample rate
-    # Note: In practice, same VAD instance should use same sample rate,
-    # but reset should clear the validation flag
-    chunk2 = create_speech_chunk(sample_rate=8000)
-    result = vad.process(chunk2)
+    result = vad.process(create_speech_chunk(sample_rate=8000))
     assert result is not None
+    assert vad._sample_rate == 8000
+
+    with pytest.raises(ValueError, match="WebRTC VAD requires sample rate"):
+        vad.process(create_speech_chunk(sample_rate=44100))
+
+
+def test_webrtc_vad_reset_keeps_stream_format():
+    """Test reset clears detection state without re-validating the format."""
+    vad = WebRTCVAD(frame_duration_ms=30)
+    vad.process(create_speech_chunk(duration_ms=40))
+    frame_bytes = vad._frame_bytes
+    instance = vad._vad
+
+    vad.reset()
+
+    assert vad._validated
+    assert vad._frame_bytes == frame_bytes
+    assert vad._pending == b""
+    assert vad._vad is not instance
+    assert vad.process(create_speech_chunk()).is_speech is True
+
+
+class CountingVad:
+    """Stand-in for webrtcvad.Vad that counts the work done on it."""
+
+    created = 0
+    frames = 0
+
+    def __init__(self, mode: int):
+        CountingVad.created += 1
+
+    def is_speech(self, frame, sample_rate: int) -> bool:
+        CountingVad.frames += 1
+        return True
+
+
+def test_webrtc_vad_reset_per_frame_work_flat(caplog):
+    """Test resetting after every frame adds no per-frame work or re-validation."""
+    frames = 200
+    chunk = create_speech_chunk(duration_ms=60)  # Two 30ms sub-frames
+
+    def per_frame_work(reset: bool) -> tuple[int, int, int]:
+        CountingVad.created = CountingVad.frames = 0
+        caplog.clear()
+        with patch("hearken.vad.webrtc.webrtcvad.Vad", CountingVad):
+            vad = WebRTCVAD(frame_duration_ms=30)
+            for _ in range(frames):
+                vad.process(chunk)
+                if reset:
+                    vad.reset()
+        validations = sum("sub-frames" in r.getMessage() for r in caplog.records)
+        return CountingVad.frames, validations, CountingVad.created
+
+    with caplog.at_level(logging.DEBUG, logger="hearken"):
+        baseline = per_frame_work(reset=False)
+        with_resets = per_frame_work(reset=True)
+
+    # Same sub-frames through the VAD, and the format is validated only once
+    assert with_resets[:2] == baseline[:2] == (2 * frames, 1)
+    # Each reset only builds a new (cheap) WebRTC handle
+    assert with_resets[2] == frames + 1
+
+
+def test_webrtc_vad_carries_leftover_samples():
+    """Test leftover samples complete a sub-frame on the next call."""
+    vad = WebRTCVAD(frame_duration_ms=30)
+
+    # 20ms alone can't fill a 30ms sub-frame
+    result = vad.process(create_speech_chunk(duration_ms=20))
+    assert result.is_speech is False
+    assert len(vad._pending) == 320 * 2
+
+    # Another 20ms completes one sub-frame and leaves 10ms
+    result = vad.process(create_speech_chunk(duration_ms=20))
+    assert result.is_speech is True
+    assert len(vad._pending) == 160 * 2
+
+
+def test_webrtc_vad_subframe_confidence():
+    """Test confidence is the fraction of speech sub-frames."""
+    vad = WebRTCVAD(frame_duration_ms=10)
+    speech = create_speech_chunk(duration_ms=20).data
+    silence = create_silence_chunk(duration_ms=20).data
+    chunk = AudioChunk(
+        data=silence + speech,
+        timestamp=time.monotonic(),
+        sample_rate=16000,
+        sample_width=2,
+    )
+
+    result = vad.process(chunk)
+
+    assert result.confidence == pytest.approx(0.5)
+    assert result.is_speech is True  # majority vote counts ties as speech
+
+
+def test_webrtc_vad_voting_strategies():
+    """Test any/all votes and speech ratio over mixed sub-frames."""
+    speech = create_speech_chunk(duration_ms=10).data
+    silence = create_silence_chunk(duration_ms=30).data
+    data = silence + speech  # 1 of 4 sub-frames is speech
+
+    def run(**kwargs):
+        vad = WebRTCVAD(frame_duration_ms=10, **kwargs)
+        chunk = AudioChunk(data=data, timestamp=0.0, sample_rate=16000, sample_width=2)
+        return vad.process(chunk)
+
+    assert run(vote="any").is_speech is True
+    assert run(vote="majority").is_speech is False
+    assert run(vote="all").is_speech is False
+    assert run(speech_ratio=0.25).is_speech is True
+    assert run(speech_ratio=0.5).is_speech is False
@@ -0,0 +1,290 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from hearken import Listener
+from hearken.interfaces import AudioSource, VAD
+from hearken.types import AudioChunk, VADResult, VADSwitch, WatchdogConfig
+from hearken.vad.energy import EnergyVAD
+from hearken.watchdog import RealtimeWatchdog
+
+
+class NamedVAD(VAD):
+    """VAD that never detects speech, optionally slowly."""
+
+    def __init__(self, delay: float = 0.0, frame_ms=None, rate=None):
+        self.delay = delay
+        self.frame_ms = frame_ms
+        self.rate = rate
+        self.frames = 0
+        self.resets = 0
+
+    def process(self, chunk: AudioChunk) -> VADResult:
+        self.frames += 1
+        if self.delay:
+            time.sleep(self.delay)
+        return VADResult(is_speech=False, confidence=0.0)
+
+    def reset(self) -> None:
+        self.resets += 1
+
+    @property
+    def required_frame_duration_ms(self):
+        return self.frame_ms
+
+    @property
+    def required_sample_rate(self):
+        return self.rate
+
+
+class SlowVAD(NamedVAD):
+    pass
+
+
+class FastVAD(NamedVAD):
+    pass
+
+
+CONFIG = WatchdogConfig(min_dwell=1.0, recover_after=2.0, smoothing=0.5)
+
+
+def feed(watchdog, rtf, fill, start, seconds, step=0.1):
+    """Observe frames of `step` seconds at a constant cost; returns switches."""
+    switches = []
+    for i in range(int(round(seconds / step))):
+        vad = watchdog.observe(rtf * step, step, fill, now=start + i * step)
+        if vad is not None:
+            switches.append(vad)
+    return switches
+
+
+def test_watchdog_degrades_on_realtime_factor():
+    """Test sustained high cost steps down the ladder, one level per dwell."""
+    events = []
+    vads = [SlowVAD(), FastVAD(), NamedVAD()]
+    watchdog = RealtimeWatchdog(vads, CONFIG, on_switch=events.append)
+
+    # Nothing switches during the initial dwell
+    assert feed(watchdog, 1.5, 0.0, start=0.0, seconds=0.9) == []
+
+    assert feed(watchdog, 1.5, 0.0, start=1.0, seconds=0.9) == [vads[1]]
+    assert watchdog.vad is vads[1]
+    assert feed(watchdog, 1.5, 0.0, start=1.9, seconds=0.2) == [vads[2]]
+
+    # Already at the cheapest VAD
+    assert feed(watchdog, 1.5, 0.0, start=4.0, seconds=3.0) == []
+
+    assert [(e.from_vad, e.to_vad, e.level, e.reason) for e in events] == [
+        ("SlowVAD", "FastVAD", 1, "overload"),
+        ("FastVAD", "NamedVAD", 2, "overload"),
+    ]
+    assert events[0].realtime_factor > CONFIG.degrade_rtf
+
+
+def test_watchdog_degrades_on_filling_queue():
+    """Test a queue that is half full and still filling triggers a switch."""
+    watchdog = RealtimeWatchdog([SlowVAD(), FastVAD()], CONFIG)
+
+    # Cheap frames, but the queue keeps growing
+    switched = None
+    for i in range(30):
+        vad = watchdog.observe(0.01, 0.1, min(0.3 + i * 0.05, 1.0), now=i * 0.1)
+        switched = switched or vad
+    assert isinstance(switched, FastVAD)
+
+    # Full but draining is not overload
+    watchdog = RealtimeWatchdog([SlowVAD(), FastVAD()], CONFIG)
+    for i in range(30):
+        assert watchdog.observe(0.01, 0.1, 1.0 - i * 0.01, now=i * 0.1) is None
+
+
+def test_watchdog_recovers_after_sustained_headroom():
+    """Test the watchdog steps back up once headroom lasts recover_after."""
+    events = []
+    vads = [SlowVAD(), FastVAD()]
+    watchdog = RealtimeWatchdog(vads, CONFIG, on_switch=events.append)
+    feed(watchdog, 1.5, 0.0, start=0.0, seconds=1.5)
+    assert watchdog.level == 1
+
+    # Headroom, interrupted by a busy moment that restarts the timer
+    assert feed(watchdog, 0.1, 0.0, start=1.5, seconds=1.5) == []
+    assert feed(watchdog, 0.1, 0.5, start=3.0, seconds=0.1) == []
+    assert feed(watchdog, 0.1, 0.0, start=3.1, seconds=1.8) == []
+    assert feed(watchdog, 0.1, 0.0, start=4.9, seconds=0.5) == [vads[0]]
+
+    assert events[-1].reason == "recovered"
+    assert watchdog.switches == 2
+
+
+def test_watchdog_backs_off_flapping_recovery():
+    """Test recoveries that overload again wait longer, until one holds."""
+    watchdog = RealtimeWatchdog([SlowVAD(), FastVAD()], CONFIG)
+
+    def run(primary_rtf, start, seconds, step=0.1):
+        levels = []
+        for i in range(int(round(seconds / step))):
+            rtf = primary_rtf if watchdog.level == 0 else 0.1
+            watchdog.observe(rtf * step, step, 0.0, now=start + i * step)
+            levels.append(watchdog.level)
+        return levels
+
+    # The primary can't keep up: every recovery overloads again
+    run(1.5, start=0.0, seconds=60.0)
+    assert watchdog.recover_after == 32.0
+    assert watchdog.switches <= 10
+
+    # Load drops: the next recovery holds and the wait resets
+    levels = run(0.1, start=60.0, seconds=60.0)
+    assert levels[-1] == 0
+    assert watchdog.recover_after == CONFIG.recover_after
+
+
+def test_watchdog_validation():
+    """Test the ladder and thresholds are validated."""
+    with pytest.raises(ValueError, match="at least one fallback"):
+        RealtimeWatchdog([SlowVAD()])
+
+    with pytest.raises(ValueError, match="recover_rtf"):
+        RealtimeWatchdog([SlowVAD(), FastVAD()], WatchdogConfig(recover_rtf=0.9))
+
+    with pytest.raises(ValueError, match="recover_fill"):
+        RealtimeWatchdog([SlowVAD(), FastVAD()], WatchdogConfig(recover_fill=0.5))
+
+    with pytest.raises(ValueError, match="max_recover_after"):
+        RealtimeWatchdog([SlowVAD(), FastVAD()], WatchdogConfig(max_recover_after=1.0))
+
+
+def test_listener_rejects_incompatible_fallback():
+    """Test fallbacks must accept the primary VAD's frame size and the sample rate."""
+
+    class Source(AudioSource):
+        closed = False
+
+        def open(self):
+            pass
+
+        def close(self):
+            self.closed = True
+
+        def read(self, num_samples):
+            return b""
+
+        @property
+        def sample_rate(self):
+            return 16000
+
+        @property
+        def sample_width(self):
+            return 2
+
+    with pytest.raises(ValueError, match="requires 32ms frames"):
+        Listener(source=Source(), vad=EnergyVAD(), fallback_vads=[NamedVAD(frame_ms=32)])
+
+    source = Source()
+    listener = Listener(source=source, vad=EnergyVAD(), fallback_vads=[NamedVAD(rate=8000)])
+    with pytest.raises(ValueError, match="requires 8000 Hz audio"):
+        listener.start()
+    assert source.closed
+
+
+def test_listener_switches_to_fallback_under_load():
+    """Test a VAD slower than real time is replaced while listening."""
+
+    class RealtimeSource(AudioSource):
+        def open(self):
+            self._next = time.monotonic()
+
+        def close(self):
+            pass
+
+        def read(self, num_samples):
+            self._next += num_samples / 16000
+            time.sleep(max(0.0, self._next - time.monotonic()))
+            return np.zeros(num_samples, dtype=np.int16).tobytes()
+
+        @property
+        def sample_rate(self):
+            return 16000
+
+        @property
+        def sample_width(self):
+            return 2
+
+    switched = threading.Event()
+    events: list[VADSwitch] = []
+
+    def on_vad_switch(event):
+        events.append(event)
+        switched.set()
+
+    slow, fast = SlowVAD(delay=0.04), FastVAD()  # 40ms per 30ms frame
+    listener = Listener(
+        source=RealtimeSource(),
+        vad=slow,
+        fallback_vads=[fast],
+        watchdog_config=WatchdogConfig(min_dwell=0.3, recover_after=60.0),
+        on_vad_switch=on_vad_switch,
+    )
+    listener.start()
+    try:
+        assert switched.wait(timeout=3.0)
+        time.sleep(0.2)
+    finally:
+        listener.stop()
+
+    assert [(e.from_vad, e.to_vad, e.reason) for e in events] == [
+        ("SlowVAD", "FastVAD", "overload")
+    ]
+    assert fast.frames > 0
+    assert fast.resets >= 1
+
+
+def test_listener_fallback_mid_utterance_keeps_detecting_speech(tmp_path):
+    """Test an EnergyVAD switched in during speech calibrates on the earlier noise."""
+    from hearken.sources.file import FileAudioSource
+    from hearken.types import DetectorConfig
+
+    class SlowLevelVAD(NamedVAD):
+        def process(self, chunk):
+            time.sleep(0.04)  # 40ms per 30ms frame
+            samples = np.frombuffer(chunk.data, dtype=np.int16).astype(np.float32)
+            return VADResult(is_speech=bool(np.sqrt(np.mean(samples**2)) > 1000), confidence=1.0)
+
+    # 0.15s of quiet noise, then 3s of speech-level noise and 0.6s of quiet
+    rng = np.random.default_rng(0)
+    audio = np.concatenate(
+        [
+            rng.uniform(-100, 100, 2400),
+            rng.uniform(-5000, 5000, 48000),
+            rng.uniform(-100, 100, 9600),
+        ]
+    )
+    path = tmp_path / "speech.pcm"
+    path.write_bytes(audio.astype(np.int16).tobytes())
+
+    events: list[VADSwitch] = []
+    segments = []
+    listener = Listener(
+        source=FileAudioSource(str(path), sample_rate=16000, speed=None),
+        vad=SlowLevelVAD(),
+        fallback_vads=[EnergyVAD()],
+        # The first switch is allowed only after 0.5s, well into the speech
+        watchdog_config=WatchdogConfig(min_dwell=0.5, recover_after=60.0),
+        detector_config=DetectorConfig(
+            min_speech_duration=0.09, silence_timeout=0.3, sample_clock=True
+        ),
+        on_speech=segments.append,
+        on_vad_switch=events.append,
+    )
+    listener.start()
+    try:
+        assert listener.wait_for_end(timeout=10.0)
+    finally:
+        listener.stop()
+
+    assert [e.to_vad for e in events] == ["EnergyVAD"]
+    # Calibrated on speech, the fallback would have ended the utterance early
+    assert len(segments) == 1
+    assert segments[0].duration == pytest.approx(3.3, abs=0.1)